@@ -1,115 +1,274 @@
+import os
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox, simpledialog
+
+import netlist
+from netlist import NetlistError, CycleError
+from simulator import Simulator
+from timing import TimingSimulator
+from waveform import WaveformRecorder
+from worker import SimulationWorker
+from spatial import SpatialGrid
+import storage
+import importers
+import subcircuit
+from faultsim import FaultSimulator, all_faults, random_patterns, read_vectors
+from bdd import SymbolicSimulator, symbolic_counterexample
+from profiler import Profiler
+
+# Çizimler ekran karesi başına en fazla bir kez yapılır (yaklaşık 60 Hz)
+FRAME_INTERVAL = 16
+SELECTION_TAG = "selected"
+# Bu yakınlaştırmanın altında ya da görünür bileşen sayısı sınırı aşınca sade gösterime geçilir
+LOD_ZOOM = 0.5
+MAX_DETAILED_VIEWS = 2000
+LOD_COLORS = {False: "gray", True: "green"}
+ZOOM_STEP = 1.25
+# Profil katmanı bu aralıkla yenilenir ve en sıcak bu kadar kapı vurgulanır
+OVERLAY_INTERVAL = 500
+OVERLAY_TAG = "profiler"
+HOTTEST_GATES = 5
+# Döngülü devrelerde gecikmeli simülasyonun her karede ilerlediği zaman birimi
+TIMING_STEPS_PER_FRAME = 1
+# Hata simülasyonu raporunda listelenen algılanmamış hata sayısı ve varsayılan rastgele vektör sayısı
+REPORTED_FAULTS = 10
+DEFAULT_RANDOM_VECTORS = 1024
+# Sembolik analizde çıkış başına gösterilen giriş kübü sayısı
+REPORTED_CUBES = 8
+# Bu kadar ya da daha çok düğümlü devreler simülasyon sürerken arka plan iş parçacığında değerlendirilir
+WORKER_MIN_NODES = 2000
+
+class Renderer:
+    def __init__(self, root):
+        self.root = root
+        self.dirty = {}
+        self.frame_pending = False
+        self.profiler = None
+
+    # Son kareden beri değeri ya da konumu değişen bağlantı ve bileşenleri kaydeder
+    def mark(self, item):
+        self.dirty[item] = None
+        if not self.frame_pending:
+            self.frame_pending = True
+            self.root.after(FRAME_INTERVAL, self.flush)
+
+    def flush(self):
+        self.frame_pending = False
+        dirty = self.dirty
+        self.dirty = {}
+        if self.profiler is None:
+            for item in dirty:
+                item.redraw()
+            return
+        with self.profiler.section("canvas_flush"):
+            for item in dirty:
+                if isinstance(item, Lamp):
+                    with self.profiler.section("lamp_update"):
+                        item.redraw()
+                else:
+                    item.redraw()
+
+class Viewport:
+    # Model (dünya) koordinatları ile tuval (ekran) koordinatları arasındaki dönüşüm
+    def __init__(self, width=800, height=600):
+        self.zoom = 1.0
+        self.origin_x = 0
+        self.origin_y = 0
+        self.width = width
+        self.height = height
+
+    def to_screen(self, x, y):
+        return ((x - self.origin_x) * self.zoom, (y - self.origin_y) * self.zoom)
+
+    def to_world(self, x, y):
+        return (x / self.zoom + self.origin_x, y / self.zoom + self.origin_y)
+
+    def screen_box(self, x0, y0, x1, y1):
+        return self.to_screen(x0, y0) + self.to_screen(x1, y1)
+
+    def world_box(self):
+        return self.to_world(0, 0) + self.to_world(self.width, self.height)
 
 class Connection:
-    def __init__(self, canvas, start_gate, end_gate):
+    def __init__(self, canvas, start_gate, end_gate, viewport=None):
         self.canvas = canvas
         self.start_gate = start_gate
         self.end_gate = end_gate
-        self.line = self.canvas.create_line(self.get_coords(), fill="blue")
+        self.viewport = viewport or Viewport()
+        self.line = None
 
+    # Uç noktalar Tk'ya sorulmadan modeldeki konumlardan hesaplanır
     def get_coords(self):
-        start_coords = self.canvas.coords(self.start_gate.connection_point)
-        end_coords = self.canvas.coords(self.end_gate.connection_point)
-        return (start_coords[0] + 5, start_coords[1] + 5, end_coords[0] + 5, end_coords[1] + 5)
-
-    def update_position(self):
+        start_x, start_y = self.start_gate.anchor()
+        end_x, end_y = self.end_gate.anchor()
+        return (start_x, start_y, end_x, end_y)
+
+    # Çizgi yalnızca uçlarından biri görünür alanda ayrıntılı çizildiğinde oluşturulur
+    def materialize(self):
+        if self.line is None:
+            self.drawn_coords = self.get_coords()
+            self.drawn_color = "green" if self.start_gate.output else "blue"
+            self.line = self.canvas.create_line(self.viewport.screen_box(*self.drawn_coords), fill=self.drawn_color)
+
+    def dematerialize(self):
+        if self.line is not None:
+            self.canvas.delete(self.line)
+            self.line = None
+
+    def redraw(self):
+        # Yalnızca konumu ya da rengi gerçekten değişen çizgi için Tk çağrısı yapılır
+        if self.line is None:
+            return
+        coords = self.get_coords()
         color = "green" if self.start_gate.output else "blue"
-        self.canvas.coords(self.line, self.get_coords())
-        self.canvas.itemconfig(self.line, fill=color)
-
-class Gate:
-    def __init__(self, canvas, x, y, label):
-        self.inputs = []
-        self.output = False
-        self.label = label
+        if coords != self.drawn_coords:
+            self.canvas.coords(self.line, self.viewport.screen_box(*coords))
+            self.drawn_coords = coords
+        if color != self.drawn_color:
+            self.canvas.itemconfig(self.line, fill=color)
+            self.drawn_color = color
+
+# Tuvaldeki bileşenler yalnızca modeldeki bir düğümün görünümüdür; mantık netlist modülündedir.
+# Tuval öğeleri yalnızca bileşen görünür alana girdiğinde oluşturulur (materialize).
+class Component:
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        self.node = node
         self.canvas = canvas
-        self.text = self.canvas.create_text(x, y, text=label, anchor="w")
-        self.x = x
-        self.y = y
-        self.connection_point = self.canvas.create_oval(x + 30, y - 5, x + 40, y + 5, fill="black")
+        self.renderer = renderer
+        self.viewport = viewport or Viewport()
         self.connections = []
-        self.canvas.tag_bind(self.text, "<ButtonPress-1>", self.handle_press)
-        self.canvas.tag_bind(self.text, "<B1-Motion>", self.handle_motion)
-        self.canvas.tag_bind(self.text, "<ButtonRelease-1>", self.handle_release)
+        self.lod_item = None
+        self.drawn_state = None
 
-    def add_input(self, input_gate):
-        self.inputs.append(input_gate)
-        connection = Connection(self.canvas, input_gate, self)
-        self.connections.append(connection)
-        input_gate.connections.append(connection)
+    @property
+    def output(self):
+        return self.node.value
 
-    def evaluate(self):
-        self.update_connections()
+    @property
+    def x(self):
+        return self.node.x
+
+    @property
+    def y(self):
+        return self.node.y
+
+    @property
+    def materialized(self):
+        return bool(self.items())
+
+    @property
+    def detailed(self):
+        return self.lod_item is None and self.materialized
 
-    def update_connections(self):
+    def add_input(self, input_gate):
+        # Bağlantı devrede bir döngü bırakırsa True döner; simülasyon kipini uygulama seçer
+        netlist = self.node.netlist
+        try:
+            netlist.connect(input_gate.node, self.node)
+        except NetlistError as error:
+            messagebox.showerror("Hata", str(error))
+            return False
+        netlist.levelize()
+        return bool(netlist.cycle_nodes)
+
+    def materialize(self, detailed=True):
+        if detailed:
+            # Yeni öğeler varsayılan (0) durumla çizilir, gerekiyorsa redraw günceller
+            self.create_items()
+            self.drawn_state = False
+        else:
+            # Uzaktan bakıldığında yalnızca değere göre boyanan tek bir şekil çizilir
+            self.drawn_state = self.node.value
+            self.lod_item = self.create_lod_item(LOD_COLORS[self.drawn_state])
+        self.redraw()
+
+    def dematerialize(self):
+        for item in self.items():
+            self.canvas.delete(item)
+        self.lod_item = None
+        self.delete_items()
+
+    def items(self):
+        if self.lod_item is not None:
+            return [self.lod_item]
+        return self.detail_items()
+
+    def schedule_redraw(self, item):
+        if self.renderer is None:
+            item.redraw()
+        else:
+            self.renderer.mark(item)
+
+    # Modeldeki değer değiştiğinde çağrılır; bileşen ve çıkan bağlantılar bir sonraki karede çizilir
+    def refresh(self):
+        self.schedule_redraw(self)
         for connection in self.connections:
-            connection.update_position()
+            if connection.start_gate is self:
+                self.schedule_redraw(connection)
+
+    def redraw(self):
+        if not self.materialized or self.node.value == self.drawn_state:
+            return
+        self.drawn_state = self.node.value
+        if self.lod_item is not None:
+            self.canvas.itemconfig(self.lod_item, fill=LOD_COLORS[self.drawn_state])
+        else:
+            self.draw_state()
+
+    def draw_state(self):
+        pass
 
     def move(self, delta_x, delta_y):
-        self.x += delta_x
-        self.y += delta_y
-        self.canvas.move(self.text, delta_x, delta_y)
-        self.canvas.move(self.connection_point, delta_x, delta_y)
+        self.node.netlist.move_node(self.node, delta_x, delta_y)
+        for item in self.items():
+            self.canvas.move(item, delta_x * self.viewport.zoom, delta_y * self.viewport.zoom)
         for connection in self.connections:
-            connection.update_position()
-
-    def handle_press(self, event):
-        self.start_x = event.x
-        self.start_y = event.y
+            self.schedule_redraw(connection)
 
-    def handle_motion(self, event):
-        delta_x = event.x - self.start_x
-        delta_y = event.y - self.start_y
-        self.move(delta_x, delta_y)
-        self.start_x = event.x
-        self.start_y = event.y
+class Gate(Component):
+    def __init__(self, canvas, node, label, renderer=None, viewport=None):
+        super().__init__(canvas, node, renderer, viewport)
+        self.label = label
+        self.text = None
+        self.connection_point = None
 
-    def handle_release(self, event):
-        pass
+    def anchor(self):
+        return (self.node.x + 35, self.node.y)
 
-class OutputGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "Çıkış")
-        self.input = None
+    # Uzamsal indekse kaydedilen bağlantı noktası ve gövde kutuları
+    def connection_box(self):
+        x, y = self.node.x, self.node.y
+        return (x + 30, y - 5, x + 40, y + 5)
 
-    def set_input(self, value, input_gate=None):
-        self.input = input_gate
+    def body_box(self):
+        x, y = self.node.x, self.node.y
+        return (x, y - 8, x + 30, y + 8)
 
-    def evaluate(self):
-        if self.input is None:
-            return False
-        return self.input.output
+    def create_items(self):
+        x, y = self.viewport.to_screen(self.node.x, self.node.y)
+        self.text = self.canvas.create_text(x, y, text=self.label, anchor="w")
+        self.connection_point = self.canvas.create_oval(self.viewport.screen_box(*self.connection_box()), fill="black")
 
-    def move(self, delta_x, delta_y):
-        super().move(delta_x, delta_y)
+    def create_lod_item(self, color):
+        return self.canvas.create_rectangle(self.viewport.screen_box(*self.body_box()), fill=color, outline="")
 
-    def add_input(self, input_gate):
-        self.inputs.append(input_gate)
-        connection = Connection(self.canvas, input_gate, self)
-        self.connections.append(connection)
-        input_gate.connections.append(connection)
+    # Çoklu seçimde grup etiketiyle birlikte taşınan tuval öğeleri
+    def detail_items(self):
+        if self.text is None:
+            return []
+        return [self.text, self.connection_point]
 
-    def is_connected_to_output_gate(self):
-        for input_gate in self.inputs:
-            if isinstance(input_gate, OutputGate):
-                return True
-        return False
+    def delete_items(self):
+        self.text = None
+        self.connection_point = None
 
-    def update_state(self):
-        if self.inputs:
-            self.state = any(input_gate.output for input_gate in self.inputs)
-        else:
-            self.state = False
-        self.update_text()
-        if self.state:
-            self.canvas.itemconfig(self.body, fill="green")
-        else:
-            self.canvas.itemconfig(self.body, fill="red")
+class OutputGate(Gate):
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "Çıkış", renderer, viewport)
 
-    def toggle_state(self):
-        self.state = not self.state
-        self.update_text()
+    @property
+    def state(self):
+        return self.node.value
 
     def update_text(self):
         if self.state:
@@ -117,194 +276,141 @@ class OutputGate(Gate):
         else:
             self.canvas.itemconfig(self.text, text="0", fill="red")
 
-    def evaluate(self):
-        if len(self.inputs) > 0 and isinstance(self.inputs[0], OutputGate):
-            self.state = self.inputs[0].evaluate()
-        else:
-            if self.inputs:
-                self.state = any(input_gate.output for input_gate in self.inputs)
-            else:
-                self.state = False
+    def draw_state(self):
         self.update_text()
-        self.update_connections()
 
 class NandGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "NAND")
-
-    def evaluate(self):
-        if self.inputs:
-            self.output = not all(input_gate.output for input_gate in self.inputs)
-        else:
-            self.output = False
-        super().evaluate()
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "NAND", renderer, viewport)
 
 class NorGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "NOR")
-
-    def evaluate(self):
-        if self.inputs:
-            self.output = not any(input_gate.output for input_gate in self.inputs)
-        else:
-            self.output = False
-        super().evaluate()
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "NOR", renderer, viewport)
 
 class XorGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "XOR")
-
-    def evaluate(self):
-        if len(self.inputs) == 2:
-            input1, input2 = self.inputs
-            self.output = input1.output != input2.output
-        else:
-            self.output = False
-        super().evaluate()
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "XOR", renderer, viewport)
 
 class AndGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "AND")
-
-    def evaluate(self):
-        if self.inputs:
-            self.output = all(input_gate.output for input_gate in self.inputs)
-        else:
-            self.output = False
-        super().evaluate()
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "AND", renderer, viewport)
 
 class XnorGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "XNOR")
-
-    def evaluate(self):
-        if self.inputs:
-            input_values = [input_gate.output for input_gate in self.inputs]
-            if all(input_values) or not any(input_values):
-                self.output = True
-            else:
-                self.output = False
-        else:
-            self.output = False
-        super().evaluate()
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "XNOR", renderer, viewport)
 
 class NotGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "NOT")
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "NOT", renderer, viewport)
 
-    def evaluate(self):
-        if len(self.inputs) > 1:
-            messagebox.showerror("Hata", "Not kapısı için birden fazla giriş bulunmaktadır.")
-            self.canvas.master.quit()
-            return
-        if self.inputs:
-            input_gate = self.inputs[0]
-            self.output = not input_gate.output
-        else:
-            self.output = False
-        super().evaluate()
+    def add_input(self, input_gate):
+        if len(self.node.inputs) < 1:
+            return super().add_input(input_gate)
+        messagebox.showerror("Hata", "Not kapısı için birden fazla giriş bulunmaktadır.")
+        self.canvas.master.quit()
+        return False
 
 class BufferGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "Buffer")
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "Buffer", renderer, viewport)
 
     def add_input(self, input_gate):
-        if len(self.inputs) < 1:
-            super().add_input(input_gate)
-        else:
-            messagebox.showerror("Hata", "Buffer kapısının yalnızca bir girişi olabilir!")
-            self.canvas.master.quit()
-
-    def evaluate(self):
-        if self.inputs:
-            self.output = self.inputs[0].output
-        else:
-            self.output = False
-        super().evaluate()
+        if len(self.node.inputs) < 1:
+            return super().add_input(input_gate)
+        messagebox.showerror("Hata", "Buffer kapısının yalnızca bir girişi olabilir!")
+        self.canvas.master.quit()
+        return False
 
 class OrGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "OR")
-
-    def evaluate(self):
-        if self.inputs:
-            self.output = any(input_gate.output for input_gate in self.inputs)
-        else:
-            self.output = False
-        super().evaluate()
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "OR", renderer, viewport)
 
 class InputGate(Gate):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, "Giriş")
-        self.state = False
-        self.output = self.state
-        self.button = tk.Button(canvas.master, text="0", command=self.toggle_state)
-        self.button_window = self.canvas.create_window(x + 53, y, window=self.button)
-        self.canvas.tag_bind(self.button_window, "<ButtonPress-1>", self.handle_press)
-        self.canvas.tag_bind(self.button_window, "<B1-Motion>", self.handle_motion)
-        self.canvas.tag_bind(self.button_window, "<ButtonRelease-1>", self.handle_release)
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, "Giriş", renderer, viewport)
+        self.button = None
+        self.button_window = None
+
+    @property
+    def state(self):
+        return self.node.value
 
     def toggle_state(self):
-        self.state = not self.state
-        self.output = self.state
+        self.node.netlist.set_input(self.node, not self.state)
+
+    def create_items(self):
+        super().create_items()
+        x, y = self.viewport.to_screen(self.node.x + 53, self.node.y)
+        self.button = tk.Button(self.canvas.master, text="0", command=self.toggle_state)
+        self.button_window = self.canvas.create_window(x, y, window=self.button)
+
+    def detail_items(self):
+        if self.button_window is None:
+            return super().detail_items()
+        return super().detail_items() + [self.button_window]
+
+    def delete_items(self):
+        super().delete_items()
+        if self.button is not None:
+            self.button.destroy()
+        self.button = None
+        self.button_window = None
+
+    def draw_state(self):
         self.button.config(text="1" if self.state else "0")
-        for connection in self.connections:
-            connection.update_position()
 
-    def move(self, delta_x, delta_y):
-        super().move(delta_x, delta_y)
-        self.canvas.move(self.button_window, delta_x, delta_y)
+class Lamp(Component):
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        super().__init__(canvas, node, renderer, viewport)
+        self.body = None
+        self.text = None
+        self.connection_point = None
 
-    def handle_press(self, event):
-        self.start_x = event.x
-        self.start_y = event.y
+    @property
+    def state(self):
+        return self.node.value
 
-    def handle_motion(self, event):
-        delta_x = event.x - self.start_x
-        delta_y = event.y - self.start_y
-        self.move(delta_x, delta_y)
-        self.start_x = event.x
-        self.start_y = event.y
+    @property
+    def output(self):
+        return False
 
-    def handle_release(self, event):
-        pass
+    def anchor(self):
+        return (self.node.x - 12, self.node.y + 20)
 
-    def evaluate(self):
-        self.output = self.state
-
-class Lamp:
-    def __init__(self, canvas, x, y):
-        self.inputs = []
-        self.state = False
-        self.x = x
-        self.y = y
-        self.canvas = canvas
-        self.body = self.canvas.create_oval(x, y, x + 40, y + 40, fill="red")
-        self.text = self.canvas.create_text(x + 20, y + 50, text="Kapalı")
-        self.connection_point = self.canvas.create_oval(x - 17, y + 15, x - 3, y + 30, fill="black")
-        self.connections = []
-        self.canvas.tag_bind(self.body, "<ButtonPress-1>", self.handle_press)
-        self.canvas.tag_bind(self.body, "<B1-Motion>", self.handle_motion)
-        self.canvas.tag_bind(self.body, "<ButtonRelease-1>", self.handle_release)
-        self.output = False
+    def connection_box(self):
+        x, y = self.node.x, self.node.y
+        return (x - 17, y + 15, x - 3, y + 30)
 
-    def add_input(self, input_gate):
-        self.inputs.append(input_gate)
-        connection = Connection(self.canvas, input_gate, self)
-        self.connections.append(connection)
-        input_gate.connections.append(connection)
+    def body_box(self):
+        x, y = self.node.x, self.node.y
+        return (x, y, x + 40, y + 40)
+
+    def create_items(self):
+        x, y = self.viewport.to_screen(self.node.x, self.node.y)
+        self.body = self.canvas.create_oval(self.viewport.screen_box(*self.body_box()), fill="red")
+        self.text = self.canvas.create_text(x + 20 * self.viewport.zoom, y + 50 * self.viewport.zoom, text="Kapalı")
+        self.connection_point = self.canvas.create_oval(self.viewport.screen_box(*self.connection_box()), fill="black")
+
+    def create_lod_item(self, color):
+        return self.canvas.create_oval(self.viewport.screen_box(*self.body_box()), fill=color, outline="")
+
+    def detail_items(self):
+        if self.body is None:
+            return []
+        return [self.body, self.text, self.connection_point]
+
+    def delete_items(self):
+        self.body = None
+        self.text = None
+        self.connection_point = None
 
     def is_connected_to_output_gate(self):
-        for input_gate in self.inputs:
-            if isinstance(input_gate, OutputGate):
+        for input_node in self.node.inputs:
+            if input_node.kind == netlist.OUTPUT:
                 return True
         return False
 
     def update_state(self):
-        if self.inputs:
-            self.state = any(input_gate.output for input_gate in self.inputs)
-        else:
-            self.state = False
         if self.state:
             self.canvas.itemconfig(self.body, fill="green")
             self.canvas.itemconfig(self.text, text="Açık")
@@ -312,47 +418,30 @@ class Lamp:
             self.canvas.itemconfig(self.body, fill="red")
             self.canvas.itemconfig(self.text, text="Kapalı")
 
-    def move(self, delta_x, delta_y):
-        self.x += delta_x  # X koordinatını güncelle
-        self.y += delta_y  # Y koordinatını güncelle
-        self.canvas.move(self.body, delta_x, delta_y)
-        self.canvas.move(self.text, delta_x, delta_y)
-        self.canvas.move(self.connection_point, delta_x, delta_y)
-        for connection in self.connections:
-            connection.update_position()
-
-    def handle_press(self, event):
-        self.start_x = event.x
-        self.start_y = event.y
-
-    def handle_motion(self, event):
-        delta_x = event.x - self.start_x
-        delta_y = event.y - self.start_y
-        self.move(delta_x, delta_y)
-        self.start_x = event.x
-        self.start_y = event.y
-
-    def handle_release(self, event):
-        pass
-
-    def toggle_state(self):
-        self.state = not self.state
+    def draw_state(self):
+        # Lamba yalnızca durumu son çizimden beri değiştiyse yeniden boyanır
         self.update_state()
 
-    def evaluate(self):
-        if len(self.inputs) > 0 and isinstance(self.inputs[0], OutputGate):
-            self.state = self.inputs[0].evaluate()
-        else:
-            if self.inputs:
-                self.state = any(input_gate.output for input_gate in self.inputs)
-            else:
-                self.state = False
-        if self.state:
-            self.canvas.itemconfig(self.body, fill="green")
-            self.canvas.itemconfig(self.text, text="Açık")
-        else:
-            self.canvas.itemconfig(self.body, fill="red")
-            self.canvas.itemconfig(self.text, text="Kapalı")
+class SubcircuitGate(Gate):
+    # Alt devre örneğinin bir çıkışı; bağlanan giriş örneğin tüm çıkışlarına eklenir
+    def __init__(self, canvas, node, renderer=None, viewport=None):
+        definition, output_index = node.netlist.subcircuits[node.id]
+        super().__init__(canvas, node, definition.output_names[output_index], renderer, viewport)
+
+VIEW_CLASSES = {
+    netlist.AND: AndGate,
+    netlist.OR: OrGate,
+    netlist.NAND: NandGate,
+    netlist.NOR: NorGate,
+    netlist.XOR: XorGate,
+    netlist.XNOR: XnorGate,
+    netlist.NOT: NotGate,
+    netlist.BUFFER: BufferGate,
+    netlist.INPUT: InputGate,
+    netlist.OUTPUT: OutputGate,
+    netlist.LAMP: Lamp,
+    netlist.SUBCIRCUIT: SubcircuitGate,
+}
 
 class Application:
     def __init__(self, root):
@@ -361,6 +450,33 @@ class Application:
         self.root.geometry("800x600")
         self.canvas = tk.Canvas(self.root, bg="white")
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.renderer = Renderer(self.root)
+        # Görünür alan; yalnızca içindeki bileşenler için tuval öğesi tutulur
+        self.viewport = Viewport()
+        self.visible_views = {}
+        # Tıklama testleri için bağlantı noktaları ve gövdeler uzamsal indekste tutulur
+        self.point_index = SpatialGrid()
+        self.body_index = SpatialGrid()
+        self.netlist = None
+        self.simulator = None
+        # Döngülü devreler için gecikmeli (olay tabanlı) simülatör; yalnızca simülasyon sürerken vardır
+        self.timing = None
+        # Büyük devreler için arka plan simülasyonu; topoloji değişince bir sonraki karede yeni görüntü gönderilir
+        self.worker = None
+        self.worker_stale = False
+        self.applying_frame = False
+        # Dalga biçimi kaydı ve yazıldığı dosya
+        self.recorder = None
+        self.recording_file = None
+        # Gecikmeli simülatöre kayıt için eklenen gözlemci
+        self.recording_observer = None
+        # Ölçüm kapalıyken simülatöre ve çiziciye profil nesnesi verilmez
+        self.profiler = Profiler()
+        self.profiling = False
+        # Sadeleştirme açıkken simülatör devrenin optimizer ile küçültülmüş kopyasını değerlendirir
+        self.optimizing = False
+        self.overlay_visible = False
+        self.views = {}
         self.gates = []
         self.lamps = []
         self.is_connecting = False
@@ -369,8 +485,25 @@ class Application:
         self.connection_line = None
         self.output_gate = None
         self.simulation_running = None
+        # Sürükleme durumu: fare hareketleri biriktirilir ve karede bir kez işlenir
+        self.selection = []
+        self.drag_position = None
+        self.selection_start = None
+        self.selection_box = None
+        self.pointer = None
+        self.motion_pending = False
+        self.pan_position = None
+        # Alt devre kitaplığı: ad -> tanım; her tanım "Alt Devreler" menüsünden eklenebilir
+        self.definitions = {}
+        self.subcircuit_menu = None
+        self.set_netlist(netlist.Netlist())
         menu = tk.Menu(self.root)
         self.root.config(menu=menu)
+        file_menu = tk.Menu(menu, tearoff=0)
+        menu.add_cascade(label="Dosya", menu=file_menu)
+        file_menu.add_command(label="Aç", command=self.open_circuit)
+        file_menu.add_command(label="Kaydet", command=self.save_circuit)
+        file_menu.add_command(label="İçe Aktar", command=self.import_circuit)
         element_menu = tk.Menu(menu, tearoff=0)
         menu.add_cascade(label="Mantık Kapıları", menu=element_menu)
         element_menu.add_command(label="AND", command=self.add_and_gate)
@@ -386,6 +519,13 @@ class Application:
         io_menu.add_command(label="Giriş", command=self.add_input_gate)
         io_menu.add_command(label="Çıkış", command=self.add_output_gate)
         io_menu.add_command(label="LED", command=self.add_lamp)
+        self.subcircuit_menu = tk.Menu(menu, tearoff=0)
+        menu.add_cascade(label="Alt Devreler", menu=self.subcircuit_menu)
+        self.subcircuit_menu.add_command(label="Seçimden Tanımla", command=self.define_from_selection)
+        self.subcircuit_menu.add_command(label="Dosyadan Tanımla", command=self.define_from_file)
+        self.subcircuit_menu.add_separator()
+        for name in self.definitions:
+            self.add_definition_command(name)
         connection_menu = tk.Menu(menu, tearoff=0)
         menu.add_cascade(label="Bağlantı Elemanları", menu=connection_menu)
         connection_menu.add_command(label="Bağlantı Düğümü", command=self.start_connection)
@@ -394,96 +534,594 @@ class Application:
         control_menu.add_command(label="Çalıştır", command=self.run_simulation)
         control_menu.add_command(label="Reset", command=self.reset_simulation)
         control_menu.add_command(label="Durdur", command=self.stop_simulation)
+        control_menu.add_command(label="Sadeleştirme Aç/Kapat", command=self.toggle_optimization)
+        waveform_menu = tk.Menu(menu, tearoff=0)
+        menu.add_cascade(label="Dalga Biçimi", menu=waveform_menu)
+        waveform_menu.add_command(label="Kaydı Başlat", command=self.start_recording)
+        waveform_menu.add_command(label="Kaydı Durdur", command=self.stop_recording)
+        fault_menu = tk.Menu(menu, tearoff=0)
+        menu.add_cascade(label="Hata Simülasyonu", menu=fault_menu)
+        fault_menu.add_command(label="Vektör Dosyasıyla", command=self.grade_vector_file)
+        fault_menu.add_command(label="Rastgele Vektörlerle", command=self.grade_random_vectors)
+        symbolic_menu = tk.Menu(menu, tearoff=0)
+        menu.add_cascade(label="Sembolik Analiz", menu=symbolic_menu)
+        symbolic_menu.add_command(label="LED'i Yakan Girişler", command=self.show_lighting_inputs)
+        symbolic_menu.add_command(label="Dosyayla Eşdeğerlik", command=self.check_equivalence)
+        profile_menu = tk.Menu(menu, tearoff=0)
+        menu.add_cascade(label="Profil", menu=profile_menu)
+        profile_menu.add_command(label="Ölçümü Başlat/Durdur", command=self.toggle_profiling)
+        profile_menu.add_command(label="Katmanı Göster/Gizle", command=self.toggle_overlay)
+        profile_menu.add_command(label="Sıfırla", command=self.reset_profile)
+        profile_menu.add_command(label="JSON Olarak Kaydet", command=lambda: self.export_profile("json"))
+        profile_menu.add_command(label="CSV Olarak Kaydet", command=lambda: self.export_profile("csv"))
         self.canvas.bind("<ButtonPress-1>", self.handle_press)
         self.canvas.bind("<B1-Motion>", self.handle_motion)
         self.canvas.bind("<ButtonRelease-1>", self.handle_release)
+        self.canvas.bind("<ButtonPress-3>", self.handle_pan_press)
+        self.canvas.bind("<B3-Motion>", self.handle_motion)
+        self.canvas.bind("<ButtonRelease-3>", self.handle_pan_release)
+        self.canvas.bind("<MouseWheel>", self.handle_wheel)
+        self.canvas.bind("<Button-4>", self.handle_wheel)
+        self.canvas.bind("<Button-5>", self.handle_wheel)
+        self.canvas.bind("<Configure>", self.handle_configure)
+
+    def set_netlist(self, circuit):
+        # Eski devrenin görünümleri silinir, yeni devre için görünümler modelden kurulur
+        self.stop_timing()
+        self.stop_worker()
+        self.stop_recording()
+        if self.netlist is not None:
+            self.netlist.remove_listener(self.on_netlist_change)
+            self.netlist.remove_listener(self.simulator.on_netlist_change)
+        self.clear_selection()
+        for view in list(self.visible_views):
+            self.hide_view(view)
+        self.canvas.delete("all")
+        self.connection_line = None
+        self.selection_box = None
+        self.renderer.dirty.clear()
+        self.point_index = SpatialGrid()
+        self.body_index = SpatialGrid()
+        self.views = {}
+        self.gates = []
+        self.lamps = []
+        self.simulation_running = None
+        self.netlist = circuit
+        # Görünümler, simülatörden önce dinleyici olarak eklenir ki yeni bağlantılar önce çizilsin
+        self.netlist.add_listener(self.on_netlist_change)
+        self.simulator = Simulator(self.netlist, optimized=self.optimizing)
+        # Kapı kimlikleri yeni devrede farklı anlama gelir
+        self.profiler.reset()
+        self.simulator.profiler = self.profiler if self.profiling else None
+        # Görünümler tuval öğesi olmadan kurulur; öğeler en sonda yalnızca görünür alan için oluşturulur
+        for node in self.netlist.nodes:
+            view = VIEW_CLASSES[node.kind](self.canvas, node, self.renderer, self.viewport)
+            self.views[node.id] = view
+            if node.kind == netlist.LAMP:
+                self.lamps.append(view)
+            else:
+                self.gates.append(view)
+            self.index_view(view)
+        for definition in self.netlist.definitions.values():
+            self.register_definition(definition)
+        views = self.views
+        for source_id, target_id in zip(self.netlist.edge_sources, self.netlist.edge_targets):
+            if not self.draws_edge(target_id):
+                continue
+            start_gate = views[source_id]
+            end_gate = views[target_id]
+            connection = Connection(self.canvas, start_gate, end_gate, self.viewport)
+            end_gate.connections.append(connection)
+            start_gate.connections.append(connection)
+        self.update_viewport()
+
+    def open_circuit(self):
+        path = filedialog.askopenfilename(filetypes=[("Devre", "*" + storage.TEXT_EXTENSION),
+                                                     ("İkili devre", "*" + storage.BINARY_EXTENSION)])
+        if not path:
+            return
+        try:
+            circuit = storage.load(path)
+        except (OSError, NetlistError) as error:
+            messagebox.showerror("Hata", str(error))
+            return
+        self.set_netlist(circuit)
+
+    def import_circuit(self):
+        path = filedialog.askopenfilename(filetypes=[("ISCAS", "*.bench"), ("BLIF", "*.blif"), ("Verilog", "*.v")])
+        if not path:
+            return
+        try:
+            circuit = importers.import_file(path)
+        except (OSError, NetlistError) as error:
+            messagebox.showerror("Hata", str(error))
+            return
+        self.set_netlist(circuit)
+
+    def save_circuit(self):
+        path = filedialog.asksaveasfilename(defaultextension=storage.TEXT_EXTENSION,
+                                            filetypes=[("Devre", "*" + storage.TEXT_EXTENSION),
+                                                       ("İkili devre", "*" + storage.BINARY_EXTENSION)])
+        if not path:
+            return
+        try:
+            storage.save(self.netlist, path)
+        except (OSError, NetlistError) as error:
+            messagebox.showerror("Hata", str(error))
+
+    # Seçili bileşenler varsa yalnızca onların, yoksa tüm ağların değişimleri VCD dosyasına yazılır
+    def start_recording(self):
+        self.stop_recording()
+        path = filedialog.asksaveasfilename(defaultextension=".vcd", filetypes=[("VCD", "*.vcd")])
+        if not path:
+            return
+        try:
+            self.recording_file = open(path, "w", encoding="utf-8")
+        except OSError as error:
+            messagebox.showerror("Hata", str(error))
+            return
+        nodes = [view.node for view in self.selection] or None
+        self.recorder = WaveformRecorder(self.netlist, self.recording_file, nodes)
+        self.route_recording()
+
+    def route_recording(self):
+        # Kaydedici simülasyon kipine göre bağlanır: gecikmeli simülasyonda değişiklikler olay anında,
+        # gerçek zamanla gözlemciden gelir; sıfır gecikmede her "values" bildirimi bir adımdır
+        self.unroute_recording()
+        recorder = self.recorder
+        if recorder is None:
+            return
+        if self.timing is None:
+            recorder.listen()
+            return
+        # Kayıt, simülatörün o anki zamanını kaydın son zamanına eşleyerek sürer
+        offset = recorder.last_time - self.timing.now
+        self.recording_observer = lambda time, node_ids: recorder.observe(time + offset, node_ids)
+        self.timing.observers.append(self.recording_observer)
+
+    def unroute_recording(self):
+        if self.recording_observer is not None:
+            if self.timing is not None:
+                self.timing.observers.remove(self.recording_observer)
+            self.recording_observer = None
+        if self.recorder is not None:
+            self.recorder.unlisten()
+
+    def stop_recording(self):
+        if self.recorder is None:
+            return
+        self.unroute_recording()
+        try:
+            self.recorder.close()
+        finally:
+            self.recording_file.close()
+            self.recorder = None
+            self.recording_file = None
+
+    def toggle_profiling(self):
+        self.profiling = not self.profiling
+        profiler = self.profiler if self.profiling else None
+        self.simulator.profiler = profiler
+        self.renderer.profiler = profiler
+
+    def reset_profile(self):
+        self.profiler.reset()
+        self.draw_overlay()
+
+    def export_profile(self, extension):
+        path = filedialog.asksaveasfilename(defaultextension="." + extension,
+                                            filetypes=[(extension.upper(), "*." + extension)])
+        if not path:
+            return
+        try:
+            if extension == "json":
+                self.profiler.export_json(self.netlist, path)
+            else:
+                self.profiler.export_csv(self.netlist, path)
+        except OSError as error:
+            messagebox.showerror("Hata", str(error))
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.refresh_overlay()
+        else:
+            self.canvas.delete(OVERLAY_TAG)
+
+    def refresh_overlay(self):
+        if not self.overlay_visible:
+            return
+        self.draw_overlay()
+        self.root.after(OVERLAY_INTERVAL, self.refresh_overlay)
+
+    # Bölüm süreleri sol üstte yazılır, en sık değerlendirilen görünür kapılar turuncu çerçeveyle işaretlenir
+    def draw_overlay(self):
+        self.canvas.delete(OVERLAY_TAG)
+        if not self.overlay_visible:
+            return
+        for node_id, _, _ in self.profiler.hottest(self.netlist, HOTTEST_GATES):
+            view = self.views[node_id]
+            if view in self.visible_views:
+                x0, y0, x1, y1 = view.body_box()
+                self.canvas.create_rectangle(*self.viewport.to_screen(x0 - 3, y0 - 3),
+                                             *self.viewport.to_screen(x1 + 3, y1 + 3),
+                                             outline="orange", width=2, tags=OVERLAY_TAG)
+        lines = self.profiler.summary_lines(self.netlist, HOTTEST_GATES)
+        if not lines:
+            lines = ["Ölçüm kapalı" if not self.profiling else "Henüz ölçüm yok"]
+        self.canvas.create_text(10, 10, text="\n".join(lines), anchor="nw", font=("Courier", 9),
+                                fill="purple", tags=OVERLAY_TAG)
+
+    # Model değiştikçe tuvaldeki görünümleri oluşturur ve günceller
+    def on_netlist_change(self, event, payload):
+        if event == "node_added":
+            view = VIEW_CLASSES[payload.kind](self.canvas, payload, self.renderer, self.viewport)
+            self.views[payload.id] = view
+            if payload.kind == netlist.LAMP:
+                self.lamps.append(view)
+            else:
+                self.gates.append(view)
+            self.index_view(view)
+            if self.is_visible(view):
+                self.show_view(view, self.detail_level(len(self.visible_views) + 1))
+        elif event == "moved":
+            self.index_view(self.views[payload.id])
+        elif event == "connected":
+            source, target = payload
+            if not self.draws_edge(target.id):
+                return
+            start_gate = self.views[source.id]
+            end_gate = self.views[target.id]
+            connection = Connection(self.canvas, start_gate, end_gate, self.viewport)
+            end_gate.connections.append(connection)
+            start_gate.connections.append(connection)
+            if start_gate.detailed or end_gate.detailed:
+                connection.materialize()
+        elif event == "values":
+            for node in payload:
+                self.views[node.id].refresh()
+            if self.worker is not None and not self.applying_frame:
+                inputs = {node.id: node.value for node in payload if node.kind == netlist.INPUT}
+                if inputs:
+                    self.worker.set_inputs(inputs)
+        if event in ("node_added", "connected"):
+            self.worker_stale = True
+
+    def draws_edge(self, target_id):
+        # Alt devre örneğine giden bağlantı yalnızca ilk çıkışına çizilir
+        return self.netlist.instance_base(target_id) == target_id
+
+    def register_definition(self, definition):
+        if definition.name not in self.definitions and self.subcircuit_menu is not None:
+            self.add_definition_command(definition.name)
+        self.definitions[definition.name] = definition
+
+    def add_definition_command(self, name):
+        self.subcircuit_menu.add_command(label=name, command=lambda: self.add_subcircuit(self.definitions[name]))
+
+    def add_subcircuit(self, definition):
+        try:
+            subcircuit.instantiate(self.netlist, definition, 50, 50 + len(self.gates) * 50)
+        except NetlistError as error:
+            messagebox.showerror("Hata", str(error))
+
+    # Seçili bileşenler yeni bir tanım olur: seçimdeki girişler pinleri, çıkış ve LED'ler çıkışları verir
+    def define_from_selection(self):
+        if not self.selection:
+            messagebox.showerror("Hata", "Alt devre için önce bileşenleri seçin.")
+            return
+        name = simpledialog.askstring("Alt Devre", "Tanım adı:")
+        if not name:
+            return
+        try:
+            definition = subcircuit.extract(self.netlist, [view.node.id for view in self.selection], name)
+        except NetlistError as error:
+            messagebox.showerror("Hata", str(error))
+            return
+        self.register_definition(definition)
+
+    def define_from_file(self):
+        path = filedialog.askopenfilename(filetypes=[("Devre", "*" + storage.TEXT_EXTENSION),
+                                                     ("İkili devre", "*" + storage.BINARY_EXTENSION)])
+        if not path:
+            return
+        name = "_".join(os.path.splitext(os.path.basename(path))[0].split())
+        try:
+            definition = subcircuit.SubcircuitDefinition(name, storage.load(path))
+        except (OSError, NetlistError) as error:
+            messagebox.showerror("Hata", str(error))
+            return
+        self.register_definition(definition)
+
+    # Kapı listesindeki her bileşenin çıkışında takılı 0/1 hataları verilen vektörlerle derecelendirilir
+    def grade_vector_file(self):
+        path = filedialog.askopenfilename(filetypes=[("Vektörler", "*.txt"), ("Tümü", "*")])
+        if not path:
+            return
+        try:
+            with open(path, encoding="utf-8") as stream:
+                self.grade_faults(read_vectors(stream, len(self.netlist.input_ids)))
+        except OSError as error:
+            messagebox.showerror("Hata", str(error))
+
+    def grade_random_vectors(self):
+        count = simpledialog.askinteger("Hata Simülasyonu", "Vektör sayısı:",
+                                        initialvalue=DEFAULT_RANDOM_VECTORS, minvalue=1)
+        if count:
+            self.grade_faults(random_patterns(len(self.netlist.input_ids), count))
+
+    def grade_faults(self, patterns):
+        faults = all_faults(self.netlist, [view.node.id for view in self.gates])
+        try:
+            coverage = FaultSimulator(self.netlist, faults).run(patterns)
+        except NetlistError as error:
+            messagebox.showerror("Hata", str(error))
+            return
+        messagebox.showinfo("Hata Simülasyonu", "\n".join(coverage.summary_lines(self.netlist, REPORTED_FAULTS)))
+
+    # Seçili çıkış ve LED'ler (seçim yoksa hepsi) için yakan giriş birleşimleri BDD ile bulunur
+    def show_lighting_inputs(self):
+        sinks = [view.node.id for view in self.selection if view.node.kind in netlist.SINK_KINDS]
+        try:
+            symbolic = SymbolicSimulator(self.netlist)
+        except NetlistError as error:
+            messagebox.showerror("Hata", str(error))
+            return
+        names = [self.netlist.names.get(node_id) or str(position) for position, node_id in enumerate(self.netlist.input_ids)]
+        lines = ["Giriş sırası: " + " ".join(names)]
+        for node_id in sinks or self.netlist.output_ids:
+            position = self.netlist.output_ids.index(node_id)
+            lines.append("%s: %d / %d birleşim" % (self.netlist.names.get(node_id) or str(position),
+                                                  symbolic.count(node_id), 1 << len(names)))
+            cubes = symbolic.lighting_inputs(node_id, REPORTED_CUBES + 1)
+            lines.extend("  " + cube for cube in cubes[:REPORTED_CUBES])
+            if len(cubes) > REPORTED_CUBES:
+                lines.append("  ...")
+        messagebox.showinfo("Sembolik Analiz", "\n".join(lines))
+
+    def check_equivalence(self):
+        path = filedialog.askopenfilename(filetypes=[("Devre", "*" + storage.TEXT_EXTENSION),
+                                                     ("İkili devre", "*" + storage.BINARY_EXTENSION)])
+        if not path:
+            return
+        try:
+            counterexample = symbolic_counterexample(self.netlist, storage.load(path))
+        except (OSError, NetlistError) as error:
+            messagebox.showerror("Hata", str(error))
+            return
+        if counterexample is None:
+            messagebox.showinfo("Sembolik Analiz", "Devreler eşdeğer.")
+        else:
+            messagebox.showinfo("Sembolik Analiz",
+                                "Karşı örnek: %s" % "".join("1" if value else "0" for value in counterexample))
+
+    def index_view(self, view):
+        self.point_index.insert(view, view.connection_box())
+        self.body_index.insert(view, view.body_box())
+
+    def find_view_at(self, x, y):
+        views = self.body_index.query_point(x, y)
+        return views[0] if views else None
+
+    def is_visible(self, view):
+        x0, y0, x1, y1 = self.viewport.world_box()
+        view_x0, view_y0, view_x1, view_y1 = view.body_box()
+        return view_x0 < x1 and x0 < view_x1 and view_y0 < y1 and y0 < view_y1
+
+    def detail_level(self, visible_count):
+        return self.viewport.zoom >= LOD_ZOOM and visible_count <= MAX_DETAILED_VIEWS
+
+    def show_view(self, view, detailed):
+        view.materialize(detailed)
+        self.visible_views[view] = None
+        if view in self.selection:
+            self.tag_selected(view)
+        if detailed:
+            for connection in view.connections:
+                connection.materialize()
+
+    def hide_view(self, view):
+        view.dematerialize()
+        del self.visible_views[view]
+        for connection in view.connections:
+            other = connection.end_gate if connection.start_gate is view else connection.start_gate
+            if not other.detailed:
+                connection.dematerialize()
+
+    # Görünür alan değiştiğinde yalnızca alana girip çıkan bileşenlerin öğeleri oluşturulur ya da silinir
+    def update_viewport(self):
+        visible = self.body_index.query_box(self.viewport.world_box())
+        detailed = self.detail_level(len(visible))
+        visible_set = set(visible)
+        for view in list(self.visible_views):
+            if view not in visible_set or view.detailed != detailed:
+                self.hide_view(view)
+        for view in visible:
+            if view not in self.visible_views:
+                self.show_view(view, detailed)
+
+    def pan(self, delta_x, delta_y):
+        # Mevcut öğeler tek çağrıyla kaydırılır, ardından alana girenler oluşturulur
+        self.viewport.origin_x -= delta_x / self.viewport.zoom
+        self.viewport.origin_y -= delta_y / self.viewport.zoom
+        self.canvas.move("all", delta_x, delta_y)
+        self.update_viewport()
+
+    def zoom(self, factor, x, y):
+        # İmlecin altındaki nokta yerinde kalacak şekilde yakınlaştırır
+        world_x, world_y = self.viewport.to_world(x, y)
+        self.viewport.zoom *= factor
+        self.viewport.origin_x = world_x - x / self.viewport.zoom
+        self.viewport.origin_y = world_y - y / self.viewport.zoom
+        for view in list(self.visible_views):
+            self.hide_view(view)
+        self.update_viewport()
+
+    def handle_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.zoom(ZOOM_STEP, event.x, event.y)
+        else:
+            self.zoom(1 / ZOOM_STEP, event.x, event.y)
+
+    def handle_configure(self, event):
+        self.viewport.width = event.width
+        self.viewport.height = event.height
+        self.update_viewport()
+
+    def handle_pan_press(self, event):
+        self.pan_position = (event.x, event.y)
+
+    def handle_pan_release(self, event):
+        self.pointer = (event.x, event.y)
+        self.process_motion()
+        self.pointer = None
+        self.pan_position = None
+
+    def add_gate(self, kind):
+        self.netlist.add_node(kind, 50, 50 + len(self.gates) * 50)
 
     def add_input_gate(self):
-        input_gate = InputGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(input_gate)
+        self.add_gate(netlist.INPUT)
 
     def add_not_gate(self):
-        not_gate = NotGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(not_gate)
+        self.add_gate(netlist.NOT)
 
     def add_output_gate(self):
-        output_gate = OutputGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(output_gate)
+        self.add_gate(netlist.OUTPUT)
 
     def add_buffer_gate(self):
-        buffer_gate = BufferGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(buffer_gate)
+        self.add_gate(netlist.BUFFER)
 
     def add_and_gate(self):
-        and_gate = AndGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(and_gate)
+        self.add_gate(netlist.AND)
 
     def add_or_gate(self):
-        or_gate = OrGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(or_gate)
+        self.add_gate(netlist.OR)
 
     def add_nand_gate(self):
-        nand_gate = NandGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(nand_gate)
+        self.add_gate(netlist.NAND)
 
     def add_nor_gate(self):
-        nor_gate = NorGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(nor_gate)
+        self.add_gate(netlist.NOR)
 
     def add_xor_gate(self):
-        xor_gate = XorGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(xor_gate)
+        self.add_gate(netlist.XOR)
 
     def add_xnor_gate(self):
-        xnor_gate = XnorGate(self.canvas, 50, 50 + len(self.gates) * 50)
-        self.gates.append(xnor_gate)
+        self.add_gate(netlist.XNOR)
 
     def add_lamp(self):
-        lamp = Lamp(self.canvas, 300, 50 + len(self.lamps) * 50)
-        self.lamps.append(lamp)
+        self.netlist.add_node(netlist.LAMP, 300, 50 + len(self.lamps) * 50)
 
     def start_connection(self):
         self.is_connecting = True
 
+    def select(self, views):
+        # Seçili bileşenlerin tüm tuval öğeleri tek bir etiketle gruplanır
+        self.clear_selection()
+        self.selection = list(views)
+        for view in self.selection:
+            self.tag_selected(view)
+
+    def tag_selected(self, view):
+        for item in view.items():
+            self.canvas.addtag_withtag(SELECTION_TAG, item)
+        if view.detailed:
+            self.canvas.itemconfig(view.connection_point, fill="orange")
+
+    def clear_selection(self):
+        for view in self.selection:
+            if view.detailed:
+                self.canvas.itemconfig(view.connection_point, fill="black")
+        self.canvas.dtag(SELECTION_TAG, SELECTION_TAG)
+        self.selection = []
+
+    def move_selection(self, delta_x, delta_y):
+        # Grup tek bir Tk çağrısıyla taşınır; bağlantılar bir sonraki karede çizilir
+        self.canvas.move(SELECTION_TAG, delta_x, delta_y)
+        world_delta_x = delta_x / self.viewport.zoom
+        world_delta_y = delta_y / self.viewport.zoom
+        for view in self.selection:
+            self.netlist.move_node(view.node, world_delta_x, world_delta_y)
+            for connection in view.connections:
+                self.renderer.mark(connection)
+
     # Tıklamanın herhangi bir kapının veya lambanın bağlantı alanı içinde olup olmadığını kontrol eder
     def handle_press(self, event):
+        world_x, world_y = self.viewport.to_world(event.x, event.y)
         if self.is_connecting:
-            for gate in self.gates:
-                x, y, _, _ = self.canvas.coords(gate.connection_point)
-                if x < event.x < x + 10 and y < event.y < y + 10:
-                    self.selected_gate = gate
-                    self.selected_connection_start = (x + 5, y + 5)
-                    return
-            for lamp in self.lamps:
-                x, y, _, _ = self.canvas.coords(lamp.connection_point)
-                if x < event.x < x + 10 and y < event.y < y + 10:
-                    self.selected_gate = lamp
-                    self.selected_connection_start = (x + 5, y + 5)
-                    return
-
-    # Kullanıcı fareyi sürükledikçe tuval üzerindeki bağlantı hattını dinamik olarak günceller
+            for view in self.point_index.query_point(world_x, world_y):
+                self.selected_gate = view
+                self.selected_connection_start = self.viewport.to_screen(*view.anchor())
+                return
+            return
+        view = self.find_view_at(world_x, world_y)
+        if view is None:
+            # Boş alana tıklandı: seçim dikdörtgeni başlar
+            self.clear_selection()
+            self.selection_start = (event.x, event.y)
+            return
+        if view not in self.selection:
+            self.select([view])
+        self.drag_position = (event.x, event.y)
+
+    # Hareket olayları yalnızca son konumu kaydeder; işleme karede bir kez yapılır
     def handle_motion(self, event):
-        if self.is_connecting and self.selected_gate:
+        self.pointer = (event.x, event.y)
+        if not self.motion_pending:
+            self.motion_pending = True
+            self.root.after(FRAME_INTERVAL, self.process_motion)
+
+    def process_motion(self):
+        self.motion_pending = False
+        if self.pointer is None:
+            return
+        x, y = self.pointer
+        if self.pan_position:
+            self.pan(x - self.pan_position[0], y - self.pan_position[1])
+            self.pan_position = (x, y)
+        elif self.is_connecting and self.selected_gate:
+            # Bağlantı hattı her harekette yeniden oluşturulmaz, yalnızca ucu taşınır
+            start_x, start_y = self.selected_connection_start
             if self.connection_line:
-                self.canvas.delete(self.connection_line)
-            self.connection_line = self.canvas.create_line(self.selected_connection_start[0],
-                                                           self.selected_connection_start[1], event.x, event.y,
-                                                           fill="blue")
+                self.canvas.coords(self.connection_line, start_x, start_y, x, y)
+            else:
+                self.connection_line = self.canvas.create_line(start_x, start_y, x, y, fill="blue")
+        elif self.drag_position:
+            delta_x = x - self.drag_position[0]
+            delta_y = y - self.drag_position[1]
+            if delta_x or delta_y:
+                self.move_selection(delta_x, delta_y)
+            self.drag_position = (x, y)
+        elif self.selection_start:
+            start_x, start_y = self.selection_start
+            if self.selection_box:
+                self.canvas.coords(self.selection_box, start_x, start_y, x, y)
+            else:
+                self.selection_box = self.canvas.create_rectangle(start_x, start_y, x, y, dash=(3, 3))
 
     def handle_release(self, event):
+        # Bekleyen hareket varsa bırakmadan önce işlenir
+        self.pointer = (event.x, event.y)
+        self.process_motion()
+        self.pointer = None
+        self.drag_position = None
+        if self.selection_start:
+            if self.selection_box:
+                start_x, start_y = self.selection_start
+                x0, y0 = self.viewport.to_world(min(start_x, event.x), min(start_y, event.y))
+                x1, y1 = self.viewport.to_world(max(start_x, event.x), max(start_y, event.y))
+                self.select(self.body_index.query_box((x0, y0, x1, y1)))
+                self.canvas.delete(self.selection_box)
+            self.selection_start = None
+            self.selection_box = None
+            return
         if self.selected_gate and self.connection_line:
-            for gate in self.gates:
-                x, y, x1, y1 = self.canvas.coords(gate.connection_point)
-                if gate != self.selected_gate and x < event.x < x1 and y < event.y < y1:
-                    gate.add_input(self.selected_gate)
-                    self.canvas.delete(self.connection_line)
-                    return
-            for lamp in self.lamps:
-                x, y, x1, y1 = self.canvas.coords(lamp.connection_point)
-                if lamp != self.selected_gate and x < event.x < x1 and y < y1:
-                    lamp.add_input(self.selected_gate)
-                    self.canvas.delete(self.connection_line)
-                    return
+            for view in self.point_index.query_point(*self.viewport.to_world(event.x, event.y)):
+                if view != self.selected_gate:
+                    if view.add_input(self.selected_gate):
+                        self.handle_feedback()
+                    break
             self.canvas.delete(self.connection_line)
         self.connection_line = None
         self.selected_gate = None
@@ -491,25 +1129,115 @@ class Application:
         self.is_connecting = False
 
     def live_evaluation(self):
-        if not any(isinstance(gate, InputGate) for gate in self.gates):
+        if not self.netlist.inputs:
             print("Hiçbir giriş kapısı bağlı değil. Sistem değerlendiremiyor.")
             return
 
-        # Doğru değerlendirme sırasını sağlamak için kapıları topolojik olarak sıralayın
-        sorted_gates = self.topological_sort(self.gates)
+        if self.simulation_running and len(self.netlist) >= WORKER_MIN_NODES:
+            self.start_worker()
+            return
 
-        # Tüm kapıları doğru sırayla değerlendirin
-        for gate in sorted_gates:
-            gate.evaluate()
+        # Devrenin başlangıç durumunu bir kez tam olarak değerlendirin
+        try:
+            self.simulator.evaluate()
+        except CycleError:
+            # Geri beslemeli devre sıfır gecikmeyle sıralanamaz; kapı gecikmeleriyle olay tabanlı çalıştırılır
+            self.simulator.event_driven = False
+            if self.simulation_running:
+                self.start_timing()
+            return
 
-        # Lambaları güncelle
-        for lamp in self.lamps:
-            lamp.update_state()
+        # Simülasyon sürdükçe periyodik tarama yapılmaz; giriş değişiklikleri ve yeni bağlantılar
+        # yalnızca etkiledikleri kapıları yeniden değerlendirir
+        self.simulator.event_driven = bool(self.simulation_running)
 
-        # Simülasyonun devam etmesi mi yoksa durması mı gerektiğini kontrol edin
+    def handle_feedback(self):
+        # Canlı simülasyon sırasında çizilen geri besleme bağlantısı: live_evaluation'daki gibi
+        # kapı gecikmeli simülatöre geçilir
+        self.simulator.event_driven = False
         if self.simulation_running:
-            # Bir sonraki canlı değerlendirmeyi planlayın
-            self.root.after(50, self.live_evaluation)  # Zaman aralığını ayarlayın (1000 ms = 1 saniye)
+            self.start_timing()
+
+    def start_worker(self):
+        # Değerlendirme arka planda yapılır; arayüz yalnızca gelen kareleri uygular
+        self.simulator.event_driven = False
+        if self.worker is None:
+            self.worker = SimulationWorker(self.optimizing)
+            self.worker.start()
+            self.root.after(FRAME_INTERVAL, self.drain_worker)
+        self.worker.optimized = self.optimizing
+        self.worker.load(self.netlist)
+        self.worker_stale = False
+
+    def stop_worker(self):
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker = None
+
+    def drain_worker(self):
+        worker = self.worker
+        if worker is None:
+            return
+        if not self.simulation_running:
+            self.stop_worker()
+            return
+        if worker.error is not None:
+            error = worker.error
+            self.stop_worker()
+            if isinstance(error, CycleError):
+                # Geri beslemeli devre gecikmeli simülatörle çalıştırılır
+                self.start_timing()
+            else:
+                messagebox.showerror("Hata", str(error))
+            return
+        if self.worker_stale:
+            worker.load(self.netlist)
+            self.worker_stale = False
+        changes = worker.take_frame()
+        if changes:
+            self.apply_frame(changes)
+        self.root.after(FRAME_INTERVAL, self.drain_worker)
+
+    def apply_frame(self, changes):
+        values = self.netlist.values
+        nodes = self.netlist.nodes
+        changed = []
+        for node_id, value in changes.items():
+            if values[node_id] != value:
+                values[node_id] = value
+                changed.append(nodes[node_id])
+        if changed:
+            self.applying_frame = True
+            try:
+                self.netlist.notify("values", changed)
+            finally:
+                self.applying_frame = False
+
+    def start_timing(self):
+        if self.timing is None:
+            self.timing = TimingSimulator(self.netlist)
+            self.timing.initialize()
+            self.route_recording()
+            self.root.after(FRAME_INTERVAL, self.timing_tick)
+
+    def stop_timing(self):
+        if self.timing is not None:
+            self.unroute_recording()
+            self.timing.detach()
+            self.timing = None
+            self.route_recording()
+
+    def timing_tick(self):
+        if self.timing is None or not self.simulation_running:
+            self.stop_timing()
+            return
+        try:
+            self.timing.run(TIMING_STEPS_PER_FRAME)
+        except NetlistError as error:
+            self.stop_timing()
+            messagebox.showerror("Hata", str(error))
+            return
+        self.root.after(FRAME_INTERVAL, self.timing_tick)
 
     def run_simulation(self):
         self.simulation_running = True
@@ -517,8 +1245,24 @@ class Application:
         # Simülasyon başladıktan sonra canlı değerlendirmeyi başlatın
         self.live_evaluation()
 
+    def toggle_optimization(self):
+        self.optimizing = not self.optimizing
+        self.simulator.optimized = self.optimizing
+        if self.optimizing:
+            try:
+                summary = self.simulator.reduction().summary()
+            except CycleError:
+                print("Geri beslemeli devre sadeleştirilemez; gecikmeli simülasyon kullanılır.")
+            else:
+                print("Sadeleştirme: %d kapı -> %d kapı" % (summary["gates_before"], summary["gates_after"]))
+        if self.simulation_running:
+            self.live_evaluation()
+
     def stop_simulation(self):
         self.simulation_running = False
+        self.simulator.event_driven = False
+        self.stop_timing()
+        self.stop_worker()
         messagebox.showinfo("Bilgi", "Simülasyon durduruldu.")
 
     def evaluate(self):
@@ -526,7 +1270,7 @@ class Application:
             print("Çıkış kapısı mevcut değil. Sistem değerlendiremiyor.")
             return
 
-        if not any(isinstance(gate, InputGate) for gate in self.gates):
+        if not self.netlist.inputs:
             print("Hiçbir giriş kapısı bağlı değil. Sistem değerlendiremiyor.")
             return
 
@@ -534,74 +1278,33 @@ class Application:
             print("Çıkış kapısı herhangi bir LED'e bağlı değildir. Sistem değerlendiremiyor.")
             return
 
-        # Doğru değerlendirme sırasını sağlamak için kapıları topolojik olarak sıralayın
-        sorted_gates = self.topological_sort(self.gates)
-
-        # Tüm kapıları doğru sırayla değerlendirin
-        for gate in sorted_gates:
-            gate.evaluate()
-
-        # Lambaları güncelle
-        for lamp in self.lamps:
-            lamp.update_state()
+        try:
+            self.simulator.evaluate()
+        except CycleError as error:
+            print(error)
 
     def topological_sort(self, gates):
-        from collections import deque, defaultdict
-
-        # Derece cinsinden hesapla
-        in_degree = defaultdict(int)
-        for gate in gates:
-            for input_gate in gate.inputs:
-                in_degree[gate] += 1
-
-        # Kuyruğu sıfır dereceli kapılarla başlat
-        zero_in_degree_queue = deque([gate for gate in gates if in_degree[gate] == 0])
-
-        sorted_gates = []
-        while zero_in_degree_queue:
-            gate = zero_in_degree_queue.popleft()
-            sorted_gates.append(gate)
-            for output_gate in gate.connections:
-                in_degree[output_gate.end_gate] -= 1
-                if in_degree[output_gate.end_gate] == 0:
-                    zero_in_degree_queue.append(output_gate.end_gate)
-
-        return sorted_gates
+        # Sıralama modelde yapılır; burada yalnızca istenen görünümlere çevrilir
+        gate_ids = set(gate.node.id for gate in gates)
+        if self.simulator.profiler is None:
+            order = self.netlist.topological_order()
+        else:
+            with self.simulator.profiler.section("sort"):
+                order = self.netlist.topological_order()
+        return [self.views[node.id] for node in order if node.id in gate_ids]
 
     def reset_simulation(self):
-        # Lambaların başlangıç durumunu ve konumunu sakla
-        lamp_initial_states = [(lamp, lamp.state, (lamp.x, lamp.y)) for lamp in self.lamps]
-
-        # Tüm giriş kapılarının ve lambaların başlangıç konumuna getir
-        for gate in self.gates:
-            if isinstance(gate, InputGate):
-                gate.state = False
-                gate.output = False
-                gate.button.config(text="0")
-                self.canvas.coords(gate.text, gate.x, gate.y)  # Giriş kapısının metnini başlangıç konumuna yerleştir
-                self.canvas.coords(gate.connection_point, gate.x + 30, gate.y - 5, gate.x + 40,
-                                   gate.y + 5)  # Bağlantı noktasını başlangıç konumuna getir
-            elif isinstance(gate, Lamp):
-                gate.output = False
-                gate.canvas.itemconfig(gate.body, fill="red")  # Lambanın rengini kırmızıya ayarla
-                gate.canvas.coords(gate.body, gate.initial_position[0],
-                                   gate.initial_position[1])  # Lambayı başlangıç konumuna getir
-                gate.canvas.coords(gate.text, gate.initial_position[0] + 20,
-                                   gate.initial_position[1] + 50)  # Metni başlangıç konumuna yerleştir
-                gate.canvas.coords(gate.connection_point, gate.initial_position[0] - 17, gate.initial_position[1] + 15,
-                                   gate.initial_position[0] - 3,
-                                   gate.initial_position[1] + 30)  # Bağlantı noktasını başlangıç konumuna getir
-
-        # Lambaları başlangıç durumuna geri döndür
-        for lamp, initial_state, initial_position in lamp_initial_states:
-            lamp.state = initial_state
-            lamp.update_state()
-            lamp.x, lamp.y = initial_position
-
-        # Tüm bağlantı noktalarını varsayılan renge geri getir
-        for lamp in self.lamps:
-            lamp.output = False
-            lamp.canvas.itemconfig(lamp.connection_point, fill="black")
+        # Tüm giriş kapılarını 0'a çek ve devreyi yeniden değerlendir
+        if self.timing is not None or self.worker is not None:
+            # Gecikmeli simülatör ve arka plan işçisi giriş değişikliklerini dinleyerek bir sonraki karede yayar
+            for node in self.netlist.inputs:
+                self.netlist.set_input(node, False)
+        else:
+            try:
+                self.simulator.reset()
+            except CycleError as error:
+                messagebox.showerror("Hata", str(error))
+                return
 
         messagebox.showinfo("Bilgi", "Simülasyon sıfırlandı.")
 
@@ -611,4 +1314,4 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
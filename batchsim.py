@@ -0,0 +1,136 @@
+# NumPy ile vektörleştirilmiş toplu simülasyon.
+# Devre diziler halinde tutulur: kapı türü kodları, CSR düzeninde giriş (fan-in) dizileri ve
+# seviye dizisi. (vektör sayısı x giriş sayısı) boyutlu bir bool matris seviye seviye değerlendirilir.
+import numpy as np
+
+from netlist import GATE_KINDS, KIND_CODES, AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, INPUT, OUTPUT, LAMP, SUBCIRCUIT
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# (ve, veya, özel veya, değil) işlemleri; paketli kipte her bayt 8 vektör taşır
+LOGICAL_OPERATIONS = (np.logical_and, np.logical_or, np.logical_xor, np.logical_not)
+PACKED_OPERATIONS = (np.bitwise_and, np.bitwise_or, np.bitwise_xor, np.invert)
+
+
+class ArrayNetlist:
+    def __init__(self, kinds, fanin_offsets, fanin, levels, input_ids, output_ids, subcircuits=None):
+        self.kinds = kinds
+        self.fanin_offsets = fanin_offsets
+        self.fanin = fanin
+        self.levels = levels
+        self.input_ids = input_ids
+        self.output_ids = output_ids
+        # SUBCIRCUIT düğümü -> (tanım, çıkış sırası), bkz. Netlist.subcircuits
+        self.subcircuits = subcircuits or {}
+        self.groups = self._group_gates()
+
+    @classmethod
+    def from_netlist(cls, netlist):
+        # topological_ids döngü varsa CycleError fırlatır. Sütunlar kopyalanır: canlı bytearray/array
+        # üzerinde görünüm tutulsaydı Netlist'e düğüm eklemek BufferError verirdi
+        netlist.topological_ids()
+        offsets, sources = netlist.fanin_csr()
+        kinds = np.frombuffer(bytes(netlist.kind_codes), dtype=np.uint8)
+        fanin_offsets = np.array(offsets, dtype=np.int64)
+        fanin = np.array(sources, dtype=np.int32)
+        levels = np.array(netlist.node_levels, dtype=np.int32)
+        input_ids = np.array(netlist.input_ids, dtype=np.int32)
+        output_ids = np.array(netlist.output_ids, dtype=np.int32)
+        return cls(kinds, fanin_offsets, fanin, levels, input_ids, output_ids, dict(netlist.subcircuits))
+
+    def _group_gates(self):
+        # Aynı seviyedeki, aynı türden ve aynı giriş sayısındaki kapılar tek işlemde değerlendirilir;
+        # alt devre çıkışları ayrıca tanım ve çıkış sırasına göre gruplanır
+        fanin_counts = np.diff(self.fanin_offsets)
+        is_gate = self.kinds != KIND_CODES[INPUT]
+        groups = []
+        for level in range(int(self.levels.max()) + 1 if len(self.levels) else 0):
+            level_mask = is_gate & (self.levels == level)
+            keys = set(zip(self.kinds[level_mask].tolist(), fanin_counts[level_mask].tolist()))
+            for code, count in sorted(keys):
+                gate_ids = np.flatnonzero(level_mask & (self.kinds == code) & (fanin_counts == count))
+                if GATE_KINDS[code] != SUBCIRCUIT:
+                    groups.append((GATE_KINDS[code], gate_ids, self._operands(gate_ids, count), None))
+                    continue
+                tables = {}
+                for gate_id in gate_ids.tolist():
+                    definition, output_index = self.subcircuits[gate_id]
+                    tables.setdefault((definition.name, output_index), (definition, []))[1].append(gate_id)
+                for (_, output_index), (definition, members) in sorted(tables.items()):
+                    members = np.array(members, dtype=np.int64)
+                    column = np.frombuffer(definition.columns[output_index], dtype=np.uint8).astype(bool)
+                    groups.append((SUBCIRCUIT, members, self._operands(members, count), column))
+        return groups
+
+    def _operands(self, gate_ids, count):
+        starts = self.fanin_offsets[gate_ids]
+        return self.fanin[starts[:, None] + np.arange(count)]
+
+    def simulate(self, vectors, packed=True, chunk_size=DEFAULT_CHUNK_SIZE):
+        # vectors: (N, giriş sayısı) bool matris -> (N, çıkış sayısı) bool matris
+        vectors = np.asarray(vectors, dtype=bool)
+        results = [self._simulate_chunk(vectors[start:start + chunk_size], packed)
+                   for start in range(0, len(vectors), chunk_size)]
+        if not results:
+            return np.zeros((0, len(self.output_ids)), dtype=bool)
+        return np.concatenate(results)
+
+    def _simulate_chunk(self, vectors, packed):
+        count = len(vectors)
+        if packed:
+            operations = PACKED_OPERATIONS
+            columns = np.packbits(vectors.T, axis=1, bitorder="little")
+            values = np.zeros((len(self.kinds), columns.shape[1]), dtype=np.uint8)
+        else:
+            operations = LOGICAL_OPERATIONS
+            columns = vectors.T
+            values = np.zeros((len(self.kinds), count), dtype=bool)
+        values[self.input_ids] = columns
+        for kind, gate_ids, operand_ids, column in self.groups:
+            if kind == SUBCIRCUIT:
+                values[gate_ids] = _lookup_group(column, values[operand_ids], packed)
+            else:
+                values[gate_ids] = _evaluate_group(kind, values[operand_ids], operations)
+        outputs = values[self.output_ids]
+        if packed:
+            outputs = np.unpackbits(outputs, axis=1, count=count, bitorder="little").astype(bool)
+        return outputs.T
+
+
+def _lookup_group(column, operands, packed):
+    # Tablo satır numarası pinlerden bit bit kurulur; paketli kipte bitler önce açılır
+    if packed:
+        operands = np.unpackbits(operands, axis=2, bitorder="little").astype(bool)
+    index = np.zeros((operands.shape[0], operands.shape[2]), dtype=np.int64)
+    for position in range(operands.shape[1]):
+        index |= operands[:, position].astype(np.int64) << position
+    result = column[index]
+    if packed:
+        return np.packbits(result, axis=1, bitorder="little")
+    return result
+
+
+def _evaluate_group(kind, operands, operations):
+    # operands: (kapı sayısı, giriş sayısı, sütun) boyutlu; kurallar netlist.GATE_FUNCTIONS ile aynıdır
+    and_, or_, xor_, not_ = operations
+    fan_in = operands.shape[1]
+    if fan_in == 0 or (kind == XOR and fan_in != 2):
+        return np.zeros((operands.shape[0], operands.shape[2]), dtype=operands.dtype)
+    if kind == AND:
+        return and_.reduce(operands, axis=1)
+    if kind in (OR, OUTPUT, LAMP):
+        return or_.reduce(operands, axis=1)
+    if kind == NAND:
+        return not_(and_.reduce(operands, axis=1))
+    if kind == NOR:
+        return not_(or_.reduce(operands, axis=1))
+    if kind == XOR:
+        return xor_(operands[:, 0], operands[:, 1])
+    if kind == XNOR:
+        # Çok girişli XNOR: tüm girişler eşitse 1
+        return or_(and_.reduce(operands, axis=1), not_(or_.reduce(operands, axis=1)))
+    if kind == NOT:
+        return not_(operands[:, 0])
+    if kind == BUFFER:
+        return operands[:, 0]
+    raise ValueError("Desteklenmeyen kapı türü: %s" % kind)
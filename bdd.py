@@ -0,0 +1,358 @@
+# İndirgenmiş sıralı ikili karar diyagramları (ROBDD) ile sembolik değerlendirme.
+# Her çıkış ve LED'in fonksiyonu girişler cinsinden bir BDD olarak kurulur. Düğümler tek bir
+# benzersiz tabloda (unique table) tutulur: aynı (değişken, düşük, yüksek) üçlüsü her zaman aynı
+# kimliği alır, bu yüzden aynı yöneticide kurulan iki fonksiyon ancak kimlikleri eşitse eşdeğerdir.
+# İşlemler ITE (if-then-else) üzerinden yapılır ve sonuçlar sabit boyutlu, doğrudan eşlemeli bir
+# önbellekte tutulur; çakışan kayıt eskisinin üzerine yazılır, böylece önbellek büyümez.
+# Sorgular (eşdeğerlik, sağlanabilirlik, bir LED'i yakan girişler) 2**n yerine BDD boyutuyla orantılıdır.
+# Değişken sırası devre topolojisinden çıkarılır: çıkışlardan derinlik öncelikli gezilir ve girişler
+# ilk ulaşıldıkları sırayla numaralanır; böylece birlikte kullanılan girişler sırada yan yana düşer.
+from netlist import NetlistError, AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, INPUT, SUBCIRCUIT, SINK_KINDS
+
+FALSE = 0
+TRUE = 1
+DEFAULT_CACHE_BITS = 18
+DEFAULT_MAX_NODES = 1 << 20
+# Kübü (girişlerin bir kısmının değeri) dizgiye çevirirken değeri önemsiz girişler
+DONT_CARE = "-"
+
+
+class NodeLimitError(NetlistError):
+    def __init__(self, limit):
+        super().__init__("BDD %d düğüm sınırını aştı; değişken sırası bu devre için uygun değil." % limit)
+        self.limit = limit
+
+
+class BDD:
+    def __init__(self, variable_count, cache_bits=DEFAULT_CACHE_BITS, max_nodes=DEFAULT_MAX_NODES):
+        self.variable_count = variable_count
+        self.max_nodes = max_nodes
+        # Düğüm sütunları; sabitlerin değişkeni tüm değişkenlerin altındadır
+        self.variables = [variable_count, variable_count]
+        self.lows = [FALSE, TRUE]
+        self.highs = [FALSE, TRUE]
+        self.unique = {}
+        self.cache_mask = (1 << cache_bits) - 1
+        self.cache_keys = [None] * (1 << cache_bits)
+        self.cache_values = [FALSE] * (1 << cache_bits)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __len__(self):
+        return len(self.variables)
+
+    def node(self, variable, low, high):
+        if low == high:
+            return low
+        key = (variable, low, high)
+        result = self.unique.get(key)
+        if result is None:
+            result = len(self.variables)
+            if result >= self.max_nodes:
+                raise NodeLimitError(self.max_nodes)
+            self.variables.append(variable)
+            self.lows.append(low)
+            self.highs.append(high)
+            self.unique[key] = result
+        return result
+
+    def variable(self, index):
+        return self.node(index, FALSE, TRUE)
+
+    def ite(self, f, g, h):
+        # f ? g : h. Özyineleme yerine açık yığın kullanılır; derinlik değişken sayısına ulaşabilir ve
+        # süreç genelindeki özyineleme sınırına dokunulmaz. Yığında iki tür çerçeve vardır:
+        # (False, f, g, h) açılacak bir alt problem, (True, anahtar, yuva, değişken) ise iki alt sonucu
+        # results'tan alıp düğümü kuran adım.
+        variables = self.variables
+        lows = self.lows
+        highs = self.highs
+        cache_keys = self.cache_keys
+        cache_values = self.cache_values
+        mask = self.cache_mask
+        stack = [(False, f, g, h)]
+        results = []
+        while stack:
+            frame = stack.pop()
+            if frame[0]:
+                _, key, slot, top = frame
+                high = results.pop()
+                result = self.node(top, results.pop(), high)
+                cache_keys[slot] = key
+                cache_values[slot] = result
+                results.append(result)
+                continue
+            _, f, g, h = frame
+            if f == TRUE or g == h:
+                results.append(g)
+                continue
+            if f == FALSE:
+                results.append(h)
+                continue
+            if g == TRUE and h == FALSE:
+                results.append(f)
+                continue
+            key = (f, g, h)
+            slot = hash(key) & mask
+            if cache_keys[slot] == key:
+                self.cache_hits += 1
+                results.append(cache_values[slot])
+                continue
+            self.cache_misses += 1
+            top = min(variables[f], variables[g], variables[h])
+            f0, f1 = (lows[f], highs[f]) if variables[f] == top else (f, f)
+            g0, g1 = (lows[g], highs[g]) if variables[g] == top else (g, g)
+            h0, h1 = (lows[h], highs[h]) if variables[h] == top else (h, h)
+            # Önce düşük kol açılır; sonucu results'a yüksek koldan önce girer
+            stack.append((True, key, slot, top))
+            stack.append((False, f1, g1, h1))
+            stack.append((False, f0, g0, h0))
+        return results[0]
+
+    def negate(self, f):
+        return self.ite(f, FALSE, TRUE)
+
+    def conjunction(self, functions):
+        result = TRUE
+        for f in functions:
+            result = self.ite(result, f, FALSE)
+            if result == FALSE:
+                break
+        return result
+
+    def disjunction(self, functions):
+        result = FALSE
+        for f in functions:
+            result = self.ite(result, TRUE, f)
+            if result == TRUE:
+                break
+        return result
+
+    def exclusive(self, f, g):
+        return self.ite(f, self.negate(g), g)
+
+    def evaluate(self, f, values):
+        # values: değişken sırası -> bool
+        while f > TRUE:
+            f = self.highs[f] if values[self.variables[f]] else self.lows[f]
+        return f == TRUE
+
+    def satisfy_one(self, f):
+        # f'yi sağlayan bir atama (değişken -> bool); f sabit False ise None.
+        # İndirgenmiş diyagramda False olmayan her düğümden True'ya bir yol vardır.
+        if f == FALSE:
+            return None
+        assignment = {}
+        while f > TRUE:
+            variable = self.variables[f]
+            if self.lows[f] != FALSE:
+                assignment[variable] = False
+                f = self.lows[f]
+            else:
+                assignment[variable] = True
+                f = self.highs[f]
+        return assignment
+
+    def satisfy_count(self, f):
+        # f'yi sağlayan tam atamaların sayısı (tüm değişkenler üzerinden)
+        counts = {FALSE: 0, TRUE: 1}
+        variables = self.variables
+        for node in self._postorder(f):
+            low = self.lows[node]
+            high = self.highs[node]
+            counts[node] = (counts[low] << (variables[low] - variables[node] - 1)) + \
+                           (counts[high] << (variables[high] - variables[node] - 1))
+        return counts[f] << variables[f] if f != FALSE else 0
+
+    def cubes(self, f):
+        # True'ya giden her yol bir kübdür (yalnızca yoldaki değişkenler atanır); kübler ayrıktır
+        stack = [(f, ())]
+        while stack:
+            node, path = stack.pop()
+            if node == FALSE:
+                continue
+            if node == TRUE:
+                yield dict(path)
+                continue
+            variable = self.variables[node]
+            stack.append((self.highs[node], path + ((variable, True),)))
+            stack.append((self.lows[node], path + ((variable, False),)))
+
+    def support(self, f):
+        return sorted(set(self.variables[node] for node in self._postorder(f)))
+
+    def size(self, *functions):
+        # Fonksiyonların paylaşılan diyagramındaki düğüm sayısı (sabitler hariç)
+        return len(self._postorder(*functions))
+
+    def _postorder(self, *roots):
+        # Sabit olmayan düğümler, her düğüm çocuklarından sonra gelecek sırayla
+        order = []
+        seen = set()
+        stack = [(root, False) for root in roots]
+        while stack:
+            node, expanded = stack.pop()
+            if node <= TRUE:
+                continue
+            if expanded:
+                order.append(node)
+                continue
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.append((node, True))
+            stack.append((self.highs[node], False))
+            stack.append((self.lows[node], False))
+        return order
+
+
+def depth_first_order(netlist):
+    # Çıkışlar en derin olandan başlayarak gezilir; her kapıda daha derin girişler önce izlenir.
+    # Hiçbir çıkışa ulaşmayan girişler sona, devredeki sıralarıyla eklenir.
+    netlist.topological_ids()
+    levels = netlist.node_levels
+    order = []
+    seen = set()
+    for output_id in sorted(netlist.output_ids, key=lambda node_id: -levels[node_id]):
+        stack = [output_id]
+        while stack:
+            node_id = stack.pop()
+            if node_id in seen:
+                continue
+            seen.add(node_id)
+            if netlist.kind(node_id) == INPUT:
+                order.append(node_id)
+                continue
+            # Yığından en son çıkan, yani ilk izlenen giriş en derin olandır
+            fanin = sorted(set(netlist.fanin_ids(node_id)), key=lambda input_id: levels[input_id])
+            stack.extend(input_id for input_id in fanin if input_id not in seen)
+    order.extend(input_id for input_id in netlist.input_ids if input_id not in seen)
+    return order
+
+
+def input_order(netlist):
+    return list(netlist.input_ids)
+
+
+ORDERINGS = {
+    "dfs": depth_first_order,
+    "input": input_order,
+}
+
+
+def gate_function(manager, kind, operands):
+    # Kurallar netlist.GATE_FUNCTIONS ile aynıdır
+    if not operands:
+        return FALSE
+    if kind == AND:
+        return manager.conjunction(operands)
+    if kind == NAND:
+        return manager.negate(manager.conjunction(operands))
+    if kind == OR or kind in SINK_KINDS:
+        return manager.disjunction(operands)
+    if kind == NOR:
+        return manager.negate(manager.disjunction(operands))
+    if kind == NOT:
+        return manager.negate(operands[0])
+    if kind == BUFFER:
+        return operands[0]
+    if kind == XOR:
+        return manager.exclusive(*operands) if len(operands) == 2 else FALSE
+    if kind == XNOR:
+        if len(operands) == 2:
+            return manager.negate(manager.exclusive(*operands))
+        # Tüm girişler 1 ya da tüm girişler 0
+        inverted = [manager.negate(operand) for operand in operands]
+        return manager.disjunction([manager.conjunction(operands), manager.conjunction(inverted)])
+    raise NetlistError("Sembolik olarak değerlendirilemeyen kapı türü: %s" % kind)
+
+
+def build_functions(manager, netlist, input_functions):
+    # Her düğümün fonksiyonu, kimlik sırasıyla; alt devre örneklerinin iç devresi bağlı girişlerin
+    # fonksiyonlarıyla açılır (bağlanmamış pinler False sayılır)
+    functions = [FALSE] * len(netlist)
+    instances = {}
+    for node_id in netlist.topological_ids():
+        kind = netlist.kind(node_id)
+        if kind == INPUT:
+            functions[node_id] = input_functions[node_id]
+            continue
+        operands = [functions[input_id] for input_id in netlist.fanin_ids(node_id)]
+        if kind == SUBCIRCUIT:
+            definition, output_index = netlist.subcircuits[node_id]
+            base = netlist.instance_base(node_id)
+            outputs = instances.get(base)
+            if outputs is None:
+                inner = definition.netlist
+                operands += [FALSE] * (definition.input_count - len(operands))
+                inner_functions = build_functions(manager, inner, dict(zip(inner.input_ids, operands)))
+                outputs = instances[base] = [inner_functions[output_id] for output_id in inner.output_ids]
+            functions[node_id] = outputs[output_index]
+        else:
+            functions[node_id] = gate_function(manager, kind, operands)
+    return functions
+
+
+class SymbolicSimulator:
+    def __init__(self, netlist, manager=None, order=None, max_nodes=DEFAULT_MAX_NODES):
+        # order: girişlerin değişken sırası (düğüm kimlikleri); verilmezse topolojiden çıkarılır
+        self.netlist = netlist
+        self.order = list(order) if order is not None else depth_first_order(netlist)
+        if sorted(self.order) != sorted(netlist.input_ids):
+            raise NetlistError("Değişken sırası devrenin her girişini bir kez içermelidir.")
+        self.manager = manager if manager is not None else BDD(len(self.order), max_nodes=max_nodes)
+        self.input_variables = {input_id: index for index, input_id in enumerate(self.order)}
+        variables = {input_id: self.manager.variable(index) for input_id, index in self.input_variables.items()}
+        self.functions = build_functions(self.manager, netlist, variables)
+
+    def output_functions(self):
+        return [self.functions[node_id] for node_id in self.netlist.output_ids]
+
+    def size(self):
+        # Tüm çıkışların paylaşılan diyagramındaki düğüm sayısı
+        return self.manager.size(*self.output_functions())
+
+    def input_vector(self, assignment):
+        # Değişken atamasından giriş sırasına göre değerler; atanmamış girişler False
+        return [assignment.get(self.input_variables[input_id], False) for input_id in self.netlist.input_ids]
+
+    def cube_string(self, assignment):
+        return "".join(DONT_CARE if self.input_variables[input_id] not in assignment
+                       else "1" if assignment[self.input_variables[input_id]] else "0"
+                       for input_id in self.netlist.input_ids)
+
+    def satisfying_vector(self, node_id):
+        # Düğümü 1 yapan bir giriş vektörü; hiçbir girişle 1 olamıyorsa None
+        assignment = self.manager.satisfy_one(self.functions[node_id])
+        return None if assignment is None else self.input_vector(assignment)
+
+    def count(self, node_id):
+        # Düğümü 1 yapan giriş birleşimlerinin sayısı
+        return self.manager.satisfy_count(self.functions[node_id]) >> \
+            (self.manager.variable_count - len(self.order))
+
+    def lighting_inputs(self, node_id, limit=None):
+        # Düğümü (ör. bir LED'i) yakan giriş kümeleri; her dizgide '-' değeri önemsiz girişlerdir
+        result = []
+        for assignment in self.manager.cubes(self.functions[node_id]):
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(self.cube_string(assignment))
+        return result
+
+
+def symbolic_counterexample(netlist_a, netlist_b, order=None, max_nodes=DEFAULT_MAX_NODES):
+    # parallel.find_counterexample ile aynı sözleşme: girişler ve çıkışlar sıralarına göre eşleşir,
+    # eşdeğerse None, değilse giriş sırasına göre bir karşı örnek döner
+    if len(netlist_a.input_ids) != len(netlist_b.input_ids) or len(netlist_a.output_ids) != len(netlist_b.output_ids):
+        raise NetlistError("Devrelerin giriş ve çıkış sayıları aynı olmalıdır.")
+    first = SymbolicSimulator(netlist_a, order=order, max_nodes=max_nodes)
+    positions = {input_id: position for position, input_id in enumerate(netlist_a.input_ids)}
+    second = SymbolicSimulator(netlist_b, first.manager,
+                               [netlist_b.input_ids[positions[input_id]] for input_id in first.order])
+    manager = first.manager
+    # Aynı yöneticide kanonik oldukları için eşdeğer fonksiyonların kimlikleri eşittir
+    for f, g in zip(first.output_functions(), second.output_functions()):
+        if f != g:
+            return first.input_vector(manager.satisfy_one(manager.exclusive(f, g)))
+    return None
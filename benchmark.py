@@ -0,0 +1,249 @@
+# Tekrarlanabilir ölçüm takımı: üretilen devrelerde sıralama, değerlendirme, çizim ve tıklama
+# testlerini zamanlar ve sonuçları çalıştırmalar arasında karşılaştırılabilen bir JSON raporuna yazar.
+#
+#   python benchmark.py --sizes 10,1000,100000 --output once.json
+#   python benchmark.py --output sonra.json
+#   python benchmark.py --compare once.json sonra.json
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+from circuits import GENERATORS, ISCAS_SIZES, iscas_like
+from compiler import compile_netlist
+from optimizer import optimize
+from simulator import Simulator
+
+REPORT_VERSION = 1
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+DEFAULT_REPEAT = 5
+# Tuval ölçümleri görünüm nesnesi kurulumu nedeniyle bu boyutun üstünde atlanır
+DEFAULT_CANVAS_MAX_GATES = 100000
+# Tıklama ve sürükleme ölçümlerinde bir örnek bu kadar olaydan oluşur
+EVENTS_PER_SAMPLE = 100
+GUI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "230501033_DamlaKeklik.py")
+
+
+def measure(function, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def randomize_inputs(netlist, generator):
+    for node_id in netlist.input_ids:
+        netlist.values[node_id] = generator.random() < 0.5
+
+
+def headless_cases(netlist, repeat, seed):
+    generator = random.Random(seed)
+    simulator = Simulator(netlist, event_driven=True)
+    simulator.compiled()
+    inputs = netlist.inputs
+    try:
+        yield "topological_sort", measure(netlist.topological_order, repeat, netlist.invalidate_levels)
+        yield "compile", measure(lambda: compile_netlist(netlist), repeat)
+        yield "evaluate", measure(simulator.evaluate, repeat, lambda: randomize_inputs(netlist, generator))
+        yield "live_toggle", measure(lambda: simulator.toggle(generator.choice(inputs)), repeat)
+        yield "optimize", measure(lambda: optimize(netlist), repeat)
+        simulator.optimized = True
+        simulator.reduction()
+        yield "optimized_evaluate", measure(simulator.evaluate, repeat, lambda: randomize_inputs(netlist, generator))
+        yield "optimized_toggle", measure(lambda: simulator.toggle(generator.choice(inputs)), repeat)
+    finally:
+        netlist.remove_listener(simulator.on_netlist_change)
+
+
+def load_gui():
+    # Arayüz modülünün adı rakamla başladığı için dosya yolundan yüklenir
+    spec = importlib.util.spec_from_file_location("gui", GUI_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def canvas_cases(gui, netlist, repeat, seed):
+    root = gui.tk.Tk()
+    try:
+        yield from _canvas_cases(gui, root, netlist, repeat, seed)
+    finally:
+        netlist.listeners.clear()
+        root.destroy()
+
+
+def _canvas_cases(gui, root, netlist, repeat, seed):
+    generator = random.Random(seed)
+    app = gui.Application(root)
+    root.update()
+
+    def settle():
+        app.renderer.flush()
+        root.update_idletasks()
+
+    yield "load", measure(lambda: (app.set_netlist(netlist), settle()), 1)
+    yield "topological_sort", measure(lambda: app.topological_sort(app.gates), repeat, netlist.invalidate_levels)
+    app.simulation_running = True
+    yield "live_evaluation", measure(lambda: (app.live_evaluation(), settle()), repeat,
+                                     lambda: randomize_inputs(netlist, generator))
+    app.simulator.event_driven = False
+    yield "evaluate", measure(lambda: (app.simulator.evaluate(), settle()), repeat,
+                              lambda: randomize_inputs(netlist, generator))
+    views = list(app.visible_views)
+    if not views:
+        return
+
+    def press():
+        # Görünür bileşenlerin gövdelerine tıklanır; her tıklama bırakma ile tamamlanır
+        for _ in range(EVENTS_PER_SAMPLE):
+            x0, y0, x1, y1 = generator.choice(views).body_box()
+            x, y = app.viewport.to_screen((x0 + x1) / 2, (y0 + y1) / 2)
+            event = SimpleNamespace(x=x, y=y, num=1, delta=0)
+            app.handle_press(event)
+            app.handle_release(event)
+
+    yield "handle_press", measure(press, repeat)
+    gates = [view for view in views if isinstance(view, gui.Gate)]
+    if not gates:
+        return
+
+    def drag():
+        gate = generator.choice(gates)
+        for step in range(EVENTS_PER_SAMPLE):
+            gate.move(1 if step % 2 else -1, 0)
+        settle()
+
+    yield "gate_move", measure(drag, repeat)
+
+
+def summarize(samples):
+    return {
+        "repeat": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def circuits(generator_names, sizes, seed):
+    for name in generator_names:
+        if name == "iscas":
+            for circuit_name, (gate_count, _, _) in sorted(ISCAS_SIZES.items(), key=lambda item: item[1]):
+                yield ("iscas:" + circuit_name, gate_count,
+                       lambda circuit_name=circuit_name: iscas_like(circuit_name, seed))
+            continue
+        factory = GENERATORS[name]
+        for size in sizes:
+            if name == "random":
+                yield name, size, lambda size=size: factory(size, seed=seed)
+            else:
+                yield name, size, lambda size=size: factory(size)
+
+
+def run(generator_names, sizes, repeat=DEFAULT_REPEAT, canvas=False, canvas_max_gates=DEFAULT_CANVAS_MAX_GATES,
+        seed=0, log=None):
+    report = {
+        "version": REPORT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": [],
+    }
+    gui = None
+    if canvas:
+        gui = load_gui()
+        try:
+            gui.tk.Tk().destroy()
+        except gui.tk.TclError as error:
+            # Ekran yoksa (ör. CI) yalnızca başsız ölçümler yapılır
+            report["canvas_skipped"] = str(error)
+            gui = None
+    for name, size, factory in circuits(generator_names, sizes, seed):
+        start = time.perf_counter()
+        netlist = factory()
+        build_time = time.perf_counter() - start
+        modes = [("headless", headless_cases(netlist, repeat, seed))]
+        if gui is not None and len(netlist) <= canvas_max_gates:
+            modes.append(("canvas", canvas_cases(gui, netlist, repeat, seed)))
+        for mode, cases in modes:
+            for operation, samples in cases:
+                result = {
+                    "circuit": name,
+                    "size": size,
+                    "gates": len(netlist),
+                    "edges": len(netlist.edge_sources),
+                    "build": build_time,
+                    "mode": mode,
+                    "operation": operation,
+                }
+                result.update(summarize(samples))
+                report["results"].append(result)
+                if log is not None:
+                    log("%-16s %8d %-8s %-16s %12.6f s" % (name, len(netlist), mode, operation, result["median"]))
+    return report
+
+
+def result_key(result):
+    return result["circuit"], result["size"], result["mode"], result["operation"]
+
+
+def compare(old_report, new_report):
+    # Her iki raporda da bulunan ölçümler için (anahtar, eski, yeni, oran) satırları
+    old_results = {result_key(result): result for result in old_report["results"]}
+    rows = []
+    for result in new_report["results"]:
+        old = old_results.get(result_key(result))
+        if old is not None:
+            ratio = result["median"] / old["median"] if old["median"] else float("inf")
+            rows.append((result_key(result), old["median"], result["median"], ratio))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simülatör ölçüm takımı")
+    parser.add_argument("--generators", default="random,adder,multiplier,iscas",
+                        help="virgülle ayrılmış: %s, iscas" % ", ".join(GENERATORS))
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="yaklaşık kapı sayıları (ör. 10,1000,1000000)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--canvas", action="store_true", help="Tk tuvaliyle ölçümleri de çalıştır")
+    parser.add_argument("--canvas-max-gates", type=int, default=DEFAULT_CANVAS_MAX_GATES)
+    parser.add_argument("--output", help="JSON raporun yazılacağı dosya (varsayılan: standart çıkış)")
+    parser.add_argument("--compare", nargs=2, metavar=("ESKI", "YENI"), help="iki raporu karşılaştır")
+    arguments = parser.parse_args(argv)
+
+    if arguments.compare:
+        reports = []
+        for path in arguments.compare:
+            with open(path, encoding="utf-8") as stream:
+                reports.append(json.load(stream))
+        for (circuit, size, mode, operation), old, new, ratio in compare(*reports):
+            print("%-16s %8d %-8s %-16s %12.6f %12.6f %7.2fx" % (circuit, size, mode, operation, old, new, ratio))
+        return 0
+
+    sizes = [int(size) for size in arguments.sizes.split(",") if size]
+    report = run(arguments.generators.split(","), sizes, arguments.repeat, arguments.canvas,
+                 arguments.canvas_max_gates, arguments.seed, log=lambda line: print(line, file=sys.stderr))
+    text = json.dumps(report, indent=1)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as stream:
+            stream.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
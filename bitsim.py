@@ -0,0 +1,92 @@
+# Bit paralel simülasyon: her ağ keyfi genişlikte bir Python tamsayısıdır ve
+# tamsayının k. biti k. giriş örüntüsündeki değeri taşır. Böylece her kapı tek bir
+# bit düzeyi işlemle binlerce örüntüyü aynı anda değerlendirir.
+from compiler import compile_netlist
+
+DEFAULT_CHUNK_BITS = 12
+
+
+def exhaustive_word(index, bits):
+    # k. biti, k sayısının index. biti olan 2**bits genişliğinde kelime (ör. index=0 -> ...1010)
+    width = 1 << bits
+    if index >= bits:
+        raise ValueError("Giriş sırası kelime genişliğini aşıyor.")
+    period = 1 << (index + 1)
+    word = ((1 << (1 << index)) - 1) << (1 << index)
+    while period < width:
+        word |= word << period
+        period <<= 1
+    return word
+
+
+def pack_patterns(patterns, input_count):
+    # Örüntü listesini giriş başına bir kelimeye çevirir
+    words = [0] * input_count
+    for position, pattern in enumerate(patterns):
+        bit = 1 << position
+        for index, value in enumerate(pattern):
+            if value:
+                words[index] |= bit
+    return words
+
+
+def unpack_words(words, width):
+    return [tuple(bool(word >> position & 1) for word in words) for position in range(width)]
+
+
+class BitParallelSimulator:
+    def __init__(self, netlist):
+        self.netlist = netlist
+        self._program = None
+        self._program_version = -1
+
+    def compiled(self):
+        if self._program_version != self.netlist.version:
+            self._program = compile_netlist(self.netlist, words=True)
+            self._program_version = self.netlist.version
+        return self._program
+
+    def simulate_words(self, input_words, width):
+        # input_words netlist.inputs sırasındadır; çıkış kelimeleri netlist.outputs sırasıyla döner
+        return self.compiled()(input_words, (1 << width) - 1)
+
+    def simulate_patterns(self, patterns, chunk_size=1 << DEFAULT_CHUNK_BITS):
+        # Örüntüleri chunk_size'lık gruplar halinde paketleyip çıkış vektörlerini sırayla üretir
+        input_count = len(self.netlist.inputs)
+        chunk = []
+        for pattern in patterns:
+            chunk.append(pattern)
+            if len(chunk) == chunk_size:
+                yield from self._simulate_chunk(chunk, input_count)
+                chunk = []
+        if chunk:
+            yield from self._simulate_chunk(chunk, input_count)
+
+    def _simulate_chunk(self, chunk, input_count):
+        words = self.simulate_words(pack_patterns(chunk, input_count), len(chunk))
+        return unpack_words(words, len(chunk))
+
+    def truth_table_chunks(self, chunk_bits=DEFAULT_CHUNK_BITS, start=0, stop=None):
+        # Tüm giriş kombinasyonlarını 2**chunk_bits'lik parçalar halinde gezer.
+        # Örüntü numarası k iken i. giriş k'nın i. bitidir; (başlangıç, çıkış kelimeleri) üretilir.
+        input_count = len(self.netlist.inputs)
+        chunk_bits = min(chunk_bits, input_count)
+        width = 1 << chunk_bits
+        mask = (1 << width) - 1
+        low_words = [exhaustive_word(index, chunk_bits) for index in range(chunk_bits)]
+        if stop is None:
+            stop = 1 << input_count
+        program = self.compiled()
+        for base in range(start, stop, width):
+            high_words = [mask if base >> index & 1 else 0 for index in range(chunk_bits, input_count)]
+            yield base, program(low_words + high_words, mask)
+
+    def truth_table(self):
+        # Küçük devreler için çıkış başına tek bir 2**n bitlik kelime döndürür
+        input_count = len(self.netlist.inputs)
+        outputs = [0] * len(self.netlist.outputs)
+        chunk_bits = min(DEFAULT_CHUNK_BITS, input_count)
+        for base, words in self.truth_table_chunks(chunk_bits):
+            for index, word in enumerate(words):
+                outputs[index] |= word << base
+        return outputs
@@ -0,0 +1,160 @@
+# Ölçüm ve testler için parametreli devre üreteçleri.
+# Aynı tohum (seed) ve boyutla her çalıştırmada aynı devre üretilir.
+import math
+import random
+
+from netlist import Netlist, AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, INPUT, LAMP
+from importers import place_by_level
+from subcircuit import SubcircuitDefinition
+
+RANDOM_GATE_KINDS = (AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER)
+# Rastgele kapıların girişleri son eklenen bu kadar düğüm arasından seçilir (gerçek devrelerdeki yerellik)
+RANDOM_WINDOW = 256
+# ISCAS-85 devrelerinin kapı, giriş ve çıkış sayıları
+ISCAS_SIZES = {
+    "c17": (6, 5, 2),
+    "c432": (160, 36, 7),
+    "c499": (202, 41, 32),
+    "c880": (383, 60, 26),
+    "c1355": (546, 41, 32),
+    "c1908": (880, 33, 25),
+    "c2670": (1193, 233, 140),
+    "c3540": (1669, 50, 22),
+    "c5315": (2307, 178, 123),
+    "c6288": (2416, 32, 32),
+    "c7552": (3512, 207, 108),
+}
+
+
+def random_dag(gate_count, input_count=None, output_count=None, seed=0):
+    generator = random.Random(seed)
+    input_count = input_count or max(2, min(64, gate_count // 16))
+    output_count = output_count or max(1, min(64, gate_count // 32))
+    netlist = Netlist()
+    nodes = [netlist.add_node(INPUT, name="i%d" % index) for index in range(input_count)]
+    for index in range(gate_count):
+        kind = generator.choice(RANDOM_GATE_KINDS)
+        gate = netlist.add_node(kind, name="g%d" % index)
+        window = nodes[-RANDOM_WINDOW:]
+        for _ in range(1 if kind in (NOT, BUFFER) else 2):
+            netlist.connect(generator.choice(window), gate)
+        nodes.append(gate)
+    for gate in nodes[-output_count:]:
+        netlist.connect(gate, netlist.add_node(LAMP))
+    place_by_level(netlist)
+    return netlist
+
+
+def iscas_like(name, seed=0):
+    # Gerçek devre değil; ISCAS-85 devresiyle aynı boyutlarda rastgele bir DAG
+    gate_count, input_count, output_count = ISCAS_SIZES[name]
+    return random_dag(gate_count, input_count, output_count, seed)
+
+
+def _full_adder(netlist, a, b, carry):
+    partial = netlist.add_node(XOR)
+    netlist.connect(a, partial)
+    netlist.connect(b, partial)
+    total = netlist.add_node(XOR)
+    netlist.connect(partial, total)
+    netlist.connect(carry, total)
+    generate = netlist.add_node(AND)
+    netlist.connect(a, generate)
+    netlist.connect(b, generate)
+    propagate = netlist.add_node(AND)
+    netlist.connect(partial, propagate)
+    netlist.connect(carry, propagate)
+    carry_out = netlist.add_node(OR)
+    netlist.connect(generate, carry_out)
+    netlist.connect(propagate, carry_out)
+    return total, carry_out
+
+
+def ripple_adder(bits):
+    # Girişler a0..a(n-1), b0..b(n-1), elde; çıkışlar toplam bitleri ve son elde (5 kapı/bit)
+    netlist = Netlist()
+    a_inputs = [netlist.add_node(INPUT, name="a%d" % index) for index in range(bits)]
+    b_inputs = [netlist.add_node(INPUT, name="b%d" % index) for index in range(bits)]
+    carry = netlist.add_node(INPUT, name="cin")
+    sums = []
+    for a, b in zip(a_inputs, b_inputs):
+        total, carry = _full_adder(netlist, a, b, carry)
+        sums.append(total)
+    for net in sums + [carry]:
+        netlist.connect(net, netlist.add_node(LAMP))
+    place_by_level(netlist)
+    return netlist
+
+
+def block_adder(bits, block_bits=4):
+    # ripple_adder ile aynı girişler ve işlev; her block_bits bitlik dilim tek bir alt devre örneğidir
+    netlist = Netlist()
+    a_inputs = [netlist.add_node(INPUT, name="a%d" % index) for index in range(bits)]
+    b_inputs = [netlist.add_node(INPUT, name="b%d" % index) for index in range(bits)]
+    carry = netlist.add_node(INPUT, name="cin")
+    definitions = {}
+    sums = []
+    for start in range(0, bits, block_bits):
+        width = min(block_bits, bits - start)
+        if width not in definitions:
+            definitions[width] = SubcircuitDefinition("ADD%d" % width, ripple_adder(width))
+        outputs = netlist.add_instance(definitions[width])
+        for net in a_inputs[start:start + width] + b_inputs[start:start + width] + [carry]:
+            netlist.connect(net, outputs[0])
+        sums.extend(outputs[:width])
+        carry = outputs[width]
+    for net in sums + [carry]:
+        netlist.connect(net, netlist.add_node(LAMP))
+    place_by_level(netlist)
+    return netlist
+
+
+def array_multiplier(bits):
+    # Kısmi çarpımlar AND, satırlar ripple toplayıcı zinciridir (yaklaşık 6 kapı/bit^2)
+    netlist = Netlist()
+    a_inputs = [netlist.add_node(INPUT, name="a%d" % index) for index in range(bits)]
+    b_inputs = [netlist.add_node(INPUT, name="b%d" % index) for index in range(bits)]
+    zero = netlist.add_node(AND)
+
+    def partial_product(a, b):
+        gate = netlist.add_node(AND)
+        netlist.connect(a, gate)
+        netlist.connect(b, gate)
+        return gate
+
+    row = [partial_product(a, b_inputs[0]) for a in a_inputs] + [zero]
+    products = [row[0]]
+    for b in b_inputs[1:]:
+        carry = zero
+        next_row = []
+        for index, a in enumerate(a_inputs):
+            total, carry = _full_adder(netlist, partial_product(a, b), row[index + 1], carry)
+            next_row.append(total)
+        row = next_row + [carry]
+        products.append(row[0])
+    products.extend(row[1:])
+    for net in products:
+        netlist.connect(net, netlist.add_node(LAMP))
+    place_by_level(netlist)
+    return netlist
+
+
+def adder_for_size(gate_count):
+    return ripple_adder(max(1, gate_count // 5))
+
+
+def block_adder_for_size(gate_count):
+    # 4 bitlik dilim başına 5 çıkış düğümü
+    return block_adder(max(1, gate_count * 4 // 5))
+
+
+def multiplier_for_size(gate_count):
+    return array_multiplier(max(2, int(math.sqrt(gate_count / 6))))
+
+
+GENERATORS = {
+    "random": random_dag,
+    "adder": adder_for_size,
+    "block_adder": block_adder_for_size,
+    "multiplier": multiplier_for_size,
+}
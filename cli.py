@@ -0,0 +1,341 @@
+# Arayüzsüz komut satırı. tkinter hiç içe aktarılmaz; kayıtlı (.devre/.devreb) ya da içe aktarılan
+# (.bench/.blif/.v) devreler yüklenir ve vektörler dosyadan ya da standart girişten akış halinde işlenir.
+# Vektörler blok blok okunup kelimelere paketlenir, bit paralel simüle edilir ve çıkışlar bloklar
+# halinde yazılır; bellek kullanımı vektör sayısından bağımsızdır.
+#
+#   python cli.py simulate devre.devre < vektorler.txt > cikislar.txt
+#   python cli.py simulate devre.bench --format binary --vectors vektorler.bin
+#   python cli.py truth-table devre.devre --workers 8
+#   python cli.py equivalent eski.devre yeni.bench --method bdd
+#   python cli.py lights devre.devre --output led0
+#   python cli.py faults devre.devre --random 4096
+#
+# Metin biçiminde her satır netlist.inputs sırasıyla 0/1 karakterleridir (boş satırlar ve # yorumları
+# atlanır); çıkış satırları netlist.outputs sırasıyla yazılır. İkili biçimde her vektör ceil(n/8)
+# bayttır ve i. giriş (i // 8). baytın (i % 8). bitidir (en düşük bit önce); çıkışlar da aynı biçimdedir.
+import argparse
+import os
+import sys
+
+import importers
+import storage
+from bdd import NodeLimitError, ORDERINGS, SymbolicSimulator, symbolic_counterexample
+from bitsim import BitParallelSimulator, exhaustive_word, pack_patterns, DEFAULT_CHUNK_BITS
+from faultsim import FaultSimulator, random_patterns
+from netlist import NetlistError
+from parallel import decode_shard, find_counterexample, truth_table_shards
+
+DEFAULT_BLOCK_SIZE = 4096
+READ_SIZE = 1 << 16
+# Bayt -> o baytın b. biti ('0'/'1'); ikili vektör sütunlarını metin sütunlarına çevirmek için
+BIT_TABLES = [bytes(b"01"[byte >> bit & 1] for byte in range(256)) for bit in range(8)]
+# '0'/'1' -> 0/1 baytı
+DIGIT_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def load_circuit(path):
+    # İçe aktarma biçimleri uzantıdan, kayıt biçimleri dosya başlığından anlaşılır
+    if os.path.splitext(path)[1].lower() in importers.IMPORTERS:
+        return importers.import_file(path)
+    return storage.load(path)
+
+
+def column_word(column):
+    # k. karakteri k. vektörün değeri olan '0'/'1' sütunu -> k. biti o değer olan kelime
+    return int(column[::-1], 2) if column else 0
+
+
+def word_column(word, width):
+    return bin(word)[2:].zfill(width)[::-1].encode("ascii")
+
+
+def interleave(columns, width, separator=b"\n"):
+    # Eşit uzunluklu sütunları satırlara dönüştürür: k. satır her sütunun k. karakteridir
+    stride = len(columns) + len(separator)
+    rows = bytearray(stride * width)
+    for position, column in enumerate(columns):
+        rows[position::stride] = column
+    for offset, character in enumerate(separator):
+        rows[len(columns) + offset::stride] = bytes([character]) * width
+    return bytes(rows)
+
+
+def _clean_line(line):
+    return line.split(b"#", 1)[0].strip().replace(b" ", b"").replace(b"_", b"")
+
+
+def read_text_blocks(stream, input_count, block_size=DEFAULT_BLOCK_SIZE):
+    # (giriş kelimeleri, vektör sayısı) blokları üretir. Satırların hepsi tam genişlikteyse sütunlar
+    # doğrudan bayt dilimleriyle alınır; değilse satırlar tek tek temizlenip denetlenir.
+    pending = []
+    carry = b""
+    number = 0
+    while True:
+        data = stream.read(READ_SIZE)
+        if data:
+            lines = (carry + data).split(b"\n")
+            carry = lines.pop()
+        else:
+            lines = [carry] if carry else []
+            carry = b""
+        if lines:
+            if set(map(len, lines)) != {input_count} or b"".join(lines).translate(None, b"01"):
+                cleaned = []
+                for offset, line in enumerate(lines, number + 1):
+                    line = _clean_line(line)
+                    if not line:
+                        continue
+                    if len(line) != input_count or line.strip(b"01"):
+                        raise NetlistError("Satır %d: %d bitlik 0/1 vektörü bekleniyordu: %r"
+                                           % (offset, input_count, line.decode("ascii", "replace")))
+                    cleaned.append(line)
+                number += len(lines)
+                lines = cleaned
+            else:
+                number += len(lines)
+            pending.extend(lines)
+        while len(pending) >= block_size or (pending and not data):
+            block = pending[:block_size]
+            del pending[:block_size]
+            rows = b"".join(block)
+            yield [column_word(rows[index::input_count]) for index in range(input_count)], len(block)
+        if not data:
+            return
+
+
+def read_binary_blocks(stream, input_count, block_size=DEFAULT_BLOCK_SIZE):
+    size = (input_count + 7) // 8
+    if not size:
+        raise NetlistError("Girişi olmayan devre için ikili vektör okunamaz.")
+    while True:
+        data = stream.read(size * block_size)
+        if not data:
+            return
+        while len(data) % size:
+            more = stream.read(size - len(data) % size)
+            if not more:
+                raise NetlistError("İkili vektör akışı yarım bir vektörle bitiyor.")
+            data += more
+        columns = [data[index::size] for index in range(size)]
+        yield [column_word(columns[index >> 3].translate(BIT_TABLES[index & 7]))
+               for index in range(input_count)], len(data) // size
+
+
+def write_text_blocks(blocks):
+    # (çıkış kelimeleri, vektör sayısı) bloklarını metin satırlarına çevirir
+    for words, width in blocks:
+        yield interleave([word_column(word, width) for word in words], width)
+
+
+def write_binary_blocks(blocks):
+    for words, width in blocks:
+        size = (len(words) + 7) // 8
+        rows = bytearray(size * width)
+        for index in range(size):
+            # Her vektörün baytı, 0/1 baytlarından oluşan sütunların kaydırılmış toplamıdır
+            column = 0
+            for bit, word in enumerate(words[index * 8:index * 8 + 8]):
+                column += int.from_bytes(word_column(word, width).translate(DIGIT_BYTES), "little") << bit
+            rows[index::size] = column.to_bytes(width, "little")
+        yield bytes(rows)
+
+
+def simulate_blocks(netlist, blocks):
+    simulator = BitParallelSimulator(netlist)
+    for input_words, width in blocks:
+        yield simulator.simulate_words(input_words, width), width
+
+
+def simulate_stream(netlist, source, target, binary=False, block_size=DEFAULT_BLOCK_SIZE):
+    # source ve target ikili kipte açılmış akışlardır; yazılan vektör sayısı döndürülür
+    input_count = len(netlist.input_ids)
+    reader = read_binary_blocks if binary else read_text_blocks
+    count = 0
+
+    def counted(blocks):
+        nonlocal count
+        for words, width in blocks:
+            count += width
+            yield words, width
+
+    outputs = simulate_blocks(netlist, counted(reader(source, input_count, block_size)))
+    for chunk in (write_binary_blocks(outputs) if binary else write_text_blocks(outputs)):
+        target.write(chunk)
+    return count
+
+
+def truth_table_rows(netlist, workers=1, chunk_bits=DEFAULT_CHUNK_BITS):
+    # "girişler çıkışlar" satırları, vektör numarası sırasıyla (i. giriş numaranın i. bitidir)
+    input_count = len(netlist.input_ids)
+    output_count = len(netlist.output_ids)
+    chunk_bits = min(chunk_bits, input_count)
+    width = 1 << chunk_bits
+    mask = (1 << width) - 1
+    low_words = [exhaustive_word(index, chunk_bits) for index in range(chunk_bits)]
+
+    def rows(base, output_words):
+        input_words = low_words + [mask if base >> index & 1 else 0 for index in range(chunk_bits, input_count)]
+        columns = [word_column(word, width) for word in input_words]
+        columns.append(b" " * width)
+        columns.extend(word_column(word, width) for word in output_words)
+        return interleave(columns, width)
+
+    if workers <= 1:
+        for base, words in BitParallelSimulator(netlist).truth_table_chunks(chunk_bits):
+            yield rows(base, words)
+        return
+    # Parçalar bitiş sırasıyla gelir; sıradaki parça gelene kadar diğerleri bekletilir
+    finished = {}
+    expected = 0
+    for start, stop, payload in truth_table_shards(netlist, workers, chunk_bits):
+        finished[start] = (stop, payload)
+        while expected in finished:
+            stop, payload = finished.pop(expected)
+            words = decode_shard(payload, output_count, input_count, chunk_bits)
+            for base in range(expected, stop, width):
+                shift = base - expected
+                yield rows(base, [word >> shift & mask for word in words])
+            expected = stop
+
+
+def grade_faults(netlist, blocks):
+    simulator = FaultSimulator(netlist)
+    for input_words, width in blocks:
+        simulator.simulate_block(input_words, width)
+        if not simulator.remaining:
+            break
+    return simulator.coverage
+
+
+def random_blocks(input_count, count, seed, block_size=DEFAULT_BLOCK_SIZE):
+    patterns = random_patterns(input_count, count, seed)
+    while count > 0:
+        width = min(block_size, count)
+        yield pack_patterns([next(patterns) for _ in range(width)], input_count), width
+        count -= width
+
+
+def counterexample(first, second, method="auto", workers=None):
+    # auto: önce BDD ile denenir; düğüm sınırı aşılırsa kapsamlı simülasyona geçilir
+    if method != "exhaustive":
+        try:
+            return symbolic_counterexample(first, second)
+        except NodeLimitError:
+            if method == "bdd":
+                raise
+            print("BDD çok büyüdü; kapsamlı simülasyona geçiliyor.", file=sys.stderr)
+    return find_counterexample(first, second, workers)
+
+
+def output_id(netlist, key):
+    # Çıkış adı ya da çıkış sırası
+    for position, node_id in enumerate(netlist.output_ids):
+        if netlist.names.get(node_id) == key or str(position) == key:
+            return node_id
+    raise NetlistError("Bilinmeyen çıkış: %s" % key)
+
+
+def lighting_lines(netlist, keys=None, limit=20, order="dfs"):
+    # Her çıkış için yakan giriş birleşimlerinin sayısı ve en fazla limit kadar küb ('-' önemsiz giriş)
+    simulator = SymbolicSimulator(netlist, order=ORDERINGS[order](netlist))
+    node_ids = netlist.output_ids if not keys else [output_id(netlist, key) for key in keys]
+    for node_id in node_ids:
+        position = netlist.output_ids.index(node_id)
+        name = netlist.names.get(node_id) or str(position)
+        yield "%s: %d / %d birleşim" % (name, simulator.count(node_id), 1 << len(netlist.input_ids))
+        cubes = simulator.lighting_inputs(node_id, limit + 1)
+        for cube in cubes[:limit]:
+            yield "  " + cube
+        if len(cubes) > limit:
+            yield "  ..."
+
+
+def open_source(path):
+    return sys.stdin.buffer if path in (None, "-") else open(path, "rb")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arayüzsüz devre simülasyonu")
+    commands = parser.add_subparsers(dest="command", required=True)
+    simulate = commands.add_parser("simulate", help="vektörleri simüle edip çıkışları yaz")
+    simulate.add_argument("circuit")
+    simulate.add_argument("--vectors", default="-", help="vektör dosyası (varsayılan: standart giriş)")
+    simulate.add_argument("--output", default="-", help="çıkış dosyası (varsayılan: standart çıkış)")
+    simulate.add_argument("--format", choices=("text", "binary"), default="text")
+    simulate.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    table = commands.add_parser("truth-table", help="tüm giriş kombinasyonları için çıkışları yaz")
+    table.add_argument("circuit")
+    table.add_argument("--workers", type=int, default=1)
+    equivalent = commands.add_parser("equivalent", help="iki devrenin eşdeğerliğini denetle")
+    equivalent.add_argument("first")
+    equivalent.add_argument("second")
+    equivalent.add_argument("--workers", type=int, default=None)
+    equivalent.add_argument("--method", choices=("auto", "bdd", "exhaustive"), default="auto")
+    lights = commands.add_parser("lights", help="çıkışları ve LED'leri yakan giriş birleşimlerini listele")
+    lights.add_argument("circuit")
+    lights.add_argument("--output", action="append", help="çıkış adı ya da sırası (tekrarlanabilir; varsayılan: hepsi)")
+    lights.add_argument("--limit", type=int, default=20, help="çıkış başına listelenecek küb sayısı")
+    lights.add_argument("--order", choices=sorted(ORDERINGS), default="dfs", help="BDD değişken sırası")
+    faults = commands.add_parser("faults", help="takılı 0/1 hata kapsamasını ölç")
+    faults.add_argument("circuit")
+    faults.add_argument("--vectors", help="vektör dosyası ('-' standart giriş)")
+    faults.add_argument("--format", choices=("text", "binary"), default="text")
+    faults.add_argument("--random", type=int, default=0, help="vektör dosyası yerine bu kadar rastgele vektör")
+    faults.add_argument("--seed", type=int, default=0)
+    faults.add_argument("--report", type=int, default=10, help="listelenecek algılanmamış hata sayısı")
+    arguments = parser.parse_args(argv)
+
+    try:
+        if arguments.command == "equivalent":
+            found = counterexample(load_circuit(arguments.first), load_circuit(arguments.second),
+                                   arguments.method, arguments.workers)
+            if found is None:
+                print("Eşdeğer")
+                return 0
+            print("Karşı örnek: %s" % "".join("1" if value else "0" for value in found))
+            return 1
+        circuit = load_circuit(arguments.circuit)
+        if arguments.command == "simulate":
+            source = open_source(arguments.vectors)
+            target = sys.stdout.buffer if arguments.output == "-" else open(arguments.output, "wb")
+            try:
+                simulate_stream(circuit, source, target, arguments.format == "binary", arguments.block_size)
+            finally:
+                target.flush()
+                if source is not sys.stdin.buffer:
+                    source.close()
+                if target is not sys.stdout.buffer:
+                    target.close()
+        elif arguments.command == "lights":
+            for line in lighting_lines(circuit, arguments.output, arguments.limit, arguments.order):
+                print(line)
+        elif arguments.command == "truth-table":
+            for chunk in truth_table_rows(circuit, arguments.workers):
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+        else:
+            input_count = len(circuit.input_ids)
+            if arguments.random:
+                blocks = random_blocks(input_count, arguments.random, arguments.seed)
+                coverage = grade_faults(circuit, blocks)
+            else:
+                reader = read_binary_blocks if arguments.format == "binary" else read_text_blocks
+                source = open_source(arguments.vectors)
+                try:
+                    coverage = grade_faults(circuit, reader(source, input_count))
+                finally:
+                    if source is not sys.stdin.buffer:
+                        source.close()
+            for line in coverage.summary_lines(circuit, arguments.report):
+                print(line)
+    except BrokenPipeError:
+        # Çıkış erkenden kapatıldı (ör. "| head"); kalan vektörler işlenmez
+        return 0
+    except (OSError, NetlistError) as error:
+        print("Hata: %s" % error, file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+# Simülasyon sunucusu için küçük, eşzamanlı (senkron) istemci. Bağlantılar bir havuzda tutulur ve
+# yeniden kullanılır; her iş parçacığı havuzdan boşta bir bağlantı alır, yoksa havuz sınırına kadar
+# yenisini açar, sınıra ulaşıldıysa bir bağlantı geri bırakılana (ya da bozulup kapatılana) kadar bekler.
+#
+#   with SimulationClient("/tmp/devre.sock") as client:
+#       circuit = client.load(path="toplayici.devre")
+#       client.evaluate(circuit, ["000000000", "111111111"])
+import itertools
+import json
+import queue
+import socket
+import threading
+
+from netlist import NetlistError
+from server import LOCAL_HOST, parse_address
+
+DEFAULT_POOL_SIZE = 4
+
+
+class Connection:
+    def __init__(self, address, timeout=None):
+        path, port = parse_address(address)
+        if path is not None:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(path)
+        else:
+            self.socket = socket.create_connection((LOCAL_HOST, port), timeout=timeout)
+        self.stream = self.socket.makefile("rwb")
+        self.ids = itertools.count(1)
+
+    def send(self, operation, params):
+        request_id = next(self.ids)
+        request = dict(params, op=operation, id=request_id)
+        self.stream.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        return request_id
+
+    def receive(self, request_id):
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("Sunucu bağlantıyı kapattı.")
+        response = json.loads(line)
+        if response.get("id") != request_id:
+            raise ConnectionError("Beklenmeyen yanıt kimliği: %r" % (response.get("id"),))
+        return response
+
+    def exchange(self, requests):
+        # Tek istek sunucu tarafından tamamı okunduktan sonra yanıtlanır; sırayla yazıp okumak yeterlidir
+        if len(requests) == 1:
+            request_id = self.send(*requests[0])
+            self.stream.flush()
+            return [self.receive(request_id)]
+        # Birden çok istekte yanıtlar gönderim sürerken ayrı bir iş parçacığında okunur. Önce hepsini
+        # yazmak, tamponlar dolunca sunucuyu drain'de, istemciyi gönderimde bekletip kilitler.
+        sent = queue.SimpleQueue()
+        responses = []
+        failures = []
+        reader = threading.Thread(target=self._read_responses, args=(sent, responses, failures), daemon=True)
+        reader.start()
+        try:
+            for operation, params in requests:
+                sent.put(self.send(operation, params))
+            self.stream.flush()
+        except BaseException:
+            # Okuyan taraf gelmeyecek yanıtları beklemesin
+            self._shutdown()
+            raise
+        finally:
+            sent.put(None)
+            reader.join()
+        if failures:
+            raise failures[0]
+        return responses
+
+    def _read_responses(self, sent, responses, failures):
+        try:
+            for request_id in iter(sent.get, None):
+                responses.append(self.receive(request_id))
+        except BaseException as error:
+            failures.append(error)
+            # Gönderen taraf okunmayan yanıtlar yüzünden tıkanmasın
+            self._shutdown()
+
+    def _shutdown(self):
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def close(self):
+        self.stream.close()
+        self.socket.close()
+
+
+class SimulationClient:
+    def __init__(self, address, pool_size=DEFAULT_POOL_SIZE, timeout=None):
+        self.address = address
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.idle = queue.LifoQueue()
+        # Havuzdaki yer sayısı; bağlantı sağlam ya da bozuk geri verilsin, yer her durumda boşalır
+        self.slots = threading.BoundedSemaphore(pool_size)
+        self.opened = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _acquire(self):
+        self.slots.acquire()
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            connection = Connection(self.address, self.timeout)
+        except BaseException:
+            self.slots.release()
+            raise
+        with self._lock:
+            self.opened += 1
+        return connection
+
+    def _release(self, connection, healthy):
+        try:
+            if healthy:
+                self.idle.put(connection)
+            else:
+                # Yarım kalmış bir konuşmadan sonra bağlantının durumu belirsizdir; kapatılır
+                connection.close()
+                with self._lock:
+                    self.opened -= 1
+        finally:
+            self.slots.release()
+
+    def pipeline(self, requests):
+        # requests: (işlem, parametreler) çiftleri. Hepsi aynı bağlantıdan yanıt beklenmeden
+        # gönderilir, yanıtlar sırayla okunur. Her eleman için yanıt sözlüğü döner.
+        requests = list(requests)
+        if not requests:
+            return []
+        connection = self._acquire()
+        healthy = False
+        try:
+            responses = connection.exchange(requests)
+            healthy = True
+        finally:
+            self._release(connection, healthy)
+        return responses
+
+    def request(self, operation, **params):
+        response = self.pipeline([(operation, params)])[0]
+        if "error" in response:
+            raise NetlistError(response["error"])
+        return response["result"]
+
+    def batch(self, requests):
+        # Sunucuda tek istekte sırayla uygulanır; her eleman {"result": ...} ya da {"error": ...}
+        return self.request("batch", requests=[dict(params, op=operation) for operation, params in requests])
+
+    def close(self):
+        while True:
+            try:
+                connection = self.idle.get_nowait()
+            except queue.Empty:
+                return
+            connection.close()
+            with self._lock:
+                self.opened -= 1
+
+    # Kısayollar
+
+    def load(self, path=None, text=None):
+        params = {"path": path} if text is None else {"text": text}
+        return self.request("load", **params)["circuit"]
+
+    def evaluate(self, circuit, vectors):
+        return self.request("evaluate", circuit=circuit, vectors=list(vectors))
+
+    def toggle(self, circuit, inputs):
+        return self.request("toggle", circuit=circuit, inputs=list(inputs))
+
+    def truth_table(self, circuit):
+        # Her çıkışın doğruluk tablosu tamsayı olarak (bit i = i. giriş birleşimi)
+        return [int(word, 16) for word in self.request("truth_table", circuit=circuit)]
+
+    def unload(self, circuit):
+        return self.request("unload", circuit=circuit)
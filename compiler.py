@@ -0,0 +1,126 @@
+# Seviyelendirilmiş devreyi tek bir düz (dallanmasız) Python fonksiyonuna derler.
+# Her ağ üretilen fonksiyonda bir yerel değişkendir: n<düğüm kimliği>
+# Kelime kipinde her ağ, her biti ayrı bir giriş örüntüsü olan bir tamsayıdır.
+# Alt devre örneğinin satırı r<ilk çıkış kimliği> değişkenine bir kez okunur, çıkışlar ondan alınır.
+from netlist import AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, INPUT, OUTPUT, LAMP, SUBCIRCUIT
+
+FUNCTION_NAME = "evaluate_circuit"
+WORD_FUNCTION_NAME = "evaluate_words"
+
+
+def gate_expression(kind, operands):
+    # Kurallar netlist.GATE_FUNCTIONS ile aynıdır; girişsiz kapılar False verir
+    if not operands:
+        return "False"
+    if kind in (AND, NAND):
+        expression = " and ".join(operands)
+        return "(%s)" % expression if kind == AND else "not (%s)" % expression
+    if kind in (OR, NOR, OUTPUT, LAMP):
+        expression = " or ".join(operands)
+        return "not (%s)" % expression if kind == NOR else "(%s)" % expression
+    if kind == XOR:
+        return "(%s ^ %s)" % tuple(operands) if len(operands) == 2 else "False"
+    if kind == XNOR:
+        return "((%s) or not (%s))" % (" and ".join(operands), " or ".join(operands))
+    if kind == NOT:
+        return "not %s" % operands[0]
+    if kind == BUFFER:
+        return operands[0]
+    raise ValueError("Derlenemeyen kapı türü: %s" % kind)
+
+
+def word_expression(kind, operands):
+    # Bit paralel karşılıklar; "mask" örüntü genişliği kadar 1 bitidir
+    if not operands:
+        return "0"
+    if kind in (AND, NAND):
+        expression = " & ".join(operands)
+        return "(%s)" % expression if kind == AND else "(~(%s) & mask)" % expression
+    if kind in (OR, NOR, OUTPUT, LAMP):
+        expression = " | ".join(operands)
+        return "(~(%s) & mask)" % expression if kind == NOR else "(%s)" % expression
+    if kind == XOR:
+        return "(%s ^ %s)" % tuple(operands) if len(operands) == 2 else "0"
+    if kind == XNOR:
+        return "((%s) | (~(%s) & mask))" % (" & ".join(operands), " | ".join(operands))
+    if kind == NOT:
+        return "(~%s & mask)" % operands[0]
+    if kind == BUFFER:
+        return operands[0]
+    raise ValueError("Derlenemeyen kapı türü: %s" % kind)
+
+
+def index_expression(operands):
+    # Tablo satır numarası: i. pin i. bittir
+    if not operands:
+        return "0"
+    return "(%s)" % " | ".join(operand if position == 0 else "%s << %d" % (operand, position)
+                               for position, operand in enumerate(operands))
+
+
+def subcircuit_lines(netlist, node_id, operands, constants, rows, words):
+    # Tablolar T<sıra>, tanımlar D<sıra> adlı sabitler olarak üretilen fonksiyona verilir
+    definition, output_index = netlist.subcircuits[node_id]
+    base = node_id - output_index
+    lines = []
+    if base not in rows:
+        rows.add(base)
+        number = list(netlist.definitions).index(definition.name)
+        if words:
+            constants["D%d" % number] = definition
+            lines.append("    r%d = D%d.evaluate_words([%s], mask)" % (base, number, ", ".join(operands)))
+        else:
+            constants["T%d" % number] = definition.rows
+            lines.append("    r%d = T%d[%s]" % (base, number, index_expression(operands)))
+    lines.append("    n%d = r%d[%d]" % (node_id, base, output_index))
+    return lines
+
+
+def generate_source(netlist, constants=None):
+    # constants verilirse alt devre tanımları bu sözlüğe eklenir (compile_netlist ad alanı olarak kullanır)
+    constants = {} if constants is None else constants
+    rows = set()
+    lines = ["def %s(values):" % FUNCTION_NAME]
+    for node_id in netlist.topological_ids():
+        kind = netlist.kind(node_id)
+        if kind == INPUT:
+            lines.append("    n%d = values[%d]" % (node_id, node_id))
+        elif kind == SUBCIRCUIT:
+            operands = ["n%d" % input_id for input_id in netlist.fanin_ids(node_id)]
+            lines.extend(subcircuit_lines(netlist, node_id, operands, constants, rows, False))
+        else:
+            operands = ["n%d" % input_id for input_id in netlist.fanin_ids(node_id)]
+            lines.append("    n%d = %s" % (node_id, gate_expression(kind, operands)))
+    lines.append("    return [%s]" % ", ".join("n%d" % node_id for node_id in range(len(netlist))))
+    return "\n".join(lines) + "\n"
+
+
+def generate_word_source(netlist, constants=None, all_nodes=False):
+    # Girişler netlist.inputs sırasıyla alınır; çıkış ve LED kelimeleri, all_nodes verilirse
+    # kimlik sırasıyla tüm düğümlerin kelimeleri döndürülür
+    constants = {} if constants is None else constants
+    rows = set()
+    input_positions = {node_id: position for position, node_id in enumerate(netlist.input_ids)}
+    lines = ["def %s(inputs, mask):" % WORD_FUNCTION_NAME]
+    for node_id in netlist.topological_ids():
+        kind = netlist.kind(node_id)
+        if kind == INPUT:
+            lines.append("    n%d = inputs[%d]" % (node_id, input_positions[node_id]))
+        elif kind == SUBCIRCUIT:
+            operands = ["n%d" % input_id for input_id in netlist.fanin_ids(node_id)]
+            lines.extend(subcircuit_lines(netlist, node_id, operands, constants, rows, True))
+        else:
+            operands = ["n%d" % input_id for input_id in netlist.fanin_ids(node_id)]
+            lines.append("    n%d = %s" % (node_id, word_expression(kind, operands)))
+    returned = range(len(netlist)) if all_nodes else netlist.output_ids
+    lines.append("    return [%s]" % ", ".join("n%d" % node_id for node_id in returned))
+    return "\n".join(lines) + "\n"
+
+
+def compile_netlist(netlist, words=False, all_nodes=False):
+    namespace = {}
+    if words:
+        exec(compile(generate_word_source(netlist, namespace, all_nodes), "<devre>", "exec"), namespace)
+        return namespace[WORD_FUNCTION_NAME]
+    exec(compile(generate_source(netlist, namespace), "<devre>", "exec"), namespace)
+    return namespace[FUNCTION_NAME]
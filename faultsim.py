@@ -0,0 +1,287 @@
+# Paralel örüntülü, tek hatalı (PPSFP) stuck-at hata simülasyonu.
+# Bir test vektörü kümesi blok blok kelimelere paketlenir; her blok için önce hatasız devre bit
+# paralel olarak bir kez değerlendirilir. Ardından her hata için yalnızca hatalı düğümün çıkış
+# konisi, seviye sırasıyla ve hatasız değerden ayrılan kapılar üzerinden yeniden hesaplanır.
+# Bir çıkışta ya da LED'de fark görülen hata algılanmıştır ve sonraki bloklarda simüle edilmez.
+import heapq
+import random
+
+from bitsim import pack_patterns
+from compiler import compile_netlist
+from netlist import NetlistError, AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, OUTPUT, LAMP
+
+DEFAULT_BLOCK_SIZE = 256
+# Bir hata (düğüm kimliği, takılı değer) çiftidir
+STUCK_AT_0 = 0
+STUCK_AT_1 = 1
+
+
+def _and(words, inputs, mask):
+    if not inputs:
+        return 0
+    result = mask
+    for input_id in inputs:
+        result &= words[input_id]
+    return result
+
+
+def _or(words, inputs, mask):
+    result = 0
+    for input_id in inputs:
+        result |= words[input_id]
+    return result
+
+
+def _nand(words, inputs, mask):
+    return _and(words, inputs, mask) ^ mask if inputs else 0
+
+
+def _nor(words, inputs, mask):
+    return _or(words, inputs, mask) ^ mask if inputs else 0
+
+
+def _xor(words, inputs, mask):
+    return words[inputs[0]] ^ words[inputs[1]] if len(inputs) == 2 else 0
+
+
+def _xnor(words, inputs, mask):
+    # Kural netlist.GATE_FUNCTIONS ile aynıdır: tüm girişler eşitse 1
+    if not inputs:
+        return 0
+    return _and(words, inputs, mask) | (_or(words, inputs, mask) ^ mask)
+
+
+def _not(words, inputs, mask):
+    return words[inputs[0]] ^ mask if inputs else 0
+
+
+def _buffer(words, inputs, mask):
+    return words[inputs[0]] if inputs else 0
+
+
+def _lookup(definition, output_index):
+    def evaluate(words, inputs, mask):
+        return definition.evaluate_words([words[input_id] for input_id in inputs], mask)[output_index]
+    return evaluate
+
+
+# compiler.word_expression ile aynı kurallar; değerler kelime listesinden okunur
+EVALUATORS = {
+    AND: _and,
+    OR: _or,
+    NAND: _nand,
+    NOR: _nor,
+    XOR: _xor,
+    XNOR: _xnor,
+    NOT: _not,
+    BUFFER: _buffer,
+    OUTPUT: _or,
+    LAMP: _or,
+}
+
+
+def all_faults(netlist, node_ids=None):
+    # Verilen (varsayılan: tüm) düğümlerin çıkışlarında takılı 0 ve takılı 1 hataları
+    node_ids = range(len(netlist)) if node_ids is None else node_ids
+    return [(node_id, value) for node_id in node_ids for value in (STUCK_AT_0, STUCK_AT_1)]
+
+
+def fault_name(netlist, fault):
+    node_id, value = fault
+    name = netlist.names.get(node_id) or "%s#%d" % (netlist.kind(node_id), node_id)
+    return "%s/SA%d" % (name, value)
+
+
+def random_patterns(input_count, count, seed=0):
+    generator = random.Random(seed)
+    for _ in range(count):
+        word = generator.getrandbits(input_count) if input_count else 0
+        yield tuple(bool(word >> index & 1) for index in range(input_count))
+
+
+def read_vectors(lines, input_count):
+    # Her satır netlist.inputs sırasıyla 0/1 karakterleridir; boş satırlar ve # yorumları atlanır
+    for number, line in enumerate(lines, 1):
+        line = line.split("#", 1)[0].strip().replace(" ", "").replace("_", "")
+        if not line:
+            continue
+        if len(line) != input_count or line.strip("01"):
+            raise NetlistError("Satır %d: %d bitlik 0/1 vektörü bekleniyordu: %r" % (number, input_count, line))
+        yield tuple(character == "1" for character in line)
+
+
+class FaultCoverage:
+    def __init__(self, faults):
+        self.faults = list(faults)
+        # Algılanan hata -> onu ilk algılayan vektörün sırası
+        self.detected = {}
+        self.patterns = 0
+
+    @property
+    def undetected(self):
+        return [fault for fault in self.faults if fault not in self.detected]
+
+    def coverage(self):
+        return len(self.detected) / len(self.faults) if self.faults else 1.0
+
+    def summary_lines(self, netlist, count=10):
+        lines = ["Vektör: %d  Hata: %d  Algılanan: %d  Kapsama: %%%.2f" % (
+            self.patterns, len(self.faults), len(self.detected), 100 * self.coverage())]
+        undetected = self.undetected
+        for fault in undetected[:count]:
+            lines.append("Algılanmadı: %s" % fault_name(netlist, fault))
+        if len(undetected) > count:
+            lines.append("... ve %d hata daha" % (len(undetected) - count))
+        return lines
+
+
+class FaultSimulator:
+    def __init__(self, netlist, faults=None):
+        self.netlist = netlist
+        self.coverage = FaultCoverage(all_faults(netlist) if faults is None else faults)
+        # Henüz algılanmamış hatalar; algılananlar listeden düşürülür
+        self.remaining = list(self.coverage.faults)
+        self.nodes_evaluated = 0
+        self._version = -1
+
+    def _refresh(self):
+        # Derlenmiş program, bağlantı demetleri ve seviyeler topoloji değişene kadar önbellekte tutulur
+        netlist = self.netlist
+        if self._version == netlist.version:
+            return
+        netlist.topological_ids()
+        count = len(netlist)
+        self.program = compile_netlist(netlist, words=True, all_nodes=True)
+        self.fanin = [tuple(netlist.fanin_ids(node_id)) for node_id in range(count)]
+        self.fanout = [tuple(netlist.fanout_ids(node_id)) for node_id in range(count)]
+        self.levels = list(netlist.node_levels)
+        self.evaluators = [EVALUATORS.get(netlist.kind(node_id)) for node_id in range(count)]
+        for node_id, (definition, output_index) in netlist.subcircuits.items():
+            self.evaluators[node_id] = _lookup(definition, output_index)
+        self.observed = bytearray(count)
+        for node_id in netlist.output_ids:
+            self.observed[node_id] = 1
+        # Hiçbir çıkışa ulaşamayan düğümlerin hataları algılanamaz; koni yayılımı bu düğümlere girmez
+        self.observable = bytearray(self.observed)
+        for node_id in reversed(netlist.topological_ids()):
+            if self.observable[node_id]:
+                for input_id in self.fanin[node_id]:
+                    self.observable[input_id] = 1
+        # Kök: tek çıkışlı ve gözlenmeyen düğümler zincirinin sonundaki düğüm (fanout-free bölge kökü)
+        self.stems = list(range(count))
+        for node_id in reversed(netlist.topological_ids()):
+            successors = self.fanout[node_id]
+            if len(successors) == 1 and not self.observed[node_id]:
+                self.stems[node_id] = self.stems[successors[0]]
+        self._version = netlist.version
+
+    def run(self, patterns, block_size=DEFAULT_BLOCK_SIZE):
+        # Vektörler (netlist.inputs sırasıyla bool demetleri) tembel olarak blok blok okunur;
+        # tüm hatalar algılanınca kalan vektörler okunmaz. Tekrar çağrılırsa kapsama birikir.
+        self._refresh()
+        input_count = len(self.netlist.input_ids)
+        block = []
+        for pattern in patterns:
+            block.append(pattern)
+            if len(block) == block_size:
+                self.simulate_block(pack_patterns(block, input_count), len(block))
+                block = []
+                if not self.remaining:
+                    break
+        if block:
+            self.simulate_block(pack_patterns(block, input_count), len(block))
+        return self.coverage
+
+    def simulate_block(self, input_words, width):
+        # Girişler kelime olarak verilir; bu blokta algılanan hatalar döndürülür.
+        # Hatalar kök düğümlerine göre gruplanır: kökün gözlenebilirliği (tersine çevrildiğinde hangi
+        # vektörlerde bir çıkışın değiştiği) bir kez yayılımla bulunur, her hata ise yalnızca kendi
+        # bölgesinde köke kadar izlenir. Her bit ayrı bir vektör olduğundan sonuç kesindir.
+        self._refresh()
+        mask = (1 << width) - 1
+        words = self.program(input_words, mask)
+        first_pattern = self.coverage.patterns
+        detected = self.coverage.detected
+        groups = {}
+        for fault in self.remaining:
+            groups.setdefault(self.stems[fault[0]], []).append(fault)
+        remaining = []
+        found = []
+        for stem, faults in groups.items():
+            observability = self._propagate(words, stem, mask) if self.observable[stem] else 0
+            for fault in faults:
+                node_id, value = fault
+                difference = words[node_id] ^ (mask if value else 0) if observability else 0
+                if difference and node_id != stem:
+                    difference = self._to_stem(words, node_id, difference, mask)
+                difference &= observability
+                if difference:
+                    # En düşük bit, hatayı algılayan ilk vektördür
+                    detected[fault] = first_pattern + (difference & -difference).bit_length() - 1
+                    found.append(fault)
+                else:
+                    remaining.append(fault)
+        self.remaining = remaining
+        self.coverage.patterns += width
+        return found
+
+    def _to_stem(self, words, node_id, difference, mask):
+        # Tek çıkışlı düğümler zinciri boyunca farkı köke taşır; kökteki fark kelimesi döndürülür
+        fanin = self.fanin
+        fanout = self.fanout
+        evaluators = self.evaluators
+        stem = self.stems[node_id]
+        saved = [(node_id, words[node_id])]
+        words[node_id] ^= difference
+        current = node_id
+        while current != stem and difference:
+            current = fanout[current][0]
+            good = words[current]
+            value = evaluators[current](words, fanin[current], mask)
+            difference = value ^ good
+            saved.append((current, good))
+            words[current] = value
+        for saved_id, word in saved:
+            words[saved_id] = word
+        self.nodes_evaluated += len(saved) - 1
+        return difference
+
+    def _propagate(self, words, node_id, difference):
+        # Düğümün değeri difference bitlerinde tersine çevrilir, etkisi koni boyunca yayılır ve sonra
+        # geri alınır. Çıkışlarda görülen farkların birleşimi döndürülür.
+        fanin = self.fanin
+        fanout = self.fanout
+        levels = self.levels
+        evaluators = self.evaluators
+        observed = self.observed
+        observable = self.observable
+        mask = difference
+        saved = [(node_id, words[node_id])]
+        words[node_id] ^= difference
+        detected = difference if observed[node_id] else 0
+        queue = []
+        queued = set()
+        for successor in fanout[node_id]:
+            if observable[successor] and successor not in queued:
+                queued.add(successor)
+                heapq.heappush(queue, (levels[successor], successor))
+        evaluated = 0
+        while queue:
+            _, current = heapq.heappop(queue)
+            evaluated += 1
+            value = evaluators[current](words, fanin[current], mask)
+            if value == words[current]:
+                # Fark bu kapıda maskelendi; yayılım burada durur
+                continue
+            if observed[current]:
+                detected |= value ^ words[current]
+            saved.append((current, words[current]))
+            words[current] = value
+            for successor in fanout[current]:
+                if observable[successor] and successor not in queued:
+                    queued.add(successor)
+                    heapq.heappush(queue, (levels[successor], successor))
+        for saved_id, word in saved:
+            words[saved_id] = word
+        self.nodes_evaluated += evaluated
+        return detected
@@ -0,0 +1,439 @@
+# ISCAS-85/89 .bench, BLIF ve yapısal (kapı düzeyi) Verilog içe aktarıcıları.
+# Dosyalar satır satır okunur; bellekte yalnızca ağ adları ve bekleyen kenarlar tamsayı dizileri
+# olarak tutulur. Kenarlar dosya bittikten sonra pin sırasıyla bağlanır, böylece ileri başvurular
+# (bir ağın tanımlanmadan önce kullanılması) desteklenir.
+import os
+import re
+from array import array
+
+from netlist import Netlist, NetlistError, AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, INPUT, OUTPUT
+
+# İçe aktarılan devreler seviyeye göre sütunlara yerleştirilir
+LEVEL_SPACING = 80
+ROW_SPACING = 50
+
+BENCH_GATES = {
+    "AND": AND,
+    "OR": OR,
+    "NAND": NAND,
+    "NOR": NOR,
+    "XOR": XOR,
+    "XNOR": XNOR,
+    "NOT": NOT,
+    "BUF": BUFFER,
+    "BUFF": BUFFER,
+}
+VERILOG_GATES = {
+    "and": AND,
+    "or": OR,
+    "nand": NAND,
+    "nor": NOR,
+    "xor": XOR,
+    "xnor": XNOR,
+    "not": NOT,
+    "buf": BUFFER,
+}
+BENCH_LINE = re.compile(r"^\s*(\S+)\s*=\s*(\w+)\s*\((.*)\)\s*$")
+BENCH_PORT = re.compile(r"^\s*(INPUT|OUTPUT)\s*\(\s*(\S+?)\s*\)\s*$", re.IGNORECASE)
+VERILOG_RANGE = re.compile(r"^\[\s*(\d+)\s*:\s*(\d+)\s*\]\s*")
+VERILOG_STATEMENT = re.compile(r"^([\w$]*)\s*(.*)$", re.DOTALL)
+VERILOG_DELAY = re.compile(r"^#\s*(\([^)]*\)|\S+)\s*")
+VERILOG_CONSTANTS = {"1'b0": False, "1'b1": True, "1'h0": False, "1'h1": True, "0": False, "1": True}
+NO_DRIVER = -1
+
+
+class NetlistBuilder:
+    # Adlandırılmış ağları düğümlere eşler; ağ indeksleri hem adlı hem de ara (adsız) ağları kapsar
+    def __init__(self, path):
+        self.path = path
+        self.netlist = Netlist()
+        # Kenarlar bağlanana kadar seviyeler tutulmaz; sonda tek seferde hesaplanır
+        self.netlist.invalidate_levels()
+        self.nets = {}
+        self.drivers = array("i")
+        self.pending_nets = array("i")
+        self.pending_targets = array("i")
+        self.constants = {}
+
+    def error(self, message, line_number=None):
+        if line_number is None:
+            return NetlistError("%s: %s" % (self.path, message))
+        return NetlistError("%s:%d: %s" % (self.path, line_number, message))
+
+    def net(self, name):
+        index = self.nets.get(name)
+        if index is None:
+            index = self.nets[name] = len(self.drivers)
+            self.drivers.append(NO_DRIVER)
+        return index
+
+    def anonymous(self, node_id):
+        self.drivers.append(node_id)
+        return len(self.drivers) - 1
+
+    def add_node(self, kind, operands, name=None):
+        node = self.netlist.add_node(kind, name=name)
+        for index in operands:
+            self.pending_nets.append(index)
+            self.pending_targets.append(node.id)
+        return node.id
+
+    def drive(self, name, node_id, line_number=None):
+        index = self.net(name)
+        if self.drivers[index] != NO_DRIVER:
+            raise self.error("Ağ birden fazla kez sürülüyor: %s" % name, line_number)
+        self.drivers[index] = node_id
+
+    def constant(self, value):
+        # Sabit 0 girişsiz AND kapısıdır (False); sabit 1 bunun tersidir
+        if value not in self.constants:
+            if value:
+                self.constants[True] = self.anonymous(self.add_node(NOT, [self.constant(False)]))
+            else:
+                self.constants[False] = self.anonymous(self.add_node(AND, []))
+        return self.constants[value]
+
+    def add_input(self, name, line_number=None):
+        self.drive(name, self.add_node(INPUT, [], name), line_number)
+
+    def add_output(self, name):
+        self.add_node(OUTPUT, [self.net(name)], name)
+
+    def add_latch(self, data, name, line_number=None):
+        # Flip-floplar kesilir: çıkışı sözde giriş, veri girişi sözde çıkış olur
+        self.add_input(name, line_number)
+        self.add_output(data)
+
+    def add_gate(self, kind, output, operands, line_number=None):
+        # Çok girişli XOR/XNOR, modelin kurallarına uysun diye iki girişli zincire açılır (eşlik)
+        if kind in (XOR, XNOR) and len(operands) > 2:
+            previous = operands[0]
+            for operand in operands[1:-1]:
+                previous = self.anonymous(self.add_node(XOR, [previous, operand]))
+            operands = [previous, operands[-1]]
+        elif kind in (XOR, XNOR) and len(operands) == 1:
+            kind = BUFFER if kind == XOR else NOT
+        elif kind in (NOT, BUFFER) and len(operands) != 1:
+            raise self.error("%s kapısının tek girişi olmalıdır." % kind, line_number)
+        self.drive(output, self.add_node(kind, operands, output), line_number)
+
+    def finish(self):
+        nodes = self.netlist.nodes
+        names = {index: name for name, index in self.nets.items()}
+        for index, target_id in zip(self.pending_nets, self.pending_targets):
+            source_id = self.drivers[index]
+            if source_id == NO_DRIVER:
+                raise self.error("Tanımsız ağ: %s" % names[index])
+            self.netlist.connect(nodes[source_id], nodes[target_id])
+        place_by_level(self.netlist)
+        return self.netlist
+
+
+def place_by_level(netlist):
+    # Her seviye bir sütundur; döngüdeki düğümler son sütuna konur
+    levels = netlist.levelize()
+    columns = list(levels) + [[node.id for node in netlist.cycle_nodes]]
+    for column, node_ids in enumerate(columns):
+        for row, node_id in enumerate(node_ids):
+            netlist.xs[node_id] = 50 + column * LEVEL_SPACING
+            netlist.ys[node_id] = 50 + row * ROW_SPACING
+
+
+def _split_names(text):
+    return [name for name in re.split(r"[\s,]+", text.strip()) if name]
+
+
+def import_bench(path):
+    builder = NetlistBuilder(path)
+    with open(path, encoding="utf-8", errors="replace") as stream:
+        for line_number, line in enumerate(stream, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            match = BENCH_PORT.match(line)
+            if match:
+                if match.group(1).upper() == "INPUT":
+                    builder.add_input(match.group(2), line_number)
+                else:
+                    builder.add_output(match.group(2))
+                continue
+            match = BENCH_LINE.match(line)
+            if not match:
+                raise builder.error("Geçersiz satır.", line_number)
+            output, function, arguments = match.groups()
+            operands = [builder.net(name) for name in _split_names(arguments)]
+            function = function.upper()
+            if function == "DFF":
+                if len(operands) != 1:
+                    raise builder.error("DFF tek girişli olmalıdır.", line_number)
+                builder.add_latch(_split_names(arguments)[0], output, line_number)
+            elif function in BENCH_GATES:
+                builder.add_gate(BENCH_GATES[function], output, operands, line_number)
+            else:
+                raise builder.error("Desteklenmeyen kapı: %s" % function, line_number)
+    return builder.finish()
+
+
+def _blif_lines(stream):
+    # Ters bölü ile devam eden satırları birleştirir, yorumları atar
+    pending = ""
+    for line_number, line in enumerate(stream, 1):
+        line = line.split("#", 1)[0].rstrip()
+        if line.endswith("\\"):
+            pending += line[:-1] + " "
+            continue
+        line = (pending + line).strip()
+        pending = ""
+        if line:
+            yield line_number, line
+
+
+def _match_cover(cubes, width):
+    # Yaygın örtüleri doğrudan tek kapı türüne eşler; eşleşme yoksa None döner
+    if len(cubes) == 1:
+        cube = cubes[0]
+        if cube == "1" * width:
+            return BUFFER if width == 1 else AND
+        if cube == "0" * width:
+            return NOT if width == 1 else NOR
+    if len(cubes) == width > 1:
+        if sorted(cubes) == sorted("-" * index + "1" + "-" * (width - index - 1) for index in range(width)):
+            return OR
+        if sorted(cubes) == sorted("-" * index + "0" + "-" * (width - index - 1) for index in range(width)):
+            return NAND
+    if width == 2 and sorted(cubes) == ["01", "10"]:
+        return XOR
+    if width == 2 and sorted(cubes) == ["00", "11"]:
+        return XNOR
+    return None
+
+
+INVERTED_KINDS = {AND: NAND, NAND: AND, OR: NOR, NOR: OR, XOR: XNOR, XNOR: XOR, NOT: BUFFER, BUFFER: NOT}
+
+
+def _add_cover(builder, inputs, output, cover, line_number):
+    # .names tablosu: tüm satırlar aynı çıkış değerini (1: açık küme, 0: kapalı küme) taşır
+    operands = [builder.net(name) for name in inputs]
+    if not operands:
+        value = bool(cover) and cover[0].strip() == "1"
+        builder.drive(output, builder.add_node(BUFFER, [builder.constant(value)], output), line_number)
+        return
+    rows = [row.split() for row in cover]
+    if any(len(row) != 2 or len(row[0]) != len(operands) for row in rows):
+        raise builder.error("Geçersiz .names tablosu: %s" % output, line_number)
+    on_set = rows[0][1] == "1" if rows else True
+    if any((row[1] == "1") != on_set for row in rows):
+        raise builder.error("Karışık çıkış değerli tablolar desteklenmiyor: %s" % output, line_number)
+    cubes = [row[0] for row in rows]
+    if not cubes:
+        builder.drive(output, builder.add_node(BUFFER, [builder.constant(False)], output), line_number)
+        return
+    kind = _match_cover(cubes, len(operands))
+    if kind is not None:
+        builder.add_gate(kind if on_set else INVERTED_KINDS[kind], output, operands, line_number)
+        return
+    # Genel durum: her küp bir AND, küpler OR (kapalı kümede NOR) ile birleştirilir
+    inverted = {}
+    terms = []
+    for cube in cubes:
+        literals = []
+        for operand, symbol in zip(operands, cube):
+            if symbol == "1":
+                literals.append(operand)
+            elif symbol == "0":
+                if operand not in inverted:
+                    inverted[operand] = builder.anonymous(builder.add_node(NOT, [operand]))
+                literals.append(inverted[operand])
+        if not literals:
+            terms.append(builder.constant(True))
+        elif len(literals) == 1:
+            terms.append(literals[0])
+        else:
+            terms.append(builder.anonymous(builder.add_node(AND, literals)))
+    builder.add_gate(OR if on_set else NOR, output, terms, line_number)
+
+
+def import_blif(path):
+    # Yalnızca ilk .model okunur; alt devre (.subckt) desteklenmez
+    builder = NetlistBuilder(path)
+    names = None
+    cover = []
+    with open(path, encoding="utf-8", errors="replace") as stream:
+        for line_number, line in _blif_lines(stream):
+            if not line.startswith("."):
+                if names is None:
+                    raise builder.error("Beklenmeyen satır.", line_number)
+                cover.append(line)
+                continue
+            if names is not None:
+                _add_cover(builder, names[0], names[1], cover, names[2])
+                names = None
+                cover = []
+            fields = line.split()
+            directive = fields[0]
+            if directive == ".inputs":
+                for name in fields[1:]:
+                    builder.add_input(name, line_number)
+            elif directive == ".outputs":
+                for name in fields[1:]:
+                    builder.add_output(name)
+            elif directive == ".names":
+                if len(fields) < 2:
+                    raise builder.error("Geçersiz .names satırı.", line_number)
+                names = (fields[1:-1], fields[-1], line_number)
+            elif directive == ".latch":
+                if len(fields) < 3:
+                    raise builder.error("Geçersiz .latch satırı.", line_number)
+                builder.add_latch(fields[1], fields[2], line_number)
+            elif directive == ".end":
+                break
+            elif directive in (".model", ".clock", ".default_input_arrival", ".default_output_required"):
+                continue
+            else:
+                raise builder.error("Desteklenmeyen yönerge: %s" % directive, line_number)
+    if names is not None:
+        _add_cover(builder, names[0], names[1], cover, names[2])
+    return builder.finish()
+
+
+def _verilog_statements(stream):
+    # Yorumları atıp ';' ile biten ifadeleri üretir; yalnızca yarım kalan ifade bellekte tutulur
+    pending = ""
+    in_comment = False
+    for line_number, line in enumerate(stream, 1):
+        if not in_comment and line.lstrip().startswith("`"):
+            # Derleyici yönergeleri (`timescale vb.) ';' ile bitmez
+            continue
+        text = ""
+        while line:
+            if in_comment:
+                end = line.find("*/")
+                if end < 0:
+                    line = ""
+                else:
+                    line = line[end + 2:]
+                    in_comment = False
+                continue
+            start = line.find("/*")
+            comment = line.find("//")
+            if comment >= 0 and (start < 0 or comment < start):
+                text += line[:comment]
+                line = ""
+            elif start >= 0:
+                text += line[:start] + " "
+                line = line[start + 2:]
+                in_comment = True
+            else:
+                text += line
+                line = ""
+        pending += " " + text
+        while ";" in pending:
+            statement, pending = pending.split(";", 1)
+            statement = statement.strip()
+            while statement.startswith("endmodule"):
+                statement = statement[len("endmodule"):].strip()
+            if statement:
+                yield line_number, statement
+
+
+def _verilog_names(text):
+    # "[3:0] a, b" gibi bildirimleri tek bitlik ağ adlarına açar
+    text = text.strip()
+    match = VERILOG_RANGE.match(text)
+    bits = None
+    if match:
+        first, last = int(match.group(1)), int(match.group(2))
+        step = 1 if last >= first else -1
+        bits = range(first, last + step, step)
+        text = text[match.end():]
+    names = []
+    for name in _split_names(text):
+        if bits is None:
+            names.append(name)
+        else:
+            names.extend("%s[%d]" % (name, bit) for bit in bits)
+    return names
+
+
+def _verilog_operand(builder, name, line_number):
+    name = name.replace(" ", "")
+    if name in VERILOG_CONSTANTS:
+        return builder.constant(VERILOG_CONSTANTS[name])
+    if not re.match(r"^[\w$\\.]+(\[\d+\])?$", name):
+        raise builder.error("Desteklenmeyen ifade: %s" % name, line_number)
+    return builder.net(name)
+
+
+def _declare(builder, direction, text, line_number):
+    if direction == "input":
+        for name in _verilog_names(text):
+            builder.add_input(name, line_number)
+    elif direction == "output":
+        for name in _verilog_names(text):
+            builder.add_output(name)
+
+
+def import_verilog(path):
+    # Yalnızca ilkel kapılar (and, or, nand, nor, xor, xnor, not, buf) ve basit assign desteklenir
+    builder = NetlistBuilder(path)
+    modules = 0
+    with open(path, encoding="utf-8", errors="replace") as stream:
+        for line_number, statement in _verilog_statements(stream):
+            keyword, rest = VERILOG_STATEMENT.match(statement).groups()
+            if keyword == "module":
+                modules += 1
+                if modules > 1:
+                    raise builder.error("Birden fazla modül desteklenmiyor.", line_number)
+                # ANSI tarzı başlıkta (input a, output b) bildirimler doğrudan port listesindedir
+                ports = rest.partition("(")[2].rpartition(")")[0]
+                direction = None
+                for port in ports.split(","):
+                    words = port.split()
+                    if words and words[0] in ("input", "output", "inout"):
+                        direction = words[0]
+                        port = " ".join(word for word in words[1:] if word not in ("wire", "reg"))
+                    if direction is not None:
+                        _declare(builder, direction, port, line_number)
+            elif keyword in ("input", "output"):
+                _declare(builder, keyword, re.sub(r"^(wire|reg)\s+", "", rest), line_number)
+            elif keyword in ("wire", "inout", "supply0", "supply1", "timescale"):
+                continue
+            elif keyword == "assign":
+                target, _, source = rest.partition("=")
+                if not source:
+                    raise builder.error("Geçersiz assign.", line_number)
+                operand = _verilog_operand(builder, source, line_number)
+                builder.add_gate(BUFFER, target.replace(" ", ""), [operand], line_number)
+            elif keyword in VERILOG_GATES:
+                # Gecikme (#...) ve örnek adı atlanır; ilk terminaller çıkış, sonuncular giriştir
+                rest = VERILOG_DELAY.sub("", rest)
+                terminals = rest.partition("(")[2].rpartition(")")[0]
+                if not terminals:
+                    raise builder.error("Geçersiz kapı örneği.", line_number)
+                names = [name.strip() for name in terminals.split(",")]
+                kind = VERILOG_GATES[keyword]
+                if kind in (NOT, BUFFER):
+                    operand = _verilog_operand(builder, names[-1], line_number)
+                    for output in names[:-1]:
+                        builder.add_gate(kind, output.replace(" ", ""), [operand], line_number)
+                else:
+                    operands = [_verilog_operand(builder, name, line_number) for name in names[1:]]
+                    builder.add_gate(kind, names[0].replace(" ", ""), operands, line_number)
+            else:
+                raise builder.error("Desteklenmeyen ifade: %s" % keyword, line_number)
+    return builder.finish()
+
+
+IMPORTERS = {
+    ".bench": import_bench,
+    ".blif": import_blif,
+    ".v": import_verilog,
+}
+
+
+def import_file(path):
+    # Biçim dosya uzantısından seçilir
+    importer = IMPORTERS.get(os.path.splitext(path)[1].lower())
+    if importer is None:
+        raise NetlistError("Desteklenmeyen dosya türü: %s" % path)
+    return importer(path)
@@ -0,0 +1,487 @@
+# Tkinter'a bağımlı olmayan devre modeli.
+# Her düğümün (kapı, giriş, çıkış, LED) çıkışı bir ağdır (net); düğümün "inputs" listesi
+# ise giriş pinlerine bağlanan ağları sırasıyla tutar. Arayüz bu modeli dinleyici olarak izler.
+# Milyonlarca kapıya ölçeklenebilmesi için veriler düğüm nesnelerinde değil, Netlist içindeki
+# düz sütunlarda (bytearray/array) tutulur; Node yalnızca (netlist, kimlik) çiftidir.
+from array import array
+
+AND = "AND"
+OR = "OR"
+NAND = "NAND"
+NOR = "NOR"
+XOR = "XOR"
+XNOR = "XNOR"
+NOT = "NOT"
+BUFFER = "BUFFER"
+INPUT = "INPUT"
+OUTPUT = "OUTPUT"
+LAMP = "LAMP"
+# Alt devre örneğinin bir çıkışı; değeri tanımın doğruluk tablosundan okunur
+SUBCIRCUIT = "SUBCIRCUIT"
+
+# Yeni türler sona eklenir ki kayıtlı ikili dosyalardaki tür kodları değişmesin
+GATE_KINDS = (AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, INPUT, OUTPUT, LAMP, SUBCIRCUIT)
+SINK_KINDS = (OUTPUT, LAMP)
+# Dizi tabanlı gösterimlerde kullanılan sayısal kapı türü kodları
+KIND_CODES = {kind: code for code, kind in enumerate(GATE_KINDS)}
+INPUT_CODE = KIND_CODES[INPUT]
+SINK_CODES = (KIND_CODES[OUTPUT], KIND_CODES[LAMP])
+SUBCIRCUIT_CODE = KIND_CODES[SUBCIRCUIT]
+# Bağlı listelerde "kenar yok" işareti
+NO_EDGE = -1
+# Bir alt devre örneğinin çıkışları alt alta bu aralıkla yerleştirilir
+INSTANCE_PIN_SPACING = 20
+
+
+class NetlistError(Exception):
+    pass
+
+
+class CycleError(NetlistError):
+    def __init__(self, nodes):
+        super().__init__("Devrede kombinasyonel döngü var: %s" % ", ".join(repr(node) for node in nodes))
+        self.nodes = nodes
+
+
+# Kapı davranışları arayüzdeki eski evaluate metotlarıyla birebir aynıdır:
+# girişi olmayan kapılar False verir, XOR yalnızca iki girişte çalışır,
+# çok girişli XNOR ise tüm girişler eşit olduğunda True verir.
+def _and(values):
+    return bool(values) and all(values)
+
+
+def _or(values):
+    return any(values)
+
+
+def _nand(values):
+    return bool(values) and not all(values)
+
+
+def _nor(values):
+    return bool(values) and not any(values)
+
+
+def _xor(values):
+    return len(values) == 2 and values[0] != values[1]
+
+
+def _xnor(values):
+    return bool(values) and (all(values) or not any(values))
+
+
+def _not(values):
+    return bool(values) and not values[0]
+
+
+def _buffer(values):
+    return bool(values) and values[0]
+
+
+GATE_FUNCTIONS = {
+    AND: _and,
+    OR: _or,
+    NAND: _nand,
+    NOR: _nor,
+    XOR: _xor,
+    XNOR: _xnor,
+    NOT: _not,
+    BUFFER: _buffer,
+    OUTPUT: _or,
+    LAMP: _or,
+}
+
+
+def evaluate_gate(kind, values):
+    return GATE_FUNCTIONS[kind](values)
+
+
+class Node:
+    __slots__ = ("netlist", "id")
+
+    def __init__(self, netlist, node_id):
+        self.netlist = netlist
+        self.id = node_id
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and other.netlist is self.netlist and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return "Node(%d, %s)" % (self.id, self.kind)
+
+    @property
+    def kind(self):
+        return GATE_KINDS[self.netlist.kind_codes[self.id]]
+
+    @property
+    def name(self):
+        return self.netlist.names.get(self.id)
+
+    @property
+    def value(self):
+        return bool(self.netlist.values[self.id])
+
+    @value.setter
+    def value(self, value):
+        self.netlist.values[self.id] = bool(value)
+
+    @property
+    def x(self):
+        return self.netlist.xs[self.id]
+
+    @x.setter
+    def x(self, x):
+        self.netlist.xs[self.id] = x
+
+    @property
+    def y(self):
+        return self.netlist.ys[self.id]
+
+    @y.setter
+    def y(self, y):
+        self.netlist.ys[self.id] = y
+
+    @property
+    def level(self):
+        # Kaynaklardan itibaren en uzun yol uzunluğu
+        return self.netlist.node_levels[self.id]
+
+    @property
+    def inputs(self):
+        return [Node(self.netlist, node_id) for node_id in self.netlist.fanin_ids(self.id)]
+
+    @property
+    def fanout(self):
+        return [Node(self.netlist, node_id) for node_id in self.netlist.fanout_ids(self.id)]
+
+
+class NodeList:
+    # Düğümleri ihtiyaç anında oluşturan salt okunur dizi görünümü
+    def __init__(self, netlist):
+        self.netlist = netlist
+
+    def __len__(self):
+        return len(self.netlist.kind_codes)
+
+    def __getitem__(self, node_id):
+        if not 0 <= node_id < len(self.netlist.kind_codes):
+            raise IndexError(node_id)
+        return Node(self.netlist, node_id)
+
+    def __iter__(self):
+        netlist = self.netlist
+        return (Node(netlist, node_id) for node_id in range(len(netlist.kind_codes)))
+
+
+class Netlist:
+    def __init__(self):
+        self.listeners = []
+        # Topoloji her değiştiğinde artar; önbellekler bununla geçerliliğini kontrol eder
+        self.version = 0
+        # Düğüm sütunları
+        self.kind_codes = bytearray()
+        self.values = bytearray()
+        self.node_levels = array("i")
+        self.xs = array("f")
+        self.ys = array("f")
+        self.names = {}
+        self.input_counts = array("i")
+        # Seyrek sütun: SUBCIRCUIT düğümü -> (tanım, çıkış sırası); bir örneğin çıkışları ardışık kimliklidir
+        self.subcircuits = {}
+        # Bu devrede kullanılan alt devre tanımları: ad -> subcircuit.SubcircuitDefinition
+        self.definitions = {}
+        # Kenar sütunları; her düğümün giriş ve çıkış kenarları kenar kimlikleriyle bağlı listedir
+        self.edge_sources = array("i")
+        self.edge_targets = array("i")
+        self.next_input_edge = array("i")
+        self.next_output_edge = array("i")
+        self.first_input_edge = array("i")
+        self.last_input_edge = array("i")
+        self.first_output_edge = array("i")
+        self.last_output_edge = array("i")
+        self.cycle_nodes = []
+        self._levels_valid = True
+        self._levels = []
+        self._levels_version = -1
+        self._io_version = -1
+        self._input_ids = []
+        self._output_ids = []
+
+    def __len__(self):
+        return len(self.kind_codes)
+
+    @property
+    def nodes(self):
+        return NodeList(self)
+
+    def kind(self, node_id):
+        return GATE_KINDS[self.kind_codes[node_id]]
+
+    def node_function(self, node_id):
+        # Giriş değerleri listesinden çıkışı hesaplayan fonksiyon; alt devrelerde tablo okunur
+        code = self.kind_codes[node_id]
+        if code == SUBCIRCUIT_CODE:
+            definition, output_index = self.subcircuits[node_id]
+            return definition.output_functions[output_index]
+        return GATE_FUNCTIONS[GATE_KINDS[code]]
+
+    def instance_base(self, node_id):
+        # Alt devre örneğinin ilk çıkışının kimliği; diğer düğümler için kendisi
+        subcircuit = self.subcircuits.get(node_id)
+        return node_id if subcircuit is None else node_id - subcircuit[1]
+
+    def instance_ids(self, node_id):
+        base = self.instance_base(node_id)
+        subcircuit = self.subcircuits.get(node_id)
+        return range(base, base + (1 if subcircuit is None else subcircuit[0].output_count))
+
+    def fanin_ids(self, node_id):
+        result = []
+        edge = self.first_input_edge[node_id]
+        while edge != NO_EDGE:
+            result.append(self.edge_sources[edge])
+            edge = self.next_input_edge[edge]
+        return result
+
+    def fanout_ids(self, node_id):
+        result = []
+        edge = self.first_output_edge[node_id]
+        while edge != NO_EDGE:
+            result.append(self.edge_targets[edge])
+            edge = self.next_output_edge[edge]
+        return result
+
+    def fanin_csr(self):
+        # Giriş kenarlarını CSR düzeninde (başlangıçlar, kaynak kimlikleri) döndürür
+        offsets = array("l", [0])
+        sources = array("i")
+        for node_id in range(len(self.kind_codes)):
+            sources.extend(self.fanin_ids(node_id))
+            offsets.append(len(sources))
+        return offsets, sources
+
+    def _refresh_io(self):
+        if self._io_version != self.version:
+            self._input_ids = [node_id for node_id, code in enumerate(self.kind_codes) if code == INPUT_CODE]
+            self._output_ids = [node_id for node_id, code in enumerate(self.kind_codes) if code in SINK_CODES]
+            self._io_version = self.version
+
+    @property
+    def input_ids(self):
+        self._refresh_io()
+        return self._input_ids
+
+    @property
+    def output_ids(self):
+        self._refresh_io()
+        return self._output_ids
+
+    @property
+    def inputs(self):
+        return [Node(self, node_id) for node_id in self.input_ids]
+
+    @property
+    def outputs(self):
+        return [Node(self, node_id) for node_id in self.output_ids]
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def notify(self, event, payload):
+        for listener in list(self.listeners):
+            listener(event, payload)
+
+    def add_node(self, kind, x=0, y=0, name=None):
+        if kind not in GATE_KINDS:
+            raise NetlistError("Bilinmeyen kapı türü: %s" % kind)
+        if kind == SUBCIRCUIT:
+            raise NetlistError("Alt devreler add_instance ile eklenir.")
+        node = Node(self, self._append_node(kind, x, y, name))
+        self.notify("node_added", node)
+        return node
+
+    def add_instance(self, definition, x=0, y=0):
+        # Her çıkış ayrı bir SUBCIRCUIT düğümüdür; hepsi aynı giriş ağlarını okur ve aynı tabloyu paylaşır
+        if definition.rows is None:
+            raise NetlistError("'%s' alt devresinin tablosu yok; düz kapılar olarak eklenmelidir." % definition.name)
+        if self.definitions.setdefault(definition.name, definition) is not definition:
+            raise NetlistError("'%s' adıyla başka bir alt devre tanımı var." % definition.name)
+        base = len(self.kind_codes)
+        for output_index in range(definition.output_count):
+            self.subcircuits[base + output_index] = (definition, output_index)
+            self._append_node(SUBCIRCUIT, x, y + output_index * INSTANCE_PIN_SPACING, None)
+        nodes = [Node(self, node_id) for node_id in range(base, base + definition.output_count)]
+        for node in nodes:
+            self.notify("node_added", node)
+        return nodes
+
+    def _append_node(self, kind, x, y, name):
+        node_id = len(self.kind_codes)
+        self.kind_codes.append(KIND_CODES[kind])
+        self.values.append(0)
+        self.node_levels.append(0)
+        self.xs.append(x)
+        self.ys.append(y)
+        if name is not None:
+            self.names[node_id] = name
+        self.input_counts.append(0)
+        for column in (self.first_input_edge, self.last_input_edge, self.first_output_edge, self.last_output_edge):
+            column.append(NO_EDGE)
+        self.version += 1
+        return node_id
+
+    def connect(self, source, target):
+        kind = target.kind
+        if kind == INPUT:
+            raise NetlistError("Giriş kapısının girişi olamaz!")
+        if source.kind == LAMP:
+            raise NetlistError("LED başka bir kapıyı süremez!")
+        if kind == BUFFER and self.input_counts[target.id]:
+            raise NetlistError("Buffer kapısının yalnızca bir girişi olabilir!")
+        if kind == NOT and self.input_counts[target.id]:
+            raise NetlistError("Not kapısı için birden fazla giriş bulunmaktadır.")
+        if kind == SUBCIRCUIT and self.input_counts[target.id] >= self.subcircuits[target.id][0].input_count:
+            raise NetlistError("Alt devrenin tüm girişleri bağlı!")
+        # Alt devre örneğine bağlanan ağ, örneğin tüm çıkışlarının aynı sıradaki girişi olur
+        for target_id in self.instance_ids(target.id):
+            self._add_edge(source.id, target_id)
+            self.version += 1
+            self._raise_levels(source.id, target_id)
+            self.notify("connected", (source, Node(self, target_id)))
+
+    def _add_edge(self, source_id, target_id):
+        # Kenar, hedefin giriş listesinin ve kaynağın çıkış listesinin sonuna eklenir (pin sırası korunur)
+        edge = len(self.edge_sources)
+        self.edge_sources.append(source_id)
+        self.edge_targets.append(target_id)
+        self.next_input_edge.append(NO_EDGE)
+        self.next_output_edge.append(NO_EDGE)
+        if self.last_input_edge[target_id] == NO_EDGE:
+            self.first_input_edge[target_id] = edge
+        else:
+            self.next_input_edge[self.last_input_edge[target_id]] = edge
+        self.last_input_edge[target_id] = edge
+        if self.last_output_edge[source_id] == NO_EDGE:
+            self.first_output_edge[source_id] = edge
+        else:
+            self.next_output_edge[self.last_output_edge[source_id]] = edge
+        self.last_output_edge[source_id] = edge
+        self.input_counts[target_id] += 1
+
+    def move_node(self, node, delta_x, delta_y):
+        self.xs[node.id] += delta_x
+        self.ys[node.id] += delta_y
+        self.notify("moved", node)
+
+    def set_input(self, node, value):
+        if node.kind != INPUT:
+            raise NetlistError("Yalnızca giriş kapılarının değeri ayarlanabilir.")
+        value = bool(value)
+        if self.values[node.id] != value:
+            self.values[node.id] = value
+            self.notify("values", [node])
+
+    def to_data(self):
+        # Süreçler arası aktarım için yalnızca düz Python verisi (dinleyiciler ve görünümler hariç);
+        # son alan alt devre çıkışları için (tanım, çıkış sırası), diğer düğümler için None'dır
+        return [(self.kind(node_id), self.fanin_ids(node_id), self.xs[node_id], self.ys[node_id],
+                 self.names.get(node_id), self.subcircuits.get(node_id))
+                for node_id in range(len(self.kind_codes))]
+
+    @classmethod
+    def from_data(cls, data):
+        netlist = cls()
+        for kind, _, x, y, name, subcircuit in data:
+            if subcircuit is None:
+                netlist.add_node(kind, x, y, name)
+                continue
+            definition, output_index = subcircuit
+            if output_index == 0:
+                netlist.add_instance(definition, x, y)
+            node_id = len(netlist) - definition.output_count + output_index
+            netlist.xs[node_id] = x
+            netlist.ys[node_id] = y
+            if name is not None:
+                netlist.names[node_id] = name
+        nodes = netlist.nodes
+        for node_id, (_, input_ids, _, _, _, _) in enumerate(data):
+            # Örneğin diğer çıkışlarının kenarları ilk çıkışa bağlanırken eklenir
+            if netlist.instance_base(node_id) != node_id:
+                continue
+            for input_id in input_ids:
+                netlist.connect(nodes[input_id], nodes[node_id])
+        return netlist
+
+    def _raise_levels(self, source_id, target_id):
+        # Yeni kenar yalnızca hedefin ve onun çıkış konisinin seviyesini artırabilir
+        levels = self.node_levels
+        if not self._levels_valid or levels[target_id] > levels[source_id]:
+            return
+        levels[target_id] = levels[source_id] + 1
+        stack = [target_id]
+        while stack:
+            node_id = stack.pop()
+            for successor in self.fanout_ids(node_id):
+                if levels[successor] > levels[node_id]:
+                    continue
+                if successor == source_id:
+                    # Kaynağa geri dönüldü: kenar bir döngü oluşturdu, seviyeler tamamen yeniden kurulacak
+                    self._levels_valid = False
+                    return
+                levels[successor] = levels[node_id] + 1
+                stack.append(successor)
+
+    def invalidate_levels(self):
+        # Seviye sütunu güvenilmez olduğunda (ör. dışarıdan yüklenen döngülü devre) tam yeniden kurulum ister
+        self._levels_valid = False
+        self._levels_version = -1
+
+    def _relevelize(self):
+        # Kahn algoritmasıyla en uzun yol seviyeleri; yalnızca gerçek giriş kenarları sayılır
+        in_degree = array("i", self.input_counts)
+        levels = array("i", bytes(4 * len(self.kind_codes)))
+        queue = [node_id for node_id in range(len(self.kind_codes)) if in_degree[node_id] == 0]
+        for node_id in queue:
+            for successor in self.fanout_ids(node_id):
+                in_degree[successor] -= 1
+                if levels[successor] <= levels[node_id]:
+                    levels[successor] = levels[node_id] + 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+        self.node_levels = levels
+        # Sıralanamayan düğümler bir döngünün üzerinde ya da döngünün çıkış konisindedir
+        self.cycle_nodes = [Node(self, node_id) for node_id in range(len(self.kind_codes)) if in_degree[node_id] > 0]
+        self._levels_valid = not self.cycle_nodes
+
+    def levelize(self):
+        # Seviye başına düğüm kimliği listeleri; topoloji değişmedikçe yeniden kurulmaz
+        if self._levels_version == self.version:
+            return self._levels
+        if not self._levels_valid:
+            self._relevelize()
+        cyclic = set(node.id for node in self.cycle_nodes)
+        levels = []
+        for node_id, level in enumerate(self.node_levels):
+            if node_id in cyclic:
+                continue
+            while len(levels) <= level:
+                levels.append([])
+            levels[level].append(node_id)
+        self._levels = levels
+        self._levels_version = self.version
+        return levels
+
+    def topological_ids(self):
+        levels = self.levelize()
+        if self.cycle_nodes:
+            raise CycleError(self.cycle_nodes)
+        return [node_id for level in levels for node_id in level]
+
+    def topological_order(self):
+        return [Node(self, node_id) for node_id in self.topological_ids()]
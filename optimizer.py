@@ -0,0 +1,309 @@
+# Simülasyondan önce devreyi sadeleştiren geçiş.
+# Devre topolojik sırayla AND-evirici grafiği (AIG) tarzı bir ara gösterime çevrilir: her ağ bir
+# "literal"dir (düğüm * 2 + 2, evrikse +1; 0 ve 1 sabit False ve True). Bu sırada:
+#   - girişi bağlanmamış kapılar False sayılıp sabitler katlanır (netlist.GATE_FUNCTIONS kuralları),
+#   - NAND/NOR/NOT/BUFFER evrik literallere, OR De Morgan ile AND'e indirgenir ve aynı işlenenli
+#     düğümler yapısal olarak birleştirilir (structural hashing),
+#   - yalnızca çıkış ve LED'lerden geriye ulaşılabilen düğümler yeni devreye yazılır.
+# Sadeleştirilmiş devrenin girişleri ve çıkışları asıl devreyle aynı sıradadır; Reduction, asıl
+# devrenin düğümlerinin değerlerini sadeleştirilmiş devredeki karşılıklarından geri yazar.
+from array import array
+
+from netlist import Netlist, AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, INPUT, SUBCIRCUIT, SINK_KINDS
+
+FALSE = 0
+TRUE = 1
+# Asıl devrede karşılığı kalmayan (gözlenemeyen) düğümler
+NO_LITERAL = -1
+# Ara gösterimdeki düğüm türleri
+NODE_INPUT = 0
+NODE_AND = 1
+NODE_XOR = 2
+NODE_TABLE = 3
+NODE_SINK = 4
+
+
+def node_index(literal):
+    return (literal >> 1) - 1
+
+
+def gate_count(netlist):
+    # Giriş ve çıkış/LED dışındaki düğümler
+    return sum(1 for kind in map(netlist.kind, range(len(netlist))) if kind != INPUT and kind not in SINK_KINDS)
+
+
+class Reduction:
+    def __init__(self, original, netlist, input_pairs, aliases, constants):
+        self.original = original
+        # Sadeleştirilmiş devre; girişleri ve çıkışları asıl devreyle aynı sıradadır
+        self.netlist = netlist
+        # (asıl giriş, yeni giriş) çiftleri
+        self.input_pairs = input_pairs
+        self.input_map = dict(input_pairs)
+        # Yeni düğüm -> [(asıl düğüm, evrik mi)]; sabit düğümler -> değer
+        self.aliases = aliases
+        self.constants = constants
+
+    def load_inputs(self, node_ids=None):
+        # Asıl devrenin giriş değerleri yeni devreye kopyalanır; değişen yeni girişler döndürülür
+        original = self.original.values
+        values = self.netlist.values
+        pairs = self.input_pairs if node_ids is None else [(node_id, self.input_map[node_id]) for node_id in node_ids]
+        changed = []
+        for node_id, reduced_id in pairs:
+            if values[reduced_id] != original[node_id]:
+                values[reduced_id] = original[node_id]
+                changed.append(reduced_id)
+        return changed
+
+    def store(self, reduced_ids=None):
+        # Yeni devredeki değerler asıl düğümlere yazılır; None verilirse tüm eşlemeler (ve sabitler) yazılır
+        original = self.original.values
+        values = self.netlist.values
+        changed = []
+        if reduced_ids is None:
+            reduced_ids = self.aliases.keys()
+            for node_id, value in self.constants.items():
+                if original[node_id] != value:
+                    original[node_id] = value
+                    changed.append(node_id)
+        aliases = self.aliases
+        for reduced_id in reduced_ids:
+            for node_id, inverted in aliases.get(reduced_id, ()):
+                value = values[reduced_id] ^ inverted
+                if original[node_id] != value:
+                    original[node_id] = value
+                    changed.append(node_id)
+        return changed
+
+    def summary(self):
+        before = gate_count(self.original)
+        after = gate_count(self.netlist)
+        return {"gates_before": before, "gates_after": after,
+                "edges_before": len(self.original.edge_sources), "edges_after": len(self.netlist.edge_sources)}
+
+
+class Optimizer:
+    def __init__(self, netlist):
+        self.original = netlist
+        # Ara gösterim: tür, işlenen literalleri ve türüne göre ek bilgi (asıl kimlik ya da tablo)
+        self.kinds = bytearray()
+        self.operands = []
+        self.extra = []
+        self.table = {}
+        self.literals = array("q", [NO_LITERAL]) * len(netlist)
+
+    def _new(self, kind, operands, extra=None):
+        self.kinds.append(kind)
+        self.operands.append(operands)
+        self.extra.append(extra)
+        return 2 * len(self.kinds)
+
+    def _node(self, kind, operands, extra=None):
+        key = (kind, operands, extra)
+        literal = self.table.get(key)
+        if literal is None:
+            literal = self.table[key] = self._new(kind, operands, extra)
+        return literal
+
+    def conjunction(self, literals):
+        result = set()
+        for literal in literals:
+            if literal == FALSE or literal ^ 1 in result:
+                return FALSE
+            if literal != TRUE:
+                result.add(literal)
+        if not result:
+            return TRUE
+        if len(result) == 1:
+            return result.pop()
+        return self._node(NODE_AND, tuple(sorted(result)))
+
+    def disjunction(self, literals):
+        return self.conjunction([literal ^ 1 for literal in literals]) ^ 1
+
+    def exclusive(self, a, b):
+        # Evrik işaretleri dışarı alınır; sabitlerin düğüm kısmı 0'dır
+        inverted = (a ^ b) & 1
+        a &= ~1
+        b &= ~1
+        if not a:
+            return b ^ inverted
+        if not b:
+            return a ^ inverted
+        if a == b:
+            return inverted
+        return self._node(NODE_XOR, (min(a, b), max(a, b))) ^ inverted
+
+    def lookup(self, node_id, literals):
+        definition, output_index = self.original.subcircuits[node_id]
+        literals = literals + [FALSE] * (definition.input_count - len(literals))
+        if all(literal <= TRUE for literal in literals):
+            return definition.evaluate(literals)[output_index] & 1
+        return self._node(NODE_TABLE, tuple(literals), (definition.name, output_index))
+
+    def gate(self, kind, literals):
+        # Kurallar netlist.GATE_FUNCTIONS ile aynıdır
+        if not literals:
+            return FALSE
+        if kind == AND:
+            return self.conjunction(literals)
+        if kind == NAND:
+            return self.conjunction(literals) ^ 1
+        if kind == OR:
+            return self.disjunction(literals)
+        if kind == NOR:
+            return self.disjunction(literals) ^ 1
+        if kind == NOT:
+            return literals[0] ^ 1
+        if kind == BUFFER:
+            return literals[0]
+        if kind == XOR:
+            return self.exclusive(*literals) if len(literals) == 2 else FALSE
+        if kind == XNOR:
+            if len(literals) == 2:
+                return self.exclusive(*literals) ^ 1
+            # Çok girişli XNOR: tüm girişler 1 ya da tüm girişler 0
+            return self.disjunction([self.conjunction(literals), self.conjunction([lit ^ 1 for lit in literals])])
+        raise ValueError("Sadeleştirilemeyen kapı türü: %s" % kind)
+
+    def build(self):
+        netlist = self.original
+        literals = self.literals
+        for node_id in netlist.topological_ids():
+            kind = netlist.kind(node_id)
+            operands = [literals[input_id] for input_id in netlist.fanin_ids(node_id)]
+            if kind == INPUT:
+                literals[node_id] = self._new(NODE_INPUT, (), node_id)
+            elif kind in SINK_KINDS:
+                literals[node_id] = self._new(NODE_SINK, (self.disjunction(operands),), node_id)
+            elif kind == SUBCIRCUIT:
+                literals[node_id] = self.lookup(node_id, operands)
+            else:
+                literals[node_id] = self.gate(kind, operands)
+
+    def needed_literals(self):
+        # Çıkış ve LED'lerden geriye doğru; her literalin hangi işlenen literallerinden kurulacağı
+        needed = set()
+        stack = [2 * (index + 1) for index, kind in enumerate(self.kinds) if kind == NODE_SINK]
+        while stack:
+            literal = stack.pop()
+            if literal in needed:
+                continue
+            needed.add(literal)
+            if literal <= TRUE:
+                if literal == TRUE:
+                    stack.append(FALSE)
+                continue
+            stack.extend(self.sources(literal))
+        return needed
+
+    def natural(self, literal):
+        # Literalin düğümü için ek kapı gerektirmeyen kutup: işlenenlerinin hepsi evrik AND, OR olarak kurulur
+        index = node_index(literal)
+        if self.kinds[index] == NODE_AND and all(operand & 1 for operand in self.operands[index]):
+            return literal | 1
+        return literal & ~1
+
+    def sources(self, literal):
+        # Literali kuran kapının sırasıyla giriş literalleri
+        index = node_index(literal)
+        kind = self.kinds[index]
+        operands = list(self.operands[index])
+        if kind == NODE_AND:
+            # Tüm işlenenleri evrik AND, evrik olmayan işlenenlerle NOR (ya da OR) olarak kurulur
+            if all(operand & 1 for operand in operands):
+                return [operand ^ 1 for operand in operands]
+            return operands
+        if kind == NODE_XOR:
+            # İşlenenler doğal kutuplarıyla alınır; her evrik işlenen XOR ile XNOR'u yer değiştirir
+            return [self.natural(operand) for operand in operands]
+        if literal & 1:
+            # Giriş ve tablo çıkışlarının tersi NOT kapısıyla kurulur
+            return [literal ^ 1]
+        # Sonda kalan False pinler ve False süren çıkışlar bağlanmadan bırakılır
+        while operands and operands[-1] == FALSE and kind in (NODE_TABLE, NODE_SINK):
+            operands.pop()
+        return operands
+
+    def emit(self):
+        original = self.original
+        needed = self.needed_literals()
+        reduced = Netlist()
+        ids = {}
+        connections = []
+        # Girişler ve çıkışlar asıl kimlik sıralarıyla önce eklenir
+        ports = sorted((self.extra[index], index) for index, kind in enumerate(self.kinds)
+                       if kind in (NODE_INPUT, NODE_SINK))
+        for node_id, index in ports:
+            if self.kinds[index] == NODE_INPUT:
+                ids[2 * index + 2] = reduced.add_node(INPUT, original.xs[node_id], original.ys[node_id],
+                                                      original.names.get(node_id)).id
+        for node_id, index in ports:
+            if self.kinds[index] == NODE_SINK:
+                ids[2 * index + 2] = reduced.add_node(original.kind(node_id), original.xs[node_id],
+                                                      original.ys[node_id], original.names.get(node_id)).id
+                connections.extend((source, ids[2 * index + 2]) for source in self.sources(2 * index + 2))
+        if FALSE in needed:
+            ids[FALSE] = reduced.add_node(AND).id
+        if TRUE in needed:
+            ids[TRUE] = reduced.add_node(NOT).id
+            connections.append((FALSE, ids[TRUE]))
+        instances = {}
+        for index, kind in enumerate(self.kinds):
+            for literal in (2 * index + 2, 2 * index + 3):
+                if literal not in needed or literal in ids:
+                    continue
+                operands = self.operands[index]
+                if kind == NODE_TABLE and not literal & 1:
+                    name, output_index = self.extra[index]
+                    key = (name, operands)
+                    if key not in instances:
+                        instances[key] = reduced.add_instance(original.definitions[name])
+                        connections.extend((source, instances[key][0].id) for source in self.sources(literal))
+                    ids[literal] = instances[key][output_index].id
+                    # Örneğin diğer çıkışları da bu işlenenlerle aynı tablo literallerine karşılık gelir
+                    for other in instances[key]:
+                        other_literal = self.table.get((NODE_TABLE, operands, (name, other.id - instances[key][0].id)))
+                        if other_literal is not None:
+                            ids.setdefault(other_literal, other.id)
+                    continue
+                sources = self.sources(literal)
+                if kind == NODE_AND:
+                    inverted = all(operand & 1 for operand in operands)
+                    gate = ((NOR if inverted else AND) if not literal & 1 else (OR if inverted else NAND))
+                elif kind == NODE_XOR:
+                    gate = XNOR if (literal ^ sources[0] ^ sources[1]) & 1 else XOR
+                else:
+                    gate = NOT
+                ids[literal] = reduced.add_node(gate).id
+                connections.extend((source, ids[literal]) for source in sources)
+        nodes = reduced.nodes
+        for source, target_id in connections:
+            reduced.connect(nodes[ids[source]], nodes[target_id])
+        return reduced, ids
+
+    def reduce(self):
+        self.build()
+        reduced, ids = self.emit()
+        original = self.original
+        input_pairs = []
+        aliases = {}
+        constants = {}
+        for node_id, literal in enumerate(self.literals):
+            if literal == NO_LITERAL:
+                continue
+            if original.kind(node_id) == INPUT:
+                input_pairs.append((node_id, ids[literal]))
+            elif literal <= TRUE:
+                constants[node_id] = literal
+            elif literal in ids:
+                aliases.setdefault(ids[literal], []).append((node_id, 0))
+            elif literal ^ 1 in ids:
+                aliases.setdefault(ids[literal ^ 1], []).append((node_id, 1))
+        return Reduction(original, reduced, input_pairs, aliases, constants)
+
+
+def optimize(netlist):
+    # Döngülü devrelerde topological_ids CycleError fırlatır
+    return Optimizer(netlist).reduce()
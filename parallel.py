@@ -0,0 +1,113 @@
+# Çok çekirdekli kapsamlı doğruluk tablosu ve eşdeğerlik denetimi.
+# 2**n giriş uzayı parçalara (shard) bölünür; her işçi süreç devrenin düz veri kopyasını alır,
+# parçasını bit paralel simülasyonla gezer ve sonucu ana sürece geri akıtır.
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from bitsim import BitParallelSimulator, DEFAULT_CHUNK_BITS
+from netlist import Netlist, NetlistError
+
+SHARDS_PER_WORKER = 4
+
+
+def shard_ranges(input_count, shard_count, chunk_bits=DEFAULT_CHUNK_BITS):
+    # Parçalar ikinin kuvveti büyüklüğündedir ve parça (chunk) sınırlarına hizalıdır
+    total = 1 << input_count
+    chunk = 1 << min(chunk_bits, input_count)
+    size = chunk
+    while size * shard_count < total:
+        size <<= 1
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+def _truth_table_shard(data, start, stop, chunk_bits):
+    simulator = BitParallelSimulator(Netlist.from_data(data))
+    size = ((1 << min(chunk_bits, len(simulator.netlist.inputs))) + 7) // 8
+    compressor = zlib.compressobj()
+    parts = []
+    for _, words in simulator.truth_table_chunks(chunk_bits, start, stop):
+        for word in words:
+            parts.append(compressor.compress(word.to_bytes(size, "little")))
+    parts.append(compressor.flush())
+    return start, stop, b"".join(parts)
+
+
+def decode_shard(payload, output_count, input_count, chunk_bits=DEFAULT_CHUNK_BITS):
+    # Sıkıştırılmış parçayı çıkış başına, parçanın ilk örüntüsünden başlayan kelimelere açar
+    width = 1 << min(chunk_bits, input_count)
+    size = (width + 7) // 8
+    raw = zlib.decompress(payload)
+    outputs = [0] * output_count
+    chunk_index = 0
+    for offset in range(0, len(raw), size * output_count):
+        for index in range(output_count):
+            start = offset + index * size
+            word = int.from_bytes(raw[start:start + size], "little")
+            outputs[index] |= word << (chunk_index * width)
+        chunk_index += 1
+    return outputs
+
+
+def truth_table_shards(netlist, workers=None, chunk_bits=DEFAULT_CHUNK_BITS):
+    # Parçalar tamamlandıkça (başlangıç, bitiş, sıkıştırılmış veri) üretir; sıra garanti değildir
+    workers = workers or os.cpu_count() or 1
+    data = netlist.to_data()
+    ranges = shard_ranges(len(netlist.inputs), workers * SHARDS_PER_WORKER, chunk_bits)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_truth_table_shard, data, start, stop, chunk_bits) for start, stop in ranges]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _counterexample_shard(data_a, data_b, start, stop, chunk_bits):
+    simulator_a = BitParallelSimulator(Netlist.from_data(data_a))
+    simulator_b = BitParallelSimulator(Netlist.from_data(data_b))
+    input_count = len(simulator_a.netlist.inputs)
+    chunks_a = simulator_a.truth_table_chunks(chunk_bits, start, stop)
+    chunks_b = simulator_b.truth_table_chunks(chunk_bits, start, stop)
+    for (base, words_a), (_, words_b) in zip(chunks_a, chunks_b):
+        difference = 0
+        for word_a, word_b in zip(words_a, words_b):
+            difference |= word_a ^ word_b
+        if difference:
+            pattern = base + (difference & -difference).bit_length() - 1
+            return [bool(pattern >> index & 1) for index in range(input_count)]
+    return None
+
+
+def find_counterexample(netlist_a, netlist_b, workers=None, chunk_bits=DEFAULT_CHUNK_BITS):
+    # Girişler ve çıkışlar sıralarına göre eşleştirilir; eşdeğerse None döner
+    if len(netlist_a.inputs) != len(netlist_b.inputs) or len(netlist_a.outputs) != len(netlist_b.outputs):
+        raise NetlistError("Devrelerin giriş ve çıkış sayıları aynı olmalıdır.")
+    workers = workers or os.cpu_count() or 1
+    data_a = netlist_a.to_data()
+    data_b = netlist_b.to_data()
+    ranges = shard_ranges(len(netlist_a.inputs), workers * SHARDS_PER_WORKER, chunk_bits)
+    # Bağlam yöneticisi kullanılmaz: çıkışta çalışan parçaların bitmesini beklerdi
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_counterexample_shard, data_a, data_b, start, stop, chunk_bits)
+                   for start, stop in ranges]
+        indexes = {future: index for index, future in enumerate(futures)}
+        results = [None] * len(futures)
+        finished = [False] * len(futures)
+        lowest = 0
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            index = indexes[future]
+            results[index] = future.result()
+            finished[index] = True
+            if results[index] is not None:
+                # Sonraki parçalar artık sonucu değiştiremez; başlamamış olanlar iptal edilir
+                for pending in futures[index + 1:]:
+                    pending.cancel()
+            # Sonuç her zaman en küçük farklı giriş desenidir: önceki parçaların hepsi bitince döner
+            while lowest < len(futures) and finished[lowest]:
+                if results[lowest] is not None:
+                    return results[lowest]
+                lowest += 1
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,146 @@
+# Simülasyon ölçümleri: bölüm süreleri (sıralama, değerlendirme, lamba güncelleme, tuval çizimi),
+# süre histogramları ve kapı başına değerlendirme / çıkış değişimi sayaçları.
+# Profil kapalıyken simülatör ve çizici yalnızca "profiler is None" kontrolü yapar.
+import csv
+import json
+import time
+from array import array
+
+from netlist import INPUT_CODE
+
+# Histogram kovaları mikrosaniye cinsinden ikinin kuvvetleridir: k. kova < 2**k µs
+HISTOGRAM_BUCKETS = 32
+
+
+class SectionStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        bucket = min(int(seconds * 1e6).bit_length(), HISTOGRAM_BUCKETS - 1)
+        self.histogram[bucket] += 1
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.maximum,
+            # Kova üst sınırı (µs) -> örnek sayısı; boş kovalar yazılmaz
+            "histogram": {str(1 << bucket): count for bucket, count in enumerate(self.histogram) if count},
+        }
+
+
+class Section:
+    # "with profiler.section(ad):" bloğunun süresini kaydeder
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.sections = {}
+        self.evaluations = array("l")
+        self.toggles = array("l")
+        # Derlenmiş tam değerlendirmeler her kapıyı bir kez değerlendirir; kapı başına ayrı sayılmaz
+        self.full_evaluations = 0
+
+    def section(self, name):
+        return Section(self, name)
+
+    def record(self, name, seconds):
+        stats = self.sections.get(name)
+        if stats is None:
+            stats = self.sections[name] = SectionStats()
+        stats.add(seconds)
+
+    def _grow(self, size):
+        if len(self.evaluations) < size:
+            extra = size - len(self.evaluations)
+            self.evaluations.extend(array("l", [0]) * extra)
+            self.toggles.extend(array("l", [0]) * extra)
+
+    def count_evaluation(self, node_id):
+        if node_id >= len(self.evaluations):
+            self._grow(node_id + 1)
+        self.evaluations[node_id] += 1
+
+    def count_full_evaluation(self):
+        self.full_evaluations += 1
+
+    def count_toggles(self, node_ids):
+        for node_id in node_ids:
+            if node_id >= len(self.toggles):
+                self._grow(node_id + 1)
+            self.toggles[node_id] += 1
+
+    def gate_counts(self, netlist):
+        # (kimlik, değerlendirme, değişim) üçlüleri; girişler değerlendirilmez, yalnızca değişimleri sayılır
+        self._grow(len(netlist))
+        full = self.full_evaluations
+        kind_codes = netlist.kind_codes
+        for node_id in range(len(netlist)):
+            evaluations = self.evaluations[node_id]
+            if kind_codes[node_id] != INPUT_CODE:
+                evaluations += full
+            yield node_id, evaluations, self.toggles[node_id]
+
+    def hottest(self, netlist, count=10):
+        # En çok değerlendirilen kapılar; eşitlikte çok değişen önce gelir
+        counts = [item for item in self.gate_counts(netlist) if item[1] or item[2]]
+        counts.sort(key=lambda item: (-item[1], -item[2], item[0]))
+        return counts[:count]
+
+    def to_dict(self, netlist):
+        return {
+            "sections": {name: stats.to_dict() for name, stats in sorted(self.sections.items())},
+            "full_evaluations": self.full_evaluations,
+            "gates": [
+                {"id": node_id, "kind": netlist.kind(node_id), "name": netlist.names.get(node_id),
+                 "evaluations": evaluations, "toggles": toggles}
+                for node_id, evaluations, toggles in self.gate_counts(netlist) if evaluations or toggles
+            ],
+        }
+
+    def export_json(self, netlist, path):
+        with open(path, "w", encoding="utf-8") as stream:
+            json.dump(self.to_dict(netlist), stream, indent=1)
+
+    def export_csv(self, netlist, path):
+        # Kapı başına bir satır; bölüm süreleri JSON dışa aktarımındadır
+        with open(path, "w", encoding="utf-8", newline="") as stream:
+            writer = csv.writer(stream)
+            writer.writerow(["id", "kind", "name", "evaluations", "toggles"])
+            for node_id, evaluations, toggles in self.gate_counts(netlist):
+                writer.writerow([node_id, netlist.kind(node_id), netlist.names.get(node_id, ""), evaluations, toggles])
+
+    def summary_lines(self, netlist, count=5):
+        # Katman (overlay) için kısa metin
+        lines = []
+        for name, stats in sorted(self.sections.items()):
+            mean = stats.total / stats.count if stats.count else 0.0
+            lines.append("%-13s %6d  ort %8.3f ms  en çok %8.3f ms" % (name, stats.count, mean * 1e3,
+                                                                      stats.maximum * 1e3))
+        for node_id, evaluations, toggles in self.hottest(netlist, count):
+            lines.append("#%-6d %-6s değerlendirme %d  değişim %d" % (node_id, netlist.kind(node_id),
+                                                                      evaluations, toggles))
+        return lines
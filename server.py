@@ -0,0 +1,307 @@
+# Yerel simülasyon sunucusu (asyncio). Unix soketi ya da yalnızca 127.0.0.1 üzerinde TCP dinler;
+# yüklenen devreler derlenmiş halleriyle kimlik altında önbellekte tutulur ve tüm istemciler
+# tarafından paylaşılır. Protokol satır başına bir JSON nesnesidir:
+#
+#   {"id": 1, "op": "load", "path": "devre.devre"}          -> {"id": 1, "result": {"circuit": "c1", ...}}
+#   {"id": 2, "op": "evaluate", "circuit": "c1", "vectors": ["0101", "1100"]}
+#   {"id": 3, "op": "toggle", "circuit": "c1", "inputs": [0, "cin"]}
+#   {"id": 4, "op": "truth_table", "circuit": "c1"}
+#   {"id": 5, "op": "batch", "requests": [{"op": ...}, ...]}
+#
+# Hatalar {"id": ..., "error": "ileti"} olarak döner. Bir bağlantıdaki istekler sırayla yanıtlanır;
+# istemci yanıt beklemeden art arda istek gönderebilir (pipelining). Ağır işler iş parçacığı
+# havuzunda çalışır, böylece olay döngüsü diğer istemcilere yanıt vermeyi sürdürür.
+import argparse
+import asyncio
+import json
+import os
+import stat
+import sys
+
+import cli
+import storage
+from bitsim import BitParallelSimulator
+from netlist import NetlistError
+from simulator import Simulator
+
+DEFAULT_PORT = 8765
+LOCAL_HOST = "127.0.0.1"
+# Bir istek satırının en büyük boyu (toplu istekler için geniş tutulur)
+LINE_LIMIT = 64 << 20
+# Bu kadar girişten büyük devrelerin doğruluk tablosu tek yanıtta döndürülmez
+MAX_TRUTH_TABLE_INPUTS = 24
+
+
+def parse_address(address):
+    # "/yol/soket" ya da "unix:/yol" -> Unix soketi; "8765" ya da "127.0.0.1:8765" -> TCP
+    if isinstance(address, int):
+        return None, address
+    if address.startswith("unix:"):
+        return address[len("unix:"):], None
+    if "/" in address or address.endswith(".sock"):
+        return address, None
+    host, _, port = address.rpartition(":")
+    if host not in ("", LOCAL_HOST, "localhost"):
+        raise NetlistError("Sunucu yalnızca yerel adreslerde çalışır: %s" % address)
+    return None, int(port)
+
+
+def error_message(error):
+    if isinstance(error, (NetlistError, OSError)):
+        return str(error)
+    return "%s: %s" % (type(error).__name__, error)
+
+
+def list_field(request, name, types):
+    # İstek alanları derin işlere girmeden önce türce denetlenir
+    value = request.get(name)
+    if not isinstance(value, list) or not all(isinstance(item, types) and not isinstance(item, bool)
+                                              for item in value):
+        raise NetlistError("'%s' alanı uygun türde elemanlardan oluşan bir liste olmalıdır." % name)
+    return value
+
+
+def string_field(request, name):
+    value = request.get(name)
+    if not isinstance(value, str):
+        raise NetlistError("'%s' alanı bir dizgi olmalıdır." % name)
+    return value
+
+
+class LoadedCircuit:
+    def __init__(self, circuit_id, netlist, source):
+        self.id = circuit_id
+        self.netlist = netlist
+        self.source = source
+        # Derlenmiş programlar yükleme sırasında bir kez hazırlanır; devre sonradan değiştirilmez
+        self.simulator = Simulator(netlist, event_driven=True)
+        self.simulator.compiled()
+        self.words = BitParallelSimulator(netlist)
+        self.words.compiled()
+        self.simulator.evaluate()
+        self.input_positions = {}
+        for position, node_id in enumerate(netlist.input_ids):
+            self.input_positions[position] = node_id
+            name = netlist.names.get(node_id)
+            if name is not None:
+                self.input_positions.setdefault(name, node_id)
+        # Durumlu istekler (toggle) aynı devre üzerinde sırayla uygulanır
+        self.lock = asyncio.Lock()
+
+    def describe(self):
+        netlist = self.netlist
+        return {
+            "circuit": self.id,
+            "source": self.source,
+            "nodes": len(netlist),
+            "inputs": [netlist.names.get(node_id) or str(position) for position, node_id in enumerate(netlist.input_ids)],
+            "outputs": len(netlist.output_ids),
+        }
+
+    def output_string(self):
+        values = self.netlist.values
+        return "".join("1" if values[node_id] else "0" for node_id in self.netlist.output_ids)
+
+    def evaluate(self, vectors):
+        # Vektörler bir kerede kelimelere paketlenip bit paralel simüle edilir; durum değişmez
+        input_count = len(self.netlist.input_ids)
+        lines = [vector.encode("ascii") for vector in vectors]
+        if any(len(line) != input_count for line in lines) or b"".join(lines).translate(None, b"01"):
+            raise NetlistError("Her vektör %d bitlik 0/1 dizisi olmalıdır." % input_count)
+        if not lines:
+            return []
+        rows = b"".join(lines)
+        words = [cli.column_word(rows[index::input_count]) for index in range(input_count)]
+        outputs = self.words.simulate_words(words, len(lines))
+        return b"".join(cli.write_text_blocks([(outputs, len(lines))])).decode("ascii").splitlines()
+
+    def toggle(self, inputs):
+        # Girişler sırayla tersine çevrilir; her adımdan sonraki çıkışlar döndürülür
+        nodes = self.netlist.nodes
+        results = []
+        for key in inputs:
+            node_id = self.input_positions.get(key)
+            if node_id is None:
+                raise NetlistError("Bilinmeyen giriş: %r" % (key,))
+            self.simulator.toggle(nodes[node_id])
+            results.append(self.output_string())
+        return results
+
+    def truth_table(self):
+        if len(self.netlist.input_ids) > MAX_TRUTH_TABLE_INPUTS:
+            raise NetlistError("Doğruluk tablosu en fazla %d girişli devreler için döndürülür." % MAX_TRUTH_TABLE_INPUTS)
+        return ["%x" % word for word in self.words.truth_table()]
+
+
+class SimulationServer:
+    def __init__(self):
+        self.circuits = {}
+        # (mutlak yol, değişiklik zamanı, boyut) -> kimlik; aynı dosya tekrar derlenmez
+        self.sources = {}
+        self.loading = {}
+        self.next_id = 1
+        self.server = None
+        self.socket_path = None
+        self.port = None
+        self.clients = 0
+
+    async def start(self, address, limit=LINE_LIMIT):
+        # limit: bağlantı başına okuma tamponu; istek satırı bundan uzun olamaz
+        path, port = parse_address(address)
+        if path is not None:
+            if os.path.lexists(path):
+                # Yalnızca önceki çalışmadan kalan soket silinir; yanlış yazılmış yol veriyi silmesin
+                if not stat.S_ISSOCK(os.lstat(path).st_mode):
+                    raise NetlistError("%s bir soket değil; üzerine yazılmayacak." % path)
+                os.unlink(path)
+            self.server = await asyncio.start_unix_server(self.handle_client, path, limit=limit)
+            self.socket_path = path
+        else:
+            self.server = await asyncio.start_server(self.handle_client, LOCAL_HOST, port, limit=limit)
+            self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    @property
+    def address(self):
+        return self.socket_path if self.socket_path is not None else "%s:%d" % (LOCAL_HOST, self.port)
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        if self.socket_path is not None and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def handle_client(self, reader, writer):
+        self.clients += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(self.encode({"id": None, "error": "İstek satırı çok uzun."}))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self.respond(line)
+                writer.write(self.encode(response))
+                # Yavaş okuyan istemci için yazma tamponu boşalana kadar beklenir
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    @staticmethod
+    def encode(response):
+        return json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    async def respond(self, line):
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise NetlistError("İstek bir JSON nesnesi olmalıdır.")
+            request_id = request.get("id")
+            return {"id": request_id, "result": await self.dispatch(request)}
+        except Exception as error:
+            # Beklenmeyen hatalar da yalnızca bu isteğin yanıtı olur; bağlantı açık kalır
+            return {"id": request_id, "error": error_message(error)}
+
+    async def dispatch(self, request):
+        operation = request.get("op")
+        if operation == "batch":
+            # Toplu istekler sırayla uygulanır; her birinin sonucu ya da hatası ayrı döner
+            responses = []
+            for item in list_field(request, "requests", dict):
+                try:
+                    responses.append({"result": await self.dispatch(item)})
+                except Exception as error:
+                    responses.append({"error": error_message(error)})
+            return responses
+        if operation == "ping":
+            return "pong"
+        if operation == "load":
+            return (await self.load(request)).describe()
+        if operation == "circuits":
+            return [circuit.describe() for circuit in self.circuits.values()]
+        circuit = self.circuits.get(request.get("circuit"))
+        if circuit is None:
+            raise NetlistError("Bilinmeyen devre: %r" % (request.get("circuit"),))
+        if operation == "unload":
+            del self.circuits[circuit.id]
+            self.sources = {key: value for key, value in self.sources.items() if value != circuit.id}
+            return True
+        if operation == "evaluate":
+            return await asyncio.to_thread(circuit.evaluate, list_field(request, "vectors", str))
+        if operation == "toggle":
+            async with circuit.lock:
+                return await asyncio.to_thread(circuit.toggle, list_field(request, "inputs", (int, str)))
+        if operation == "outputs":
+            return circuit.output_string()
+        if operation == "truth_table":
+            return await asyncio.to_thread(circuit.truth_table)
+        raise NetlistError("Bilinmeyen işlem: %r" % (operation,))
+
+    async def load(self, request):
+        if "text" in request:
+            lines = enumerate(string_field(request, "text").splitlines(), 1)
+            netlist = await asyncio.to_thread(storage.read_text, lines, "<istek>", {})
+            return await self.register(netlist, "<istek>")
+        path = os.path.abspath(string_field(request, "path"))
+        status = os.stat(path)
+        key = (path, status.st_mtime_ns, status.st_size)
+        circuit_id = self.sources.get(key)
+        if circuit_id in self.circuits:
+            return self.circuits[circuit_id]
+        # Aynı dosyayı aynı anda yükleyen istemciler tek derlemeyi bekler
+        task = self.loading.get(key)
+        if task is None:
+            task = self.loading[key] = asyncio.ensure_future(self._load_path(key))
+            task.add_done_callback(lambda _: self.loading.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load_path(self, key):
+        netlist = await asyncio.to_thread(cli.load_circuit, key[0])
+        circuit = await self.register(netlist, key[0])
+        self.sources[key] = circuit.id
+        return circuit
+
+    async def register(self, netlist, source):
+        circuit_id = "c%d" % self.next_id
+        self.next_id += 1
+        # Derleme olay döngüsünü durdurmasın diye iş parçacığında yapılır
+        circuit = await asyncio.to_thread(LoadedCircuit, circuit_id, netlist, source)
+        self.circuits[circuit_id] = circuit
+        return circuit
+
+async def serve(address, preload=()):
+    server = await SimulationServer().start(address)
+    for path in preload:
+        circuit = await server.load({"path": path})
+        print("%s: %s" % (circuit.id, path), file=sys.stderr)
+    print("Dinleniyor: %s" % server.address, file=sys.stderr)
+    async with server.server:
+        await server.server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel simülasyon sunucusu")
+    parser.add_argument("--socket", help="Unix soketi yolu")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="127.0.0.1 üzerindeki TCP portu")
+    parser.add_argument("preload", nargs="*", help="başlangıçta yüklenecek devreler")
+    arguments = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(arguments.socket or arguments.port, arguments.preload))
+    except KeyboardInterrupt:
+        pass
+    except (OSError, NetlistError) as error:
+        print("Hata: %s" % error, file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+# Devre modelini değerlendiren, Tkinter kullanmayan simülasyon motoru
+import heapq
+
+from compiler import compile_netlist
+from netlist import INPUT, CycleError
+from optimizer import optimize
+
+
+class Simulator:
+    def __init__(self, netlist, event_driven=False, optimized=False):
+        self.netlist = netlist
+        # Olay güdümlü kipte giriş değişiklikleri yalnızca etkiledikleri koniyi yeniden hesaplar
+        self.event_driven = event_driven
+        # Sadeleştirme açıksa değerlendirme optimizer ile küçültülmüş devrede yapılır ve sonuçlar
+        # asıl devreye geri yazılır; sadeleştirmede atılan (gözlenemeyen) kapıların değerleri güncellenmez
+        self.optimized = optimized
+        self._applying_inputs = False
+        self._program = None
+        self._program_version = -1
+        self._reduction = None
+        self._reduction_version = -1
+        self._inner = None
+        # profiler.Profiler atanırsa sıralama, derleme ve değerlendirme adımları ölçülür
+        self.profiler = None
+        netlist.add_listener(self.on_netlist_change)
+
+    def on_netlist_change(self, event, payload):
+        if not self.event_driven or self._applying_inputs:
+            return
+        if event == "values":
+            sources = [node for node in payload if node.kind == INPUT]
+            if sources:
+                self.propagate(sources)
+        elif event == "connected":
+            try:
+                self.update([payload[1]])
+            except CycleError:
+                # Yeni bağlantı geri besleme oluşturdu: sıfır gecikmeli kip bırakılır ki sonraki giriş
+                # değişiklikleri hata vermesin. Hata yükseltilmez; connect diğer dinleyicileri ve alt devre
+                # örneğinin kalan çıkışlarını tamamlamalıdır. Çağıran connect'ten sonra cycle_nodes'a bakar.
+                self.event_driven = False
+
+    def compiled(self):
+        # Derlenmiş fonksiyon topoloji değişene kadar önbellekte tutulur
+        if self._program_version != self.netlist.version:
+            if self.profiler is None:
+                self._program = compile_netlist(self.netlist)
+            else:
+                with self.profiler.section("compile"):
+                    self._program = compile_netlist(self.netlist)
+            self._program_version = self.netlist.version
+        return self._program
+
+    def reduction(self):
+        # Sadeleştirilmiş devre ve onu değerlendiren iç simülatör topoloji değişene kadar önbellekte tutulur
+        if self._reduction_version != self.netlist.version:
+            if self.profiler is None:
+                self._reduction = optimize(self.netlist)
+            else:
+                with self.profiler.section("optimize"):
+                    self._reduction = optimize(self.netlist)
+            self._inner = Simulator(self._reduction.netlist)
+            self._reduction_version = self.netlist.version
+            # İlk değerlendirmede tüm eşlemeler yazılır, sonrakilerde yalnızca değişenler
+            self._stored = False
+        return self._reduction
+
+    def evaluate(self):
+        if self.profiler is None:
+            return self._evaluate()
+        with self.profiler.section("tick"):
+            return self._evaluate()
+
+    def _evaluate(self, source_ids=()):
+        # Tüm devreyi derlenmiş fonksiyonla değerlendir, değeri değişenleri bildir.
+        # source_ids: değeri önceden değiştirilmiş girişler; değişimleri burada bir kez sayılır
+        nodes = self.netlist.nodes
+        if self.optimized:
+            reduction = self.reduction()
+            input_ids = reduction.load_inputs()
+            reduced_ids = input_ids + self._inner._evaluate_ids()
+            changed_ids = reduction.store(reduced_ids if self._stored else None)
+            self._stored = True
+        else:
+            changed_ids = self._evaluate_ids()
+        if self.profiler is not None:
+            self.profiler.count_full_evaluation()
+            self._count_toggles(source_ids, changed_ids)
+        changed = [nodes[node_id] for node_id in changed_ids]
+        if changed:
+            self.netlist.notify("values", changed)
+        return changed
+
+    def _evaluate_ids(self):
+        # Değerleri yerinde günceller ve değişen kimlikleri döndürür; bildirim yapılmaz
+        program = self.compiled()
+        old_values = self.netlist.values
+        new_values = program(old_values)
+        changed_ids = [index for index, value in enumerate(new_values) if value != old_values[index]]
+        for node_id in changed_ids:
+            old_values[node_id] = bool(new_values[node_id])
+        return changed_ids
+
+    def _count_toggles(self, source_ids, changed_ids):
+        # Kaynaklar ve değişen düğümler birlikte sayılır; her düğüm bir kez
+        sources = set(source_ids)
+        self.profiler.count_toggles(list(source_ids) + [node_id for node_id in changed_ids if node_id not in sources])
+
+    def propagate(self, sources):
+        # Değeri değişen kaynakların yalnızca çıkış konisini değerlendir
+        source_ids = [source.id for source in sources]
+        if self.optimized:
+            # Kaynakların değişimi _propagate_reduced içinde sayılır
+            if self.profiler is None:
+                return self._propagate_reduced(source_ids)
+            with self.profiler.section("tick"):
+                return self._propagate_reduced(source_ids)
+        if self.profiler is not None:
+            self.profiler.count_toggles(source_ids)
+        return self.update([successor for source in sources for successor in source.fanout])
+
+    def _propagate_reduced(self, source_ids):
+        # Girişler sadeleştirilmiş devreye kopyalanır, yalnızca oradaki koni yeniden hesaplanır ve
+        # değişen düğümlerin karşılıkları asıl devreye yazılır. Topoloji değiştiyse tam değerlendirilir.
+        if self._reduction_version != self.netlist.version:
+            return self._evaluate(source_ids)
+        reduction = self._reduction
+        reduced = reduction.netlist
+        input_ids = reduction.load_inputs(source_ids)
+        successors = [reduced.nodes[successor] for input_id in input_ids for successor in reduced.fanout_ids(input_id)]
+        changed_ids = reduction.store(input_ids + [node.id for node in self._inner._update(successors)])
+        if self.profiler is not None:
+            self._count_toggles(source_ids, changed_ids)
+        changed = [self.netlist.nodes[node_id] for node_id in changed_ids]
+        if changed:
+            self.netlist.notify("values", changed)
+        return changed
+
+    def update(self, nodes):
+        if self.profiler is None:
+            return self._update(nodes)
+        with self.profiler.section("tick"):
+            return self._update(nodes)
+
+    def _update(self, nodes):
+        if self.optimized:
+            # Asıl devredeki düğümlerin sadeleştirilmiş devrede karşılığı olmayabilir
+            return self._evaluate()
+        netlist = self.netlist
+        profiler = self.profiler
+        if profiler is None:
+            netlist.levelize()
+        else:
+            with profiler.section("sort"):
+                netlist.levelize()
+        if netlist.cycle_nodes:
+            raise CycleError(netlist.cycle_nodes)
+        # Kuyruk yalnızca tamsayı kimliklerle çalışır; Node nesneleri bildirim için oluşturulur
+        levels = netlist.node_levels
+        values = netlist.values
+        queue = []
+        queued = set()
+        for node in nodes:
+            if node.id not in queued:
+                queued.add(node.id)
+                heapq.heappush(queue, (levels[node.id], node.id))
+        changed_ids = []
+        while queue:
+            _, node_id = heapq.heappop(queue)
+            queued.discard(node_id)
+            if profiler is not None:
+                profiler.count_evaluation(node_id)
+            function = netlist.node_function(node_id)
+            value = function([bool(values[input_id]) for input_id in netlist.fanin_ids(node_id)])
+            if value == values[node_id]:
+                # Çıkışı değişmeyen kapıda yayılım durur
+                continue
+            values[node_id] = value
+            changed_ids.append(node_id)
+            for successor in netlist.fanout_ids(node_id):
+                if successor not in queued:
+                    queued.add(successor)
+                    heapq.heappush(queue, (levels[successor], successor))
+        if profiler is not None:
+            profiler.count_toggles(changed_ids)
+        changed = [netlist.nodes[node_id] for node_id in changed_ids]
+        if changed:
+            self.netlist.notify("values", changed)
+        return changed
+
+    def set_input(self, node, value):
+        # Girişi değiştir ve yalnızca etkilenen koniyi yeniden hesapla
+        if node.value == bool(value):
+            return []
+        self._applying_inputs = True
+        try:
+            self.netlist.set_input(node, value)
+        finally:
+            self._applying_inputs = False
+        return self.propagate([node])
+
+    def toggle(self, node):
+        return self.set_input(node, not node.value)
+
+    def set_inputs(self, values):
+        # values: giriş düğümü -> bool eşlemesi
+        self._applying_inputs = True
+        try:
+            for node, value in values.items():
+                self.netlist.set_input(node, value)
+        finally:
+            self._applying_inputs = False
+        return self.evaluate()
+
+    def reset(self):
+        return self.set_inputs({node: False for node in self.netlist.inputs})
+
+    def output_values(self):
+        return [node.value for node in self.netlist.outputs]
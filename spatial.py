@@ -0,0 +1,67 @@
+# Tuvaldeki bağlantı noktaları ve bileşen gövdeleri için ızgara tabanlı uzamsal indeks.
+# Her kayıt kapsadığı hücrelere eklenir; nokta sorgusu yalnızca tek bir hücreye bakar.
+
+DEFAULT_CELL_SIZE = 64
+
+
+class SpatialGrid:
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.boxes = {}
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def __contains__(self, item):
+        return item in self.boxes
+
+    def _cells(self, box):
+        x0, y0, x1, y1 = box
+        size = self.cell_size
+        for cell_x in range(int(x0 // size), int(x1 // size) + 1):
+            for cell_y in range(int(y0 // size), int(y1 // size) + 1):
+                yield (cell_x, cell_y)
+
+    def insert(self, item, box):
+        # box: (x0, y0, x1, y1); aynı kayıt tekrar eklenirse konumu güncellenir
+        if item in self.boxes:
+            self.remove(item)
+        self.boxes[item] = box
+        for cell in self._cells(box):
+            self.cells.setdefault(cell, {})[item] = None
+
+    def remove(self, item):
+        box = self.boxes.pop(item)
+        for cell in self._cells(box):
+            items = self.cells[cell]
+            del items[item]
+            if not items:
+                del self.cells[cell]
+
+    def query_point(self, x, y):
+        size = self.cell_size
+        result = []
+        for item in self.cells.get((int(x // size), int(y // size)), ()):
+            x0, y0, x1, y1 = self.boxes[item]
+            if x0 < x < x1 and y0 < y < y1:
+                result.append(item)
+        return result
+
+    def query_box(self, box):
+        # Kutuyla kesişen kayıtlar; her kayıt bir kez döner
+        x0, y0, x1, y1 = box
+        size = self.cell_size
+        cell_count = (int(x1 // size) - int(x0 // size) + 1) * (int(y1 // size) - int(y0 // size) + 1)
+        if cell_count > len(self.cells):
+            # Kutu dolu hücre sayısından genişse boş hücreleri gezmek yerine dolu hücreler taranır
+            cells = self.cells.values()
+        else:
+            cells = (self.cells.get(cell, ()) for cell in self._cells(box))
+        result = {}
+        for items in cells:
+            for item in items:
+                item_x0, item_y0, item_x1, item_y1 = self.boxes[item]
+                if item_x0 < x1 and x0 < item_x1 and item_y0 < y1 and y0 < item_y1:
+                    result[item] = None
+        return list(result)
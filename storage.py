@@ -0,0 +1,344 @@
+# Devre dosyaları: farklar (diff) için satır tabanlı metin biçimi ve büyük tasarımlar için ikili biçim.
+# İkili dosya, Netlist'in sütunlarının ham baytlarıdır; mmap ile açılıp her sütun tek seferde
+# kopyalanır, düğüm başına nesne oluşturulmaz ve ayrıştırma yapılmaz.
+# Alt devre tanımları her iki biçimde de metin olarak, kullanıldıkları devreden önce yazılır.
+import io
+import mmap
+import operator
+import os
+import struct
+import sys
+from array import array
+
+from netlist import Netlist, NetlistError, GATE_KINDS, KIND_CODES, NO_EDGE, SUBCIRCUIT
+from subcircuit import SubcircuitDefinition
+
+TEXT_HEADER = "# devre 1"
+BINARY_MAGIC = b"DEVR"
+BINARY_VERSION = 1
+BINARY_EXTENSION = ".devreb"
+TEXT_EXTENSION = ".devre"
+# büyü, sürüm, bayraklar, düğüm sayısı, kenar sayısı, isim tablosu uzunluğu
+HEADER_FORMAT = "<4sHHIII"
+FLAG_LEVELS_VALID = 1
+# İsim tablosundan sonra uzunluğuyla birlikte alt devre bölümü gelir
+FLAG_SUBCIRCUITS = 2
+DEFINE = "DEFINE"
+END = "END"
+# Bölümler 8 bayta hizalanır ki numpy.frombuffer ile doğrudan dizi olarak da okunabilsin
+ALIGNMENT = 8
+
+
+def used_definitions(netlist, result=None):
+    # İç içe tanımlar kendilerini kullanan tanımdan önce gelecek sırayla
+    result = {} if result is None else result
+    for definition, _ in netlist.subcircuits.values():
+        if definition.name not in result:
+            used_definitions(definition.netlist, result)
+            result[definition.name] = definition
+    return result
+
+
+def write_definitions(netlist, stream):
+    # DEFINE ad / tanımın düğüm satırları / END
+    for name, definition in used_definitions(netlist).items():
+        stream.write("%s %s\n" % (DEFINE, name))
+        write_nodes(definition.netlist, stream)
+        stream.write(END + "\n")
+
+
+def write_nodes(netlist, stream):
+    # Her satır: kimlik tür x y giriş-kimlikleri(virgülle, yoksa -) [isim]
+    # Alt devre çıkışlarında isimden önce "tanım/çıkış-sırası" alanı gelir
+    for node_id in range(len(netlist)):
+        input_ids = netlist.fanin_ids(node_id)
+        fields = ["%d" % node_id, netlist.kind(node_id), "%.9g" % netlist.xs[node_id],
+                  "%.9g" % netlist.ys[node_id], ",".join(map(str, input_ids)) or "-"]
+        subcircuit = netlist.subcircuits.get(node_id)
+        if subcircuit is not None:
+            fields.append("%s/%d" % (subcircuit[0].name, subcircuit[1]))
+        name = netlist.names.get(node_id)
+        if name is not None:
+            fields.append(name)
+        stream.write(" ".join(fields) + "\n")
+
+
+def save_text(netlist, path):
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.write(TEXT_HEADER + "\n")
+        write_definitions(netlist, stream)
+        write_nodes(netlist, stream)
+
+
+def load_text(path):
+    with open(path, encoding="utf-8") as stream:
+        return read_text(enumerate(stream, 1), path, {})
+
+
+def _subcircuit_field(field, definitions):
+    name, output_index = field.rsplit("/", 1)
+    if name not in definitions:
+        raise ValueError(name)
+    return definitions[name], int(output_index)
+
+
+def read_text(lines, path, definitions, nested=False):
+    # Satırlar (satır numarası, satır) çiftleridir; DEFINE blokları aynı okuyucuyla özyinelemeli okunur.
+    # Kenarlar ileri başvurular için düğümlerden sonra bağlanır.
+    netlist = Netlist()
+    sources = array("i")
+    targets = array("i")
+    for line_number, line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line == END and nested:
+            break
+        if line.startswith(DEFINE + " "):
+            name = line[len(DEFINE):].strip()
+            definitions[name] = SubcircuitDefinition(name, read_text(lines, path, definitions, True))
+            continue
+        fields = line.split(None, 5)
+        if len(fields) < 5 or fields[1] not in KIND_CODES:
+            raise NetlistError("%s:%d: Geçersiz satır." % (path, line_number))
+        subcircuit = None
+        try:
+            node_id = int(fields[0])
+            x = float(fields[2])
+            y = float(fields[3])
+            input_ids = [] if fields[4] == "-" else [int(value) for value in fields[4].split(",")]
+            if fields[1] == SUBCIRCUIT:
+                fields = line.split(None, 6)
+                subcircuit = _subcircuit_field(fields.pop(5), definitions)
+        except (ValueError, IndexError):
+            raise NetlistError("%s:%d: Geçersiz satır." % (path, line_number))
+        name = fields[5] if len(fields) > 5 else None
+        if subcircuit is None:
+            if node_id != len(netlist):
+                raise NetlistError("%s:%d: Düğüm kimlikleri sıralı olmalıdır." % (path, line_number))
+            netlist.add_node(fields[1], x, y, name)
+        else:
+            # Örneğin ilk satırı tüm çıkışları oluşturur, sonraki satırlar yalnızca konum ve isim verir
+            if subcircuit[1] == 0 and node_id == len(netlist):
+                netlist.add_instance(subcircuit[0], x, y)
+            if netlist.subcircuits.get(node_id) != subcircuit:
+                raise NetlistError("%s:%d: Düğüm kimlikleri sıralı olmalıdır." % (path, line_number))
+            netlist.xs[node_id] = x
+            netlist.ys[node_id] = y
+            if name is not None:
+                netlist.names[node_id] = name
+        if netlist.instance_base(node_id) != node_id:
+            # Örneğin diğer çıkışlarının kenarları ilk çıkışa bağlanırken eklenir
+            continue
+        for input_id in input_ids:
+            sources.append(input_id)
+            targets.append(node_id)
+    else:
+        if nested:
+            raise NetlistError("%s: Alt devre tanımı %s ile bitmiyor." % (path, END))
+    nodes = netlist.nodes
+    for source_id, target_id in zip(sources, targets):
+        if not 0 <= source_id < len(netlist):
+            raise NetlistError("%s: Bilinmeyen düğüm kimliği: %d" % (path, source_id))
+        netlist.connect(nodes[source_id], nodes[target_id])
+    return netlist
+
+
+def _pad(stream, offset):
+    padding = -offset % ALIGNMENT
+    stream.write(bytes(padding))
+    return offset + padding
+
+
+def _columns(netlist):
+    # Kenarlar hedef sırasına göre yeniden numaralandırılır; böylece kaynak sütunu fan-in CSR dizisidir
+    order = array("i")
+    new_ids = array("i", [NO_EDGE]) * len(netlist.edge_sources)
+    offsets = array("i", [0])
+    for node_id in range(len(netlist)):
+        edge = netlist.first_input_edge[node_id]
+        while edge != NO_EDGE:
+            new_ids[edge] = len(order)
+            order.append(edge)
+            edge = netlist.next_input_edge[edge]
+        offsets.append(len(order))
+
+    def remap(column):
+        return array("i", (NO_EDGE if edge == NO_EDGE else new_ids[edge] for edge in column))
+
+    def reorder(column):
+        return remap(column[edge] for edge in order)
+
+    return [
+        bytes(netlist.kind_codes),
+        offsets,
+        array("i", (netlist.edge_sources[edge] for edge in order)),
+        array("i", (netlist.edge_targets[edge] for edge in order)),
+        netlist.xs,
+        netlist.ys,
+        netlist.node_levels,
+        reorder(netlist.next_input_edge),
+        remap(netlist.first_input_edge),
+        remap(netlist.last_input_edge),
+        reorder(netlist.next_output_edge),
+        remap(netlist.first_output_edge),
+        remap(netlist.last_output_edge),
+    ]
+
+
+def save_binary(netlist, path):
+    netlist.levelize()
+    flags = 0 if netlist.cycle_nodes else FLAG_LEVELS_VALID
+    names = "".join("%d\t%s\n" % item for item in sorted(netlist.names.items())).encode("utf-8")
+    subcircuits = b""
+    if netlist.subcircuits:
+        # Tanım blokları ve ardından "kimlik<TAB>tanım<TAB>çıkış-sırası" satırları
+        flags |= FLAG_SUBCIRCUITS
+        text = io.StringIO()
+        write_definitions(netlist, text)
+        for node_id, (definition, output_index) in sorted(netlist.subcircuits.items()):
+            text.write("%d\t%s\t%d\n" % (node_id, definition.name, output_index))
+        subcircuits = text.getvalue().encode("utf-8")
+    header = struct.pack(HEADER_FORMAT, BINARY_MAGIC, BINARY_VERSION, flags, len(netlist),
+                         len(netlist.edge_sources), len(names))
+    with open(path, "wb") as stream:
+        stream.write(header)
+        offset = _pad(stream, len(header))
+        for column in _columns(netlist):
+            if isinstance(column, array) and sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+            data = column if isinstance(column, bytes) else column.tobytes()
+            stream.write(data)
+            offset = _pad(stream, offset + len(data))
+        stream.write(names)
+        if flags & FLAG_SUBCIRCUITS:
+            stream.write(struct.pack("<I", len(subcircuits)))
+            stream.write(subcircuits)
+
+
+def _binary_size(node_count, edge_count, names_size):
+    # Başlığa göre dosyada bulunması gereken en az bayt sayısı (alt devre bölümü hariç): tür baytları,
+    # CSR başlangıçları, dört kenar ve yedi düğüm sütunu (_columns), her biri hizalanmış olarak
+    sizes = [struct.calcsize(HEADER_FORMAT), node_count, 4 * (node_count + 1)]
+    sizes += [4 * edge_count] * 4 + [4 * node_count] * 7
+    return sum(size + (-size % ALIGNMENT) for size in sizes) + names_size
+
+
+def _read_column(view, offset, typecode, count):
+    column = array(typecode)
+    size = column.itemsize * count
+    column.frombytes(view[offset:offset + size])
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column, offset + size + (-(offset + size) % ALIGNMENT)
+
+
+def _in_range(column, low, high):
+    return not column or (min(column) >= low and max(column) < high)
+
+
+def load_binary(path):
+    with open(path, "rb") as stream:
+        if os.fstat(stream.fileno()).st_size < struct.calcsize(HEADER_FORMAT):
+            raise NetlistError("%s: Desteklenmeyen devre dosyası." % path)
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return _load_binary_view(view, path)
+            finally:
+                view.release()
+
+
+def _load_binary_view(view, path):
+    header_size = struct.calcsize(HEADER_FORMAT)
+    magic, version, flags, node_count, edge_count, names_size = struct.unpack_from(HEADER_FORMAT, view)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise NetlistError("%s: Desteklenmeyen devre dosyası." % path)
+    # Kesik dosyalar sütunlar okunmadan yakalanır
+    if len(view) < _binary_size(node_count, edge_count, names_size):
+        raise NetlistError("%s: Devre dosyası eksik (kesik)." % path)
+    netlist = Netlist()
+    offset = header_size + (-header_size % ALIGNMENT)
+    netlist.kind_codes = bytearray(view[offset:offset + node_count])
+    if any(code >= len(GATE_KINDS) for code in set(netlist.kind_codes)):
+        raise NetlistError("%s: Bilinmeyen kapı türü." % path)
+    offset += node_count + (-node_count % ALIGNMENT)
+    offsets, offset = _read_column(view, offset, "i", node_count + 1)
+    netlist.edge_sources, offset = _read_column(view, offset, "i", edge_count)
+    netlist.edge_targets, offset = _read_column(view, offset, "i", edge_count)
+    netlist.xs, offset = _read_column(view, offset, "f", node_count)
+    netlist.ys, offset = _read_column(view, offset, "f", node_count)
+    netlist.node_levels, offset = _read_column(view, offset, "i", node_count)
+    netlist.next_input_edge, offset = _read_column(view, offset, "i", edge_count)
+    netlist.first_input_edge, offset = _read_column(view, offset, "i", node_count)
+    netlist.last_input_edge, offset = _read_column(view, offset, "i", node_count)
+    netlist.next_output_edge, offset = _read_column(view, offset, "i", edge_count)
+    netlist.first_output_edge, offset = _read_column(view, offset, "i", node_count)
+    netlist.last_output_edge, offset = _read_column(view, offset, "i", node_count)
+    netlist.input_counts = array("i", map(operator.sub, offsets[1:], offsets[:-1]))
+    # Boyu doğru ama içeriği bozuk dosyalar burada yakalanır; aksi halde hata ancak gezinirken
+    # IndexError olarak çıkar. min/max her sütunu tek geçişte tarar.
+    node_columns = (netlist.edge_sources, netlist.edge_targets)
+    edge_columns = (netlist.next_input_edge, netlist.first_input_edge, netlist.last_input_edge,
+                    netlist.next_output_edge, netlist.first_output_edge, netlist.last_output_edge)
+    if (offsets[0] != 0 or offsets[-1] != edge_count or not _in_range(netlist.input_counts, 0, edge_count + 1)
+            or not all(_in_range(column, 0, node_count) for column in node_columns)
+            or not all(_in_range(column, NO_EDGE, edge_count) for column in edge_columns)):
+        raise NetlistError("%s: Geçersiz kenar verisi." % path)
+    netlist.values = bytearray(node_count)
+    try:
+        for line in bytes(view[offset:offset + names_size]).decode("utf-8").splitlines():
+            node_id, name = line.split("\t", 1)
+            netlist.names[int(node_id)] = name
+        if flags & FLAG_SUBCIRCUITS:
+            offset += names_size
+            size, = struct.unpack_from("<I", view, offset)
+            if len(view) < offset + 4 + size:
+                raise NetlistError("%s: Devre dosyası eksik (kesik)." % path)
+            _read_subcircuits(bytes(view[offset + 4:offset + 4 + size]).decode("utf-8"), netlist, path)
+    except (struct.error, ValueError):
+        raise NetlistError("%s: Geçersiz isim ya da alt devre bölümü." % path)
+    # Her alt devre düğümünün tablosu olmalıdır
+    subcircuit_code = KIND_CODES[SUBCIRCUIT]
+    if (netlist.kind_codes.count(subcircuit_code) != len(netlist.subcircuits)
+            or any(not 0 <= node_id < node_count or netlist.kind_codes[node_id] != subcircuit_code
+                   for node_id in netlist.subcircuits)):
+        raise NetlistError("%s: Geçersiz alt devre bölümü." % path)
+    if not flags & FLAG_LEVELS_VALID:
+        netlist.invalidate_levels()
+    netlist.version += 1
+    return netlist
+
+
+def _read_subcircuits(text, netlist, path):
+    definitions = {}
+    lines = enumerate(text.splitlines(), 1)
+    for line_number, line in lines:
+        if line.startswith(DEFINE + " "):
+            name = line[len(DEFINE):].strip()
+            definitions[name] = SubcircuitDefinition(name, read_text(lines, path, definitions, True))
+            continue
+        try:
+            node_id, name, output_index = line.split("\t")
+            netlist.subcircuits[int(node_id)] = (definitions[name], int(output_index))
+        except (ValueError, KeyError):
+            raise NetlistError("%s: Geçersiz alt devre bölümü." % path)
+    netlist.definitions = {definition.name: definition for definition, _ in netlist.subcircuits.values()}
+
+
+def save(netlist, path):
+    # Biçim uzantıdan seçilir
+    if path.endswith(BINARY_EXTENSION):
+        save_binary(netlist, path)
+    else:
+        save_text(netlist, path)
+
+
+def load(path):
+    # Biçim dosyanın ilk baytlarından anlaşılır
+    with open(path, "rb") as stream:
+        magic = stream.read(len(BINARY_MAGIC))
+    if magic == BINARY_MAGIC:
+        return load_binary(path)
+    return load_text(path)
@@ -0,0 +1,145 @@
+# Hiyerarşik alt devreler.
+# Bir tanım, girişleri INPUT ve çıkışları OUTPUT/LAMP düğümleri olan sıradan bir Netlist'tir.
+# En fazla MAX_TABLE_INPUTS girişli tanımlar oluşturulurken bir kez doğruluk tablosuna derlenir;
+# tablo tanımın tüm örnekleri arasında paylaşılır ve her örnek tek bir tablo okumasıyla değerlendirilir.
+# Daha büyük tanımlar örneklenirken kapılarıyla birlikte devreye açılır (düzleştirilir).
+from bitsim import BitParallelSimulator
+from compiler import compile_netlist
+from netlist import Netlist, NetlistError, INPUT, OR, BUFFER, SUBCIRCUIT, SINK_KINDS
+
+MAX_TABLE_INPUTS = 16
+# Kelimedeki k. bit -> sütundaki k. bayt (0/1)
+BIT_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def word_column(word, width):
+    return bin(word)[2:].zfill(width)[::-1].encode("ascii").translate(BIT_BYTES)
+
+
+def table_index(values):
+    # i. pinin değeri satır numarasının i. bitidir; bağlanmamış pinler 0 sayılır
+    index = 0
+    for position, value in enumerate(values):
+        if value:
+            index |= 1 << position
+    return index
+
+
+def _output_function(rows, output_index):
+    def evaluate(values):
+        return bool(rows[table_index(values)][output_index])
+    return evaluate
+
+
+class SubcircuitDefinition:
+    def __init__(self, name, netlist):
+        # Tanım oluşturulduktan sonra iç devre değiştirilmemelidir; tablo bir kez hesaplanır
+        if not name or "/" in name or any(character.isspace() for character in name):
+            raise NetlistError("Geçersiz alt devre adı: %r" % name)
+        netlist.topological_ids()
+        self.name = name
+        self.netlist = netlist
+        self.input_count = len(netlist.input_ids)
+        self.output_count = len(netlist.output_ids)
+        if not self.output_count:
+            raise NetlistError("Alt devrenin en az bir çıkışı olmalıdır.")
+        self.output_names = [netlist.names.get(node_id) or "%s.%d" % (name, index)
+                             for index, node_id in enumerate(netlist.output_ids)]
+        # Çıkış başına 2**giriş baytlık sütunlar; büyük tanımlarda None
+        self.columns = None
+        if self.input_count <= MAX_TABLE_INPUTS:
+            width = 1 << self.input_count
+            words = BitParallelSimulator(netlist).truth_table()
+            self.columns = [word_column(word, width) for word in words]
+        self._build_rows()
+
+    def _build_rows(self):
+        # Satır numarası -> çıkış değerleri demeti; örneğin tüm çıkışları tek okumayla elde edilir
+        self._word_program = None
+        if self.columns is None:
+            self.rows = None
+            self.output_functions = None
+            return
+        self.rows = list(zip(*self.columns))
+        self.output_functions = [_output_function(self.rows, index) for index in range(self.output_count)]
+
+    def __getstate__(self):
+        # Süreçler arasında yalnızca sütunlar taşınır; satırlar ve derlenmiş fonksiyonlar yeniden kurulur
+        state = dict(self.__dict__)
+        for key in ("rows", "output_functions", "_word_program"):
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._build_rows()
+
+    def __repr__(self):
+        return "SubcircuitDefinition(%r, %d giriş, %d çıkış)" % (self.name, self.input_count, self.output_count)
+
+    def evaluate(self, values):
+        return self.rows[table_index(values)]
+
+    def evaluate_words(self, words, mask):
+        # Bit paralel simülasyon için: iç devre kelime kipinde değerlendirilir
+        if self._word_program is None:
+            self._word_program = compile_netlist(self.netlist, words=True)
+        words = list(words) + [0] * (self.input_count - len(words))
+        return self._word_program(words, mask)
+
+    def path_delay(self, delays):
+        # Girişlerden çıkışlara en uzun gecikme; delays tür -> gecikme eşlemesidir
+        inner = self.netlist
+        arrival = [0] * len(inner)
+        for node_id in inner.topological_ids():
+            start = max((arrival[input_id] for input_id in inner.fanin_ids(node_id)), default=0)
+            subcircuit = inner.subcircuits.get(node_id)
+            if subcircuit is not None and SUBCIRCUIT not in delays:
+                arrival[node_id] = start + subcircuit[0].path_delay(delays)
+            else:
+                arrival[node_id] = start + delays[inner.kind(node_id)]
+        return max(arrival[node_id] for node_id in inner.output_ids)
+
+
+def instantiate(netlist, definition, x=0, y=0):
+    # Örneğin çıkış düğümlerini döndürür. Tablolu tanımlarda girişler herhangi bir çıkışa bağlanır;
+    # düzleştirilen tanımlarda girişler BUFFER, çıkışlar OR düğümü olarak eklenir.
+    if definition.rows is not None:
+        return netlist.add_instance(definition, x, y)
+    inner = definition.netlist
+    mapping = {}
+    for node_id in range(len(inner)):
+        subcircuit = inner.subcircuits.get(node_id)
+        if subcircuit is not None:
+            if subcircuit[1] == 0:
+                nodes = netlist.add_instance(subcircuit[0], x + inner.xs[node_id], y + inner.ys[node_id])
+                for offset, node in enumerate(nodes):
+                    mapping[node_id + offset] = node
+            continue
+        kind = inner.kind(node_id)
+        if kind == INPUT:
+            kind = BUFFER
+        elif kind in SINK_KINDS:
+            kind = OR
+        mapping[node_id] = netlist.add_node(kind, x + inner.xs[node_id], y + inner.ys[node_id],
+                                            inner.names.get(node_id))
+    for node_id in range(len(inner)):
+        if inner.instance_base(node_id) == node_id:
+            for input_id in inner.fanin_ids(node_id):
+                netlist.connect(mapping[input_id], mapping[node_id])
+    return [mapping[node_id] for node_id in inner.output_ids]
+
+
+def extract(netlist, node_ids, name):
+    # Seçili düğümlerden yeni bir tanım oluşturur; seçim içindeki bağlantılar korunur.
+    # Seçimdeki girişler tanımın pinleri, çıkış ve LED'ler tanımın çıkışları olur.
+    selected = sorted(set(member for node_id in node_ids for member in netlist.instance_ids(node_id)))
+    new_ids = {node_id: index for index, node_id in enumerate(selected)}
+    x0 = min(netlist.xs[node_id] for node_id in selected) if selected else 0
+    y0 = min(netlist.ys[node_id] for node_id in selected) if selected else 0
+    data = []
+    for node_id in selected:
+        input_ids = [new_ids[input_id] for input_id in netlist.fanin_ids(node_id) if input_id in new_ids]
+        data.append((netlist.kind(node_id), input_ids, netlist.xs[node_id] - x0, netlist.ys[node_id] - y0,
+                     netlist.names.get(node_id), netlist.subcircuits.get(node_id)))
+    return SubcircuitDefinition(name, Netlist.from_data(data))
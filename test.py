@@ -1,12 +1,23 @@
+import importlib.util
+import os
 import unittest
 import tkinter as tk
-from main import Application, InputGate, OrGate, Lamp
+
+# Arayüz modülünün adı rakamla başladığı için doğrudan içe aktarılamaz, dosya yolundan yüklenir
+_spec = importlib.util.spec_from_file_location(
+    "gui", os.path.join(os.path.dirname(os.path.abspath(__file__)), "230501033_DamlaKeklik.py"))
+gui = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gui)
+Application, InputGate, OrGate, Lamp = gui.Application, gui.InputGate, gui.OrGate, gui.Lamp
 
 
 class TestApplicationMethods(unittest.TestCase):
     def setUp(self):
-        # Uygulama örneğini oluştur
-        self.root = tk.Tk()
+        # Uygulama örneğini oluştur; ekran yoksa test atlanır
+        try:
+            self.root = tk.Tk()
+        except tk.TclError as error:
+            self.skipTest(str(error))
         self.app = Application(self.root)
 
     def test_or_gate_with_two_inputs_and_led(self):
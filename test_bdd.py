@@ -0,0 +1,100 @@
+import sys
+import unittest
+
+import netlist
+from bdd import BDD, NodeLimitError, SymbolicSimulator, depth_first_order, input_order, symbolic_counterexample
+from bitsim import BitParallelSimulator
+from circuits import block_adder, random_dag, ripple_adder
+from simulator import Simulator
+
+
+def output_values(circuit, vector):
+    for node_id, value in zip(circuit.input_ids, vector):
+        circuit.values[node_id] = value
+    Simulator(circuit).evaluate()
+    return [circuit.values[node_id] for node_id in circuit.output_ids]
+
+
+def matches(cube, index):
+    return all(character == "-" or int(character) == index >> position & 1 for position, character in enumerate(cube))
+
+
+class TestBDD(unittest.TestCase):
+    def test_equivalence_beyond_exhaustive_range(self):
+        # 65 girişli toplayıcılar; kapsamlı simülasyonla denetlenemeyecek kadar büyük
+        self.assertIsNone(symbolic_counterexample(ripple_adder(32), block_adder(32)))
+        data = ripple_adder(32).to_data()
+        # Taşıma zincirinin ortasındaki bir XOR kapısı XNOR yapılır
+        xor_ids = [node_id for node_id, entry in enumerate(data) if entry[0] == netlist.XOR]
+        mutated = list(data)
+        mutated[xor_ids[30]] = (netlist.XNOR,) + tuple(data[xor_ids[30]][1:])
+        broken = netlist.Netlist.from_data(mutated)
+        original = ripple_adder(32)
+        counterexample = symbolic_counterexample(original, broken)
+        self.assertIsNotNone(counterexample)
+        self.assertNotEqual(output_values(original, counterexample), output_values(broken, counterexample))
+
+    def test_counts_and_cubes_match_truth_table(self):
+        for circuit in (random_dag(200, 10, 6, seed=3), block_adder(4)):
+            symbolic = SymbolicSimulator(circuit)
+            words = BitParallelSimulator(circuit).truth_table()
+            size = 1 << len(circuit.input_ids)
+            for node_id, word in zip(circuit.output_ids, words):
+                self.assertEqual(symbolic.count(node_id), bin(word).count("1"))
+                covered = 0
+                for cube in symbolic.lighting_inputs(node_id):
+                    covered |= sum(1 << index for index in range(size) if matches(cube, index))
+                self.assertEqual(covered, word)
+                vector = symbolic.satisfying_vector(node_id)
+                if word:
+                    self.assertTrue(word >> sum(value << position for position, value in enumerate(vector)) & 1)
+                else:
+                    self.assertIsNone(vector)
+
+    def test_gate_rules_follow_netlist(self):
+        # Girişsiz kapılar, üç girişli XOR ve XNOR netlist.GATE_FUNCTIONS kurallarına uymalıdır
+        circuit = netlist.Netlist()
+        inputs = [circuit.add_node(netlist.INPUT) for _ in range(3)]
+        for kind in (netlist.XOR, netlist.XNOR, netlist.NAND, netlist.NOR, netlist.AND, netlist.NOT):
+            gate = circuit.add_node(kind)
+            if kind != netlist.AND:
+                for node in inputs[:1 if kind == netlist.NOT else 3]:
+                    circuit.connect(node, gate)
+            circuit.connect(gate, circuit.add_node(netlist.LAMP))
+        symbolic = SymbolicSimulator(circuit)
+        words = BitParallelSimulator(circuit).truth_table()
+        self.assertEqual([symbolic.count(node_id) for node_id in circuit.output_ids],
+                         [bin(word).count("1") for word in words])
+        self.assertEqual(symbolic.count(circuit.output_ids[0]), 0)
+        self.assertEqual(symbolic.lighting_inputs(circuit.output_ids[1]), ["000", "111"])
+
+    def test_unique_table_cache_and_ordering(self):
+        manager = BDD(3, cache_bits=2)
+        a, b, c = (manager.variable(index) for index in range(3))
+        first = manager.disjunction([manager.conjunction([a, b]), c])
+        second = manager.negate(manager.conjunction([manager.negate(c), manager.negate(manager.conjunction([b, a]))]))
+        self.assertEqual(first, second)
+        self.assertEqual(len(manager.cache_keys), 4)
+        self.assertEqual(manager.satisfy_count(first), 5)
+        # Topolojik sıra toplayıcının girişlerini bit bit iç içe dizer; giriş sırası ise üstel büyür
+        circuit = ripple_adder(16)
+        order = depth_first_order(circuit)
+        self.assertEqual(sorted(order[:3]), sorted([circuit.input_ids[0], circuit.input_ids[16], circuit.input_ids[32]]))
+        self.assertLess(SymbolicSimulator(circuit, order=order).size(), 1000)
+        with self.assertRaises(NodeLimitError):
+            SymbolicSimulator(circuit, order=input_order(circuit), max_nodes=20000)
+
+    def test_deep_diagrams_do_not_touch_recursion_limit(self):
+        limit = sys.getrecursionlimit()
+        count = 3 * limit
+        manager = BDD(count)
+        # Alttan yukarı kurulan zincirlerde her adım tek düğüm ekler
+        variables = [manager.variable(index) for index in reversed(range(count))]
+        # Hepsi 1 değil ama en az biri 1: derinliği değişken sayısı kadar olan bir ITE zinciri
+        function = manager.exclusive(manager.conjunction(variables), manager.disjunction(variables))
+        self.assertEqual(manager.satisfy_count(function), (1 << count) - 2)
+        self.assertEqual(sys.getrecursionlimit(), limit)
+
+
+if __name__ == "__main__":
+    unittest.main()
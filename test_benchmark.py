@@ -0,0 +1,31 @@
+import unittest
+
+import benchmark
+from bitsim import BitParallelSimulator
+from circuits import array_multiplier, ripple_adder, random_dag
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_generated_arithmetic_is_correct(self):
+        product_words = BitParallelSimulator(array_multiplier(3)).truth_table()
+        sum_words = BitParallelSimulator(ripple_adder(3)).truth_table()
+        for pattern in range(1 << 6):
+            a, b = pattern & 7, pattern >> 3
+            self.assertEqual(sum((word >> pattern & 1) << bit for bit, word in enumerate(product_words)), a * b)
+            self.assertEqual(sum((word >> pattern & 1) << bit for bit, word in enumerate(sum_words)), a + b)
+
+    def test_random_dag_is_reproducible(self):
+        self.assertEqual(random_dag(200, seed=3).to_data(), random_dag(200, seed=3).to_data())
+
+    def test_reports_can_be_compared(self):
+        report = benchmark.run(["random", "adder"], [20], repeat=2)
+        operations = set((result["circuit"], result["operation"]) for result in report["results"])
+        self.assertIn(("adder", "evaluate"), operations)
+        self.assertIn(("random", "topological_sort"), operations)
+        rows = benchmark.compare(report, report)
+        self.assertEqual(len(rows), len(report["results"]))
+        self.assertTrue(all(ratio == 1 for _, _, _, ratio in rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
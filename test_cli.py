@@ -0,0 +1,85 @@
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import cli
+from circuits import block_adder, ripple_adder
+from storage import save
+
+
+def bits(values):
+    return "".join("1" if value else "0" for value in values)
+
+
+def pack(values):
+    packed = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if value:
+            packed[index // 8] |= 1 << index % 8
+    return bytes(packed)
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        self.circuit = ripple_adder(4)
+        generator = random.Random(4)
+        self.vectors = [[generator.random() < 0.5 for _ in range(9)] for _ in range(300)]
+        # Girişler a0..a3, b0..b3, elde; çıkışlar a + b + elde toplamının bitleridir
+        self.expected = []
+        for vector in self.vectors:
+            a = sum(value << bit for bit, value in enumerate(vector[:4]))
+            b = sum(value << bit for bit, value in enumerate(vector[4:8]))
+            total = a + b + vector[8]
+            self.expected.append([bool(total >> bit & 1) for bit in range(5)])
+
+    def test_text_and_binary_streams(self):
+        source = io.BytesIO("".join(bits(vector) + "\n" for vector in self.vectors).encode())
+        target = io.BytesIO()
+        self.assertEqual(cli.simulate_stream(self.circuit, source, target, block_size=64), 300)
+        text_rows = target.getvalue().decode().splitlines()
+        source = io.BytesIO(b"".join(pack(vector) for vector in self.vectors))
+        target = io.BytesIO()
+        cli.simulate_stream(self.circuit, source, target, binary=True, block_size=50)
+        self.assertEqual(target.getvalue(), b"".join(pack([character == "1" for character in row]) for row in text_rows))
+        # Toplayıcı çıkışları giriş sırasına göre doğrulanır
+        outputs = [int(row[::-1], 2) for row in text_rows]
+        self.assertEqual(outputs, [sum(value << bit for bit, value in enumerate(row)) for row in self.expected])
+
+    def test_comments_blank_lines_and_errors(self):
+        text = "# başlık\r\n%s\r\n\r\n%s # ikinci\n" % (" ".join(bits(self.vectors[0])), bits(self.vectors[1]))
+        target = io.BytesIO()
+        self.assertEqual(cli.simulate_stream(self.circuit, io.BytesIO(text.encode()), target), 2)
+        self.assertEqual(len(target.getvalue().splitlines()), 2)
+        with self.assertRaises(cli.NetlistError):
+            cli.simulate_stream(self.circuit, io.BytesIO(b"000000000\n0101\n"), io.BytesIO())
+
+    def test_truth_table_rows_are_ordered(self):
+        circuit = ripple_adder(5)
+        sequential = b"".join(cli.truth_table_rows(circuit, 1, chunk_bits=6))
+        self.assertEqual(b"".join(cli.truth_table_rows(circuit, 2, chunk_bits=6)), sequential)
+        rows = sequential.decode().splitlines()
+        self.assertEqual(len(rows), 1 << 11)
+        # 5. satır: a0 = a2 = 1, yani 5 + 0
+        self.assertEqual(rows[5], "10100000000 101000")
+
+    def test_main_runs_without_tkinter(self):
+        with tempfile.TemporaryDirectory() as directory:
+            first = os.path.join(directory, "toplayici.devre")
+            second = os.path.join(directory, "blok.devreb")
+            save(ripple_adder(6), first)
+            save(block_adder(6), second)
+            script = ("import sys, cli; code = cli.main(sys.argv[1:]); "
+                      "sys.exit(10 if 'tkinter' in sys.modules else code)")
+            result = subprocess.run([sys.executable, "-c", script, "equivalent", first, second, "--workers", "1"],
+                                    cwd=os.path.dirname(os.path.abspath(cli.__file__)),
+                                    capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(result.stdout.strip(), "Eşdeğer")
+
+
+if __name__ == "__main__":
+    unittest.main()
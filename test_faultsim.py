@@ -0,0 +1,69 @@
+import unittest
+
+import netlist
+from circuits import array_multiplier, block_adder, random_dag, ripple_adder
+from faultsim import FaultSimulator, all_faults, random_patterns, read_vectors
+
+
+def faulty_outputs(circuit, fault, pattern):
+    # Başvuru: hatalı düğüm zorlanarak tek vektör sırayla değerlendirilir
+    values = [False] * len(circuit)
+    for node_id, value in zip(circuit.input_ids, pattern):
+        values[node_id] = value
+    for node_id in circuit.topological_ids():
+        if circuit.kind(node_id) != netlist.INPUT:
+            values[node_id] = circuit.node_function(node_id)([values[input_id] for input_id in circuit.fanin_ids(node_id)])
+        if fault is not None and node_id == fault[0]:
+            values[node_id] = bool(fault[1])
+    return [values[node_id] for node_id in circuit.output_ids]
+
+
+class TestFaultSimulation(unittest.TestCase):
+    def test_first_detecting_vectors_match_serial_simulation(self):
+        for circuit in (random_dag(120, 8, 6, seed=2), array_multiplier(3), block_adder(5)):
+            patterns = list(random_patterns(len(circuit.input_ids), 40, seed=3))
+            coverage = FaultSimulator(circuit).run(patterns, block_size=16)
+            good = [faulty_outputs(circuit, None, pattern) for pattern in patterns]
+            for fault in coverage.faults:
+                expected = next((index for index, pattern in enumerate(patterns)
+                                 if faulty_outputs(circuit, fault, pattern) != good[index]), None)
+                self.assertEqual(coverage.detected.get(fault), expected, fault)
+
+    def test_detected_faults_are_dropped(self):
+        circuit = ripple_adder(4)
+        simulator = FaultSimulator(circuit)
+        consumed = []
+
+        def patterns():
+            for pattern in random_patterns(len(circuit.input_ids), 10000, seed=1):
+                consumed.append(pattern)
+                yield pattern
+
+        coverage = simulator.run(patterns(), block_size=32)
+        self.assertEqual(coverage.coverage(), 1.0)
+        self.assertFalse(simulator.remaining)
+        self.assertEqual(len(consumed), coverage.patterns)
+        self.assertLess(coverage.patterns, 10000)
+
+    def test_unobservable_faults_stay_undetected(self):
+        circuit = netlist.Netlist()
+        a = circuit.add_node(netlist.INPUT)
+        b = circuit.add_node(netlist.INPUT)
+        gate = circuit.add_node(netlist.AND)
+        dead = circuit.add_node(netlist.NOT)
+        lamp = circuit.add_node(netlist.LAMP)
+        circuit.connect(a, gate)
+        circuit.connect(b, gate)
+        circuit.connect(a, dead)
+        circuit.connect(gate, lamp)
+        vectors = read_vectors(["00", "# yorum", "", "1 1", "01"], 2)
+        coverage = FaultSimulator(circuit, all_faults(circuit, [a.id, gate.id, dead.id])).run(vectors)
+        self.assertEqual(coverage.patterns, 3)
+        self.assertEqual(coverage.detected, {(a.id, 0): 1, (gate.id, 0): 1, (gate.id, 1): 0, (a.id, 1): 2})
+        self.assertEqual(coverage.undetected, [(dead.id, 0), (dead.id, 1)])
+        with self.assertRaises(netlist.NetlistError):
+            list(read_vectors(["0102"], 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
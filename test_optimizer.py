@@ -0,0 +1,82 @@
+import random
+import unittest
+
+import netlist
+from circuits import array_multiplier, block_adder, random_dag, ripple_adder
+from optimizer import gate_count, optimize
+from parallel import find_counterexample
+from simulator import Simulator
+
+
+class TestOptimizer(unittest.TestCase):
+    def test_reduced_circuit_is_equivalent(self):
+        for circuit in (random_dag(400, 10, 8, seed=5), ripple_adder(6), array_multiplier(3), block_adder(7)):
+            reduction = optimize(circuit)
+            self.assertLessEqual(gate_count(reduction.netlist), gate_count(circuit))
+            self.assertIsNone(find_counterexample(circuit, reduction.netlist, workers=1))
+
+    def test_constants_duplicates_and_dead_logic(self):
+        circuit = netlist.Netlist()
+        a = circuit.add_node(netlist.INPUT)
+        b = circuit.add_node(netlist.INPUT)
+        first = circuit.add_node(netlist.AND)
+        second = circuit.add_node(netlist.AND)
+        inverted = circuit.add_node(netlist.NAND)
+        dead = circuit.add_node(netlist.XOR)
+        open_gate = circuit.add_node(netlist.OR)
+        lamps = [circuit.add_node(netlist.LAMP) for _ in range(3)]
+        for gate in (first, second, inverted, dead):
+            circuit.connect(a, gate)
+            circuit.connect(b, gate)
+        circuit.connect(first, lamps[0])
+        circuit.connect(second, lamps[1])
+        circuit.connect(inverted, lamps[1])
+        circuit.connect(open_gate, lamps[2])
+        reduction = optimize(circuit)
+        # İki AND tek düğüme iner ve NAND onun tersidir; ikinci LED (x OR NOT x) sabit True olur
+        # (AND() ve NOT), XOR hiçbir LED'e ulaşmaz
+        self.assertEqual(reduction.constants, {open_gate.id: 0})
+        aliased = [node_id for pairs in reduction.aliases.values() for node_id, _ in pairs]
+        self.assertIn(inverted.id, aliased)
+        self.assertNotIn(dead.id, aliased)
+        self.assertEqual(gate_count(reduction.netlist), 3)
+        circuit.set_input(a, True)
+        circuit.set_input(b, True)
+        reduction.load_inputs()
+        Simulator(reduction.netlist).evaluate()
+        reduction.store()
+        self.assertEqual([lamp.value for lamp in lamps], [True, True, False])
+        self.assertEqual((first.value, second.value, inverted.value), (True, True, False))
+
+    def test_cyclic_circuits_are_rejected(self):
+        circuit = netlist.Netlist()
+        first = circuit.add_node(netlist.NOT)
+        second = circuit.add_node(netlist.NOT)
+        circuit.connect(first, second)
+        circuit.connect(second, first)
+        with self.assertRaises(netlist.CycleError):
+            optimize(circuit)
+
+    def test_optimized_simulator_matches_plain(self):
+        circuit = random_dag(600, 12, 10, seed=8)
+        copy = netlist.Netlist.from_data(circuit.to_data())
+        optimized = Simulator(circuit, event_driven=True, optimized=True)
+        plain = Simulator(copy, event_driven=True)
+        optimized.evaluate()
+        plain.evaluate()
+        generator = random.Random(2)
+        for _ in range(100):
+            index = generator.randrange(len(circuit.inputs))
+            optimized.toggle(circuit.inputs[index])
+            plain.toggle(copy.inputs[index])
+            self.assertEqual(optimized.output_values(), plain.output_values())
+        # Topoloji değişince sadeleştirme yeniden yapılır
+        circuit.connect(circuit.inputs[0], circuit.add_node(netlist.LAMP))
+        copy.connect(copy.inputs[0], copy.add_node(netlist.LAMP))
+        optimized.evaluate()
+        plain.evaluate()
+        self.assertEqual(optimized.output_values(), plain.output_values())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import asyncio
+import os
+import random
+import tempfile
+import threading
+import unittest
+
+from circuits import ripple_adder
+from client import SimulationClient
+from netlist import NetlistError
+from server import SimulationServer
+from storage import save
+
+
+def adder_row(vector):
+    # Girişler a0..a3, b0..b3, elde; çıkış satırı toplamın bitleri (en düşük bit önce)
+    a = int(vector[:4][::-1], 2)
+    b = int(vector[4:8][::-1], 2)
+    total = a + b + int(vector[8])
+    return bin(total)[2:].zfill(5)[::-1]
+
+
+class TestSimulationServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "toplayici.devre")
+        save(ripple_adder(4), cls.path)
+        cls.loop = asyncio.new_event_loop()
+        cls.server = cls.loop.run_until_complete(SimulationServer().start(os.path.join(cls.directory.name, "sim.sock")))
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        asyncio.run_coroutine_threadsafe(cls.server.close(), cls.loop).result()
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.loop.close()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.client = SimulationClient(self.server.address, timeout=30)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_load_is_cached_and_evaluate_matches(self):
+        circuit = self.client.load(path=self.path)
+        self.assertEqual(self.client.load(path=self.path), circuit)
+        generator = random.Random(24)
+        vectors = ["".join(generator.choice("01") for _ in range(9)) for _ in range(200)]
+        self.assertEqual(self.client.evaluate(circuit, vectors), [adder_row(vector) for vector in vectors])
+        with self.assertRaises(NetlistError):
+            self.client.evaluate(circuit, ["0101"])
+
+    def test_toggle_and_truth_table(self):
+        circuit = self.client.load(text=open(self.path, encoding="utf-8").read())
+        # a0, b0, elde sırayla 1 yapılır: 1, 2, 3
+        self.assertEqual(self.client.toggle(circuit, [0, 4, 8]), ["10000", "01000", "11000"])
+        table = self.client.truth_table(circuit)
+        for index in (0, 5, 300, 511):
+            vector = "".join(str(index >> bit & 1) for bit in range(9))
+            self.assertEqual("".join(str(word >> index & 1) for word in table), adder_row(vector))
+        self.client.unload(circuit)
+        with self.assertRaises(NetlistError):
+            self.client.toggle(circuit, [0])
+
+    def test_batch_and_pipeline(self):
+        circuit = self.client.load(path=self.path)
+        results = self.client.batch([("evaluate", {"circuit": circuit, "vectors": ["111100001"]}),
+                                     ("evaluate", {"circuit": "yok", "vectors": []}),
+                                     ("ping", {})])
+        self.assertEqual(results[0], {"result": ["00001"]})
+        self.assertIn("error", results[1])
+        self.assertEqual(results[2], {"result": "pong"})
+        requests = [("evaluate", {"circuit": circuit, "vectors": [format(index, "09b")]}) for index in range(64)]
+        responses = self.client.pipeline(requests)
+        self.assertEqual([response["result"][0] for response in responses],
+                         [adder_row(format(index, "09b")) for index in range(64)])
+
+    def test_large_pipeline_does_not_block(self):
+        # Küçük okuma tamponlu sunucuda istekler ve yanıtlar soket tamponlarını hızla doldurur; istemci
+        # yazmayı bitirmeden okumaya başlamazsa sunucu drain'de, istemci gönderimde bekleyip kilitlenir
+        address = os.path.join(self.directory.name, "dar.sock")
+        server = asyncio.run_coroutine_threadsafe(SimulationServer().start(address, limit=1 << 16), self.loop).result()
+        client = SimulationClient(server.address, timeout=10)
+        try:
+            circuit = client.load(path=self.path)
+            vectors = [format(index, "09b") for index in range(512)]
+            responses = client.pipeline([("evaluate", {"circuit": circuit, "vectors": vectors})] * 400)
+        finally:
+            client.close()
+            asyncio.run_coroutine_threadsafe(server.close(), self.loop).result()
+        expected = [adder_row(vector) for vector in vectors]
+        self.assertEqual(len(responses), 400)
+        self.assertTrue(all(response["result"] == expected for response in responses))
+
+    def test_malformed_requests_keep_the_connection(self):
+        circuit = self.client.load(path=self.path)
+        requests = [("evaluate", {"circuit": circuit, "vectors": [1, 2]}),
+                    ("toggle", {"circuit": circuit, "inputs": [[0]]}),
+                    ("load", {"path": 5}),
+                    ("evaluate", {"circuit": [circuit], "vectors": []}),
+                    ("batch", {"requests": [1]}),
+                    ("evaluate", {"circuit": circuit, "vectors": ["000000001"]})]
+        responses = self.client.pipeline(requests)
+        self.assertTrue(all("error" in response for response in responses[:-1]))
+        self.assertEqual(responses[-1]["result"], ["10000"])
+        self.assertEqual(self.client.opened, 1)
+
+    def test_broken_connection_frees_its_pool_slot(self):
+        client = SimulationClient(self.server.address, pool_size=1, timeout=30)
+        connection = client._acquire()
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(client.request("ping")))
+        waiter.start()
+        # Bozuk bağlantı kapatılınca bekleyen istek yeni bir bağlantıyla sürmelidir
+        client._release(connection, False)
+        waiter.join(10)
+        self.assertEqual(results, ["pong"])
+        client.close()
+        self.assertEqual(client.opened, 0)
+
+    def test_existing_files_are_not_replaced(self):
+        path = os.path.join(self.directory.name, "veri.txt")
+        with open(path, "w") as stream:
+            stream.write("önemli")
+        with self.assertRaises(NetlistError):
+            asyncio.run_coroutine_threadsafe(SimulationServer().start(path), self.loop).result()
+        with open(path) as stream:
+            self.assertEqual(stream.read(), "önemli")
+
+    def test_concurrent_clients(self):
+        circuit = self.client.load(path=self.path)
+        failures = []
+
+        def work(seed):
+            generator = random.Random(seed)
+            for _ in range(20):
+                vectors = ["".join(generator.choice("01") for _ in range(9)) for _ in range(16)]
+                if self.client.evaluate(circuit, vectors) != [adder_row(vector) for vector in vectors]:
+                    failures.append(seed)
+
+        threads = [threading.Thread(target=work, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        self.assertLessEqual(self.client.opened, self.client.pool_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+import unittest
+
+import itertools
+
+import netlist
+import parallel
+from bitsim import BitParallelSimulator
+from compiler import compile_netlist
+from profiler import Profiler
+from simulator import Simulator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestHeadlessSimulation(unittest.TestCase):
+    def setUp(self):
+        # Ekran gerektirmeyen model ve simülatörü oluştur
+        self.netlist = netlist.Netlist()
+        self.simulator = Simulator(self.netlist)
+
+    def test_or_gate_with_two_inputs_and_led(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        input2 = self.netlist.add_node(netlist.INPUT)
+        or_gate = self.netlist.add_node(netlist.OR)
+        lamp = self.netlist.add_node(netlist.LAMP)
+        self.netlist.connect(input1, or_gate)
+        self.netlist.connect(input2, or_gate)
+        self.netlist.connect(or_gate, lamp)
+
+        self.simulator.set_inputs({input1: True})
+        self.assertTrue(lamp.value, "LED should be ON when any input to OR gate is ON")
+
+        self.simulator.set_inputs({input1: False})
+        self.assertFalse(lamp.value)
+
+    def test_gate_quirks_match_gui_semantics(self):
+        # Eski evaluate metotlarındaki davranışlar korunmalı
+        self.assertFalse(netlist.evaluate_gate(netlist.AND, []))
+        self.assertFalse(netlist.evaluate_gate(netlist.XOR, [True, False, False]))
+        self.assertTrue(netlist.evaluate_gate(netlist.XNOR, [False, False, False]))
+        self.assertFalse(netlist.evaluate_gate(netlist.XNOR, [True, False, True]))
+        self.assertFalse(netlist.evaluate_gate(netlist.NOT, []))
+
+    def test_buffer_accepts_single_input(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        buffer_gate = self.netlist.add_node(netlist.BUFFER)
+        self.netlist.connect(input1, buffer_gate)
+        with self.assertRaises(netlist.NetlistError):
+            self.netlist.connect(input1, buffer_gate)
+
+    def test_listeners_receive_changed_nodes(self):
+        events = []
+        input1 = self.netlist.add_node(netlist.INPUT)
+        not_gate = self.netlist.add_node(netlist.NOT)
+        self.netlist.connect(input1, not_gate)
+        self.netlist.add_listener(lambda event, payload: events.append((event, payload)))
+
+        self.simulator.evaluate()
+        self.assertEqual(events, [("values", [not_gate])])
+        self.assertEqual(self.simulator.evaluate(), [])
+
+    def test_event_driven_toggle_updates_only_changed_cone(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        input2 = self.netlist.add_node(netlist.INPUT)
+        and_gate = self.netlist.add_node(netlist.AND)
+        lamp = self.netlist.add_node(netlist.LAMP)
+        other_lamp = self.netlist.add_node(netlist.LAMP)
+        self.netlist.connect(input1, and_gate)
+        self.netlist.connect(input2, and_gate)
+        self.netlist.connect(and_gate, lamp)
+        self.netlist.connect(input2, other_lamp)
+        self.simulator.evaluate()
+        self.simulator.event_driven = True
+
+        # AND kapısının çıkışı değişmediği için yayılım orada durur
+        self.netlist.set_input(input1, True)
+        self.assertFalse(lamp.value)
+
+        self.assertEqual(self.simulator.toggle(input2), [and_gate, other_lamp, lamp])
+        self.assertTrue(lamp.value)
+
+    def test_levels_are_maintained_incrementally(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        not_gate = self.netlist.add_node(netlist.NOT)
+        and_gate = self.netlist.add_node(netlist.AND)
+        self.netlist.connect(input1, and_gate)
+        self.netlist.connect(input1, not_gate)
+        self.netlist.connect(not_gate, and_gate)
+
+        levels = self.netlist.levelize()
+        self.assertEqual(levels, [[input1.id], [not_gate.id], [and_gate.id]])
+        self.assertEqual(self.netlist.topological_order(), [input1, not_gate, and_gate])
+
+    def test_profiler_counts_evaluations_and_toggles(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        input2 = self.netlist.add_node(netlist.INPUT)
+        and_gate = self.netlist.add_node(netlist.AND)
+        lamp = self.netlist.add_node(netlist.LAMP)
+        self.netlist.connect(input1, and_gate)
+        self.netlist.connect(input2, and_gate)
+        self.netlist.connect(and_gate, lamp)
+        self.simulator.profiler = Profiler()
+        self.simulator.evaluate()
+        self.simulator.toggle(input1)
+        self.simulator.toggle(input2)
+
+        counts = list(self.simulator.profiler.gate_counts(self.netlist))
+        # Tam değerlendirme her kapıyı bir kez sayar; LED yalnızca AND değiştiğinde yeniden değerlendirilir
+        self.assertEqual(counts, [(0, 0, 1), (1, 0, 1), (2, 3, 1), (3, 2, 1)])
+        self.assertEqual(self.simulator.profiler.hottest(self.netlist, 1), [(2, 3, 1)])
+        self.assertEqual(self.simulator.profiler.sections["tick"].count, 3)
+
+        # Sadeleştirilmiş yolda da her değişim bir kez sayılır (girişler bir kez)
+        optimized = Simulator(self.netlist, optimized=True)
+        self.simulator.reset()
+        optimized.profiler = Profiler()
+        optimized.evaluate()
+        optimized.toggle(input1)
+        optimized.toggle(input2)
+        self.assertEqual([toggles for _, _, toggles in optimized.profiler.gate_counts(self.netlist)], [1, 1, 1, 1])
+
+    def test_combinational_cycle_is_reported(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        or_gate = self.netlist.add_node(netlist.OR)
+        not_gate = self.netlist.add_node(netlist.NOT)
+        lamp = self.netlist.add_node(netlist.LAMP)
+        self.netlist.connect(input1, or_gate)
+        self.netlist.connect(or_gate, not_gate)
+        self.netlist.connect(not_gate, lamp)
+        self.netlist.connect(not_gate, or_gate)
+
+        # Döngüdeki kapılar sessizce atlanmamalı
+        with self.assertRaises(netlist.CycleError) as context:
+            self.simulator.evaluate()
+        self.assertEqual(context.exception.nodes, [or_gate, not_gate, lamp])
+
+    def test_feedback_wire_leaves_event_driven_mode(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        or_gate = self.netlist.add_node(netlist.OR)
+        not_gate = self.netlist.add_node(netlist.NOT)
+        self.netlist.connect(input1, or_gate)
+        self.netlist.connect(or_gate, not_gate)
+        self.simulator.evaluate()
+        self.simulator.event_driven = True
+        # Canlı simülasyon sırasında çizilen geri besleme kipi kapatır, sonraki girişler hata vermez
+        self.netlist.connect(not_gate, or_gate)
+        self.assertFalse(self.simulator.event_driven)
+        self.assertEqual(sorted(node.id for node in self.netlist.cycle_nodes), [or_gate.id, not_gate.id])
+        self.assertEqual(or_gate.inputs, [input1, not_gate])
+        self.netlist.set_input(input1, True)
+
+    def test_compiled_function_matches_gate_functions(self):
+        inputs = [self.netlist.add_node(netlist.INPUT) for _ in range(3)]
+        gates = []
+        for kind in (netlist.AND, netlist.OR, netlist.NAND, netlist.NOR, netlist.XOR, netlist.XNOR):
+            for fan_in in range(4):
+                gate = self.netlist.add_node(kind)
+                for input_node in inputs[:fan_in]:
+                    self.netlist.connect(input_node, gate)
+                gates.append(gate)
+        program = compile_netlist(self.netlist)
+
+        for values in itertools.product([False, True], repeat=3):
+            result = program(list(values) + [False] * len(gates))
+            for gate in gates:
+                expected = netlist.evaluate_gate(gate.kind, list(values[:len(gate.inputs)]))
+                self.assertEqual(result[gate.id], expected, (gate, values))
+
+    def test_bit_parallel_truth_table_matches_scalar_simulation(self):
+        inputs = [self.netlist.add_node(netlist.INPUT) for _ in range(3)]
+        xnor_gate = self.netlist.add_node(netlist.XNOR)
+        nand_gate = self.netlist.add_node(netlist.NAND)
+        lamp1 = self.netlist.add_node(netlist.LAMP)
+        lamp2 = self.netlist.add_node(netlist.LAMP)
+        for input_node in inputs:
+            self.netlist.connect(input_node, xnor_gate)
+        self.netlist.connect(inputs[0], nand_gate)
+        self.netlist.connect(xnor_gate, nand_gate)
+        self.netlist.connect(xnor_gate, lamp1)
+        self.netlist.connect(nand_gate, lamp2)
+
+        bit_simulator = BitParallelSimulator(self.netlist)
+        table = bit_simulator.truth_table()
+        patterns = list(itertools.product([False, True], repeat=3))
+        results = list(bit_simulator.simulate_patterns(patterns, chunk_size=3))
+        for pattern, result in zip(patterns, results):
+            self.simulator.set_inputs(dict(zip(inputs, pattern)))
+            self.assertEqual(list(result), self.simulator.output_values())
+            row = sum(1 << index for index, value in enumerate(pattern) if value)
+            self.assertEqual([bool(word >> row & 1) for word in table], self.simulator.output_values())
+
+    @unittest.skipIf(numpy is None, "NumPy kurulu değil")
+    def test_numpy_batch_simulation_keeps_gate_quirks(self):
+        from batchsim import ArrayNetlist
+
+        inputs = [self.netlist.add_node(netlist.INPUT) for _ in range(3)]
+        xor_gate = self.netlist.add_node(netlist.XOR)
+        xnor_gate = self.netlist.add_node(netlist.XNOR)
+        nor_gate = self.netlist.add_node(netlist.NOR)
+        for input_node in inputs:
+            self.netlist.connect(input_node, xor_gate)
+            self.netlist.connect(input_node, xnor_gate)
+        self.netlist.connect(xor_gate, nor_gate)
+        self.netlist.connect(xnor_gate, nor_gate)
+        for gate in (xor_gate, xnor_gate, nor_gate):
+            self.netlist.connect(gate, self.netlist.add_node(netlist.LAMP))
+
+        vectors = numpy.array(list(itertools.product([False, True], repeat=3)))
+        array_netlist = ArrayNetlist.from_netlist(self.netlist)
+        for packed in (True, False):
+            results = array_netlist.simulate(vectors, packed=packed)
+            for vector, result in zip(vectors, results):
+                self.simulator.set_inputs(dict(zip(inputs, vector)))
+                self.assertEqual(result.tolist(), self.simulator.output_values())
+
+    def test_parallel_equivalence_finds_counterexample(self):
+        inputs = [self.netlist.add_node(netlist.INPUT) for _ in range(4)]
+        nand_gate = self.netlist.add_node(netlist.NAND)
+        lamp = self.netlist.add_node(netlist.LAMP)
+        for input_node in inputs:
+            self.netlist.connect(input_node, nand_gate)
+        self.netlist.connect(nand_gate, lamp)
+
+        # De Morgan: NAND = girişlerin değillerinin OR'u
+        other = netlist.Netlist()
+        other_inputs = [other.add_node(netlist.INPUT) for _ in range(4)]
+        or_gate = other.add_node(netlist.OR)
+        for input_node in other_inputs:
+            not_gate = other.add_node(netlist.NOT)
+            other.connect(input_node, not_gate)
+            other.connect(not_gate, or_gate)
+        other.connect(or_gate, other.add_node(netlist.LAMP))
+        self.assertIsNone(parallel.find_counterexample(self.netlist, other, workers=2, chunk_bits=2))
+
+        other.connect(other_inputs[0], other.add_node(netlist.LAMP))
+        self.netlist.connect(inputs[1], self.netlist.add_node(netlist.LAMP))
+        # Hangi parça önce biterse bitsin en küçük farklı desen döner
+        for _ in range(3):
+            counterexample = parallel.find_counterexample(self.netlist, other, workers=2, chunk_bits=2)
+            self.assertEqual(counterexample, [True, False, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
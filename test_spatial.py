@@ -0,0 +1,33 @@
+import unittest
+
+from spatial import SpatialGrid
+
+
+class TestSpatialGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = SpatialGrid(cell_size=32)
+
+    def test_point_query_follows_moved_items(self):
+        self.grid.insert("and", (30, 45, 40, 55))
+        self.grid.insert("lamp", (283, 65, 297, 80))
+        self.assertEqual(self.grid.query_point(35, 50), ["and"])
+        self.assertEqual(self.grid.query_point(30, 50), [])
+
+        # Taşınan kayıt eski hücresinden silinmeli
+        self.grid.insert("and", (130, 45, 140, 55))
+        self.assertEqual(self.grid.query_point(35, 50), [])
+        self.assertEqual(self.grid.query_point(135, 50), ["and"])
+
+    def test_box_query_spanning_many_cells(self):
+        for index in range(10):
+            self.grid.insert(index, (index * 100, 0, index * 100 + 10, 10))
+        self.assertEqual(self.grid.query_box((150, -5, 420, 5)), [2, 3, 4])
+        self.assertEqual(sorted(self.grid.query_box((-1e6, -1e6, 1e6, 1e6))), list(range(10)))
+
+        self.grid.remove(3)
+        self.assertNotIn(3, self.grid)
+        self.assertEqual(self.grid.query_box((150, -5, 420, 5)), [2, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
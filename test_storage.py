@@ -0,0 +1,105 @@
+import os
+import struct
+import tempfile
+import unittest
+
+import netlist
+from circuits import block_adder
+from simulator import Simulator
+from storage import load, save, ALIGNMENT, BINARY_EXTENSION, BINARY_MAGIC, HEADER_FORMAT, TEXT_EXTENSION
+
+
+class TestStorage(unittest.TestCase):
+    def setUp(self):
+        self.netlist = netlist.Netlist()
+        # Kenarlar hedef sırasından farklı eklenir ki ikili biçimdeki yeniden numaralandırma sınansın
+        self.output = self.netlist.add_node(netlist.OUTPUT, 200, 50)
+        self.input1 = self.netlist.add_node(netlist.INPUT, 50, 50, "a")
+        self.input2 = self.netlist.add_node(netlist.INPUT, 50, 100, "b giriş")
+        self.xor_gate = self.netlist.add_node(netlist.XOR, 100, 75.5)
+        self.lamp = self.netlist.add_node(netlist.LAMP, 300, 50)
+        self.netlist.connect(self.xor_gate, self.output)
+        self.netlist.connect(self.input2, self.xor_gate)
+        self.netlist.connect(self.output, self.lamp)
+        self.netlist.connect(self.input1, self.xor_gate)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def round_trip(self, extension):
+        path = os.path.join(self.directory.name, "devre" + extension)
+        save(self.netlist, path)
+        return load(path)
+
+    def check_round_trip(self, extension):
+        loaded = self.round_trip(extension)
+        self.assertEqual(loaded.to_data(), self.netlist.to_data())
+        self.assertEqual([node.fanout for node in loaded.nodes],
+                         [[loaded.nodes[node.id] for node in original.fanout] for original in self.netlist.nodes])
+        self.assertEqual(loaded.levelize(), self.netlist.levelize())
+
+        # Yüklenen devre düzenlenebilir ve simüle edilebilir olmalı
+        simulator = Simulator(loaded)
+        simulator.set_inputs({loaded.nodes[self.input1.id]: True})
+        self.assertEqual(simulator.output_values(), [True, True])
+        extra = loaded.add_node(netlist.NOT)
+        loaded.connect(loaded.nodes[self.output.id], extra)
+        self.assertEqual(extra.level, 3)
+
+    def test_text_round_trip(self):
+        self.check_round_trip(TEXT_EXTENSION)
+
+    def test_binary_round_trip(self):
+        self.check_round_trip(BINARY_EXTENSION)
+
+    def test_binary_keeps_cycles_detectable(self):
+        or_gate = self.netlist.add_node(netlist.OR)
+        not_gate = self.netlist.add_node(netlist.NOT)
+        self.netlist.connect(or_gate, not_gate)
+        self.netlist.connect(not_gate, or_gate)
+
+        loaded = self.round_trip(BINARY_EXTENSION)
+        loaded.levelize()
+        self.assertEqual([node.id for node in loaded.cycle_nodes], [or_gate.id, not_gate.id])
+
+    def test_truncated_binary_files_are_rejected(self):
+        # Alt devre bölümü de kesilebilsin diye tanım içeren bir devre kullanılır
+        path = os.path.join(self.directory.name, "blok" + BINARY_EXTENSION)
+        save(block_adder(6), path)
+        with open(path, "rb") as stream:
+            data = stream.read()
+        truncated = os.path.join(self.directory.name, "kesik" + BINARY_EXTENSION)
+        # Büyü baytları kalmışsa dosya ikili sayılır; her kesim noktası NetlistError vermelidir
+        for size in range(len(BINARY_MAGIC), len(data)):
+            with open(truncated, "wb") as stream:
+                stream.write(data[:size])
+            with self.assertRaises(netlist.NetlistError, msg=size):
+                load(truncated)
+
+    def test_corrupt_edge_columns_are_rejected(self):
+        path = os.path.join(self.directory.name, "blok" + BINARY_EXTENSION)
+        save(block_adder(6), path)
+        with open(path, "rb") as stream:
+            data = stream.read()
+        _, _, _, node_count, edge_count, _ = struct.unpack_from(HEADER_FORMAT, data)
+
+        def aligned(size):
+            return size + (-size % ALIGNMENT)
+
+        # Sütun sırası: türler, göreli konumlar, kenar kaynakları ve hedefleri, x, y, seviyeler, sonraki giriş kenarı
+        sources = aligned(struct.calcsize(HEADER_FORMAT)) + aligned(node_count) + aligned(4 * (node_count + 1))
+        next_input = sources + 2 * aligned(4 * edge_count) + 3 * aligned(4 * node_count)
+        corrupt = os.path.join(self.directory.name, "bozuk" + BINARY_EXTENSION)
+        # Dosya boyu doğru kalır; bozuk kimlikler yüklenirken reddedilmelidir
+        for position, value in ((sources, node_count), (sources, -1), (next_input, edge_count), (next_input, -2)):
+            changed = bytearray(data)
+            struct.pack_into("<i", changed, position, value)
+            with open(corrupt, "wb") as stream:
+                stream.write(changed)
+            with self.assertRaises(netlist.NetlistError, msg=(position, value)):
+                load(corrupt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+
+import netlist
+from batchsim import ArrayNetlist
+from circuits import block_adder, ripple_adder
+from parallel import find_counterexample
+from simulator import Simulator
+from storage import load, save, BINARY_EXTENSION, TEXT_EXTENSION
+from subcircuit import MAX_TABLE_INPUTS, SubcircuitDefinition, extract, instantiate
+from timing import TimingSimulator
+
+
+def set_number(circuit, value):
+    for position, node_id in enumerate(circuit.input_ids):
+        circuit.values[node_id] = value >> position & 1
+
+
+def output_number(circuit):
+    return sum(circuit.values[node_id] << position for position, node_id in enumerate(circuit.output_ids))
+
+
+class TestSubcircuit(unittest.TestCase):
+    def test_instances_share_one_table(self):
+        circuit = block_adder(10)
+        definitions = set(id(definition) for definition, _ in circuit.subcircuits.values())
+        self.assertEqual(len(definitions), 2)
+        self.assertEqual(len(circuit.definitions["ADD4"].rows), 1 << 9)
+        self.assertIsNone(find_counterexample(circuit, ripple_adder(10), workers=1))
+
+    def test_compiled_and_event_driven_lookup(self):
+        circuit = block_adder(6)
+        simulator = Simulator(circuit)
+        for a, b in ((5, 9), (63, 1), (40, 23)):
+            set_number(circuit, a | b << 6)
+            simulator.evaluate()
+            self.assertEqual(output_number(circuit), a + b)
+        simulator.event_driven = True
+        simulator.toggle(circuit.inputs[6])
+        self.assertEqual(output_number(circuit), 40 + 22)
+
+    def test_batch_and_timing_simulation(self):
+        circuit = block_adder(5)
+        vectors = [[bool(pattern >> bit & 1) for bit in range(11)] for pattern in range(0, 2048, 37)]
+        for packed in (True, False):
+            results = ArrayNetlist.from_netlist(circuit).simulate(vectors, packed)
+            for pattern, row in zip(range(0, 2048, 37), results):
+                expected = (pattern & 31) + (pattern >> 5 & 31) + (pattern >> 10)
+                self.assertEqual(sum(int(value) << bit for bit, value in enumerate(row)), expected)
+        timing = TimingSimulator(circuit)
+        set_number(circuit, 31 | 1 << 5)
+        timing.initialize()
+        self.assertTrue(timing.run_until_stable(100))
+        self.assertEqual(output_number(circuit), 32)
+
+    def test_connections_reach_every_output(self):
+        definition = SubcircuitDefinition("ADD1", ripple_adder(1))
+        circuit = netlist.Netlist()
+        sources = [circuit.add_node(netlist.INPUT) for _ in range(4)]
+        total, carry = instantiate(circuit, definition, 100, 50)
+        for source in sources[:3]:
+            circuit.connect(source, carry)
+        self.assertEqual([node.id for node in total.inputs], [node.id for node in sources[:3]])
+        self.assertEqual(carry.y - total.y, netlist.INSTANCE_PIN_SPACING)
+        with self.assertRaises(netlist.NetlistError):
+            circuit.connect(sources[3], total)
+
+    def test_feedback_through_instance_reaches_every_output(self):
+        definition = SubcircuitDefinition("ADD1", ripple_adder(1))
+        circuit = netlist.Netlist()
+        sources = [circuit.add_node(netlist.INPUT) for _ in range(2)]
+        total, carry = instantiate(circuit, definition)
+        for source in sources:
+            circuit.connect(source, carry)
+        simulator = Simulator(circuit)
+        simulator.evaluate()
+        simulator.event_driven = True
+        events = []
+        circuit.add_listener(lambda event, payload: events.append(event))
+        # Elde çıkışı örneğin son girişine bağlanır: döngü, simülatörden sonraki dinleyicileri kesmemelidir
+        circuit.connect(carry, total)
+        self.assertFalse(simulator.event_driven)
+        self.assertEqual(events, ["connected", "connected"])
+        self.assertEqual([circuit.input_counts[total.id], circuit.input_counts[carry.id]], [3, 3])
+        self.assertEqual(sorted(node.id for node in circuit.cycle_nodes), [total.id, carry.id])
+
+    def test_selection_becomes_definition(self):
+        circuit = netlist.Netlist()
+        a = circuit.add_node(netlist.INPUT, 50, 50)
+        b = circuit.add_node(netlist.INPUT, 50, 100)
+        gate = circuit.add_node(netlist.NAND, 100, 75)
+        lamp = circuit.add_node(netlist.LAMP, 200, 75)
+        circuit.connect(a, gate)
+        circuit.connect(b, gate)
+        circuit.connect(gate, lamp)
+        definition = extract(circuit, [a.id, b.id, gate.id, lamp.id], "NAND2")
+        self.assertEqual(definition.rows, [(1,), (1,), (1,), (0,)])
+
+    def test_large_definitions_are_flattened(self):
+        inner = netlist.Netlist()
+        gate = inner.add_node(netlist.AND)
+        for _ in range(MAX_TABLE_INPUTS + 1):
+            inner.connect(inner.add_node(netlist.INPUT), gate)
+        inner.connect(gate, inner.add_node(netlist.OUTPUT))
+        definition = SubcircuitDefinition("AND17", inner)
+        self.assertIsNone(definition.rows)
+        circuit = netlist.Netlist()
+        outputs = instantiate(circuit, definition)
+        self.assertEqual([node.kind for node in outputs], [netlist.OR])
+        self.assertFalse(circuit.subcircuits)
+
+    def test_files_keep_definitions(self):
+        circuit = block_adder(6)
+        with tempfile.TemporaryDirectory() as directory:
+            for extension in (TEXT_EXTENSION, BINARY_EXTENSION):
+                path = os.path.join(directory, "devre" + extension)
+                save(circuit, path)
+                loaded = load(path)
+                self.assertEqual(sorted(loaded.definitions), ["ADD2", "ADD4"])
+                self.assertEqual([loaded.fanin_ids(node_id) for node_id in range(len(loaded))],
+                                 [circuit.fanin_ids(node_id) for node_id in range(len(circuit))])
+                set_number(loaded, 45 | 30 << 6)
+                Simulator(loaded).evaluate()
+                self.assertEqual(output_number(loaded), 75)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+import netlist
+from timing import TimingSimulator
+
+
+class TestTimingSimulation(unittest.TestCase):
+    def setUp(self):
+        self.netlist = netlist.Netlist()
+
+    def record(self, simulator):
+        changes = []
+        simulator.observers.append(lambda now, node_ids: changes.extend((now, node_id) for node_id in node_ids))
+        return changes
+
+    def test_ring_oscillator_runs(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        nand_gate = self.netlist.add_node(netlist.NAND)
+        not_gates = [self.netlist.add_node(netlist.NOT) for _ in range(2)]
+        self.netlist.connect(input1, nand_gate)
+        self.netlist.connect(nand_gate, not_gates[0])
+        self.netlist.connect(not_gates[0], not_gates[1])
+        self.netlist.connect(not_gates[1], nand_gate)
+        simulator = TimingSimulator(self.netlist, delays={netlist.NAND: 1, netlist.NOT: 1})
+        simulator.initialize()
+        simulator.run(10)
+        changes = self.record(simulator)
+
+        # Giriş 1 olunca üç gecikmeli halka her 3 birimde bir değişir
+        simulator.set_input(input1, True)
+        simulator.run(20)
+        nand_changes = [now for now, node_id in changes if node_id == nand_gate.id]
+        self.assertEqual(len(nand_changes), 7)
+        self.assertEqual(set(later - earlier for earlier, later in zip(nand_changes, nand_changes[1:])), {3})
+
+    def test_sr_latch_holds_state(self):
+        set_input = self.netlist.add_node(netlist.INPUT)
+        reset_input = self.netlist.add_node(netlist.INPUT)
+        q = self.netlist.add_node(netlist.NOR)
+        q_bar = self.netlist.add_node(netlist.NOR)
+        self.netlist.connect(reset_input, q)
+        self.netlist.connect(q_bar, q)
+        self.netlist.connect(set_input, q_bar)
+        self.netlist.connect(q, q_bar)
+        simulator = TimingSimulator(self.netlist)
+        simulator.initialize()
+
+        simulator.set_input(set_input, True)
+        simulator.set_input(set_input, False, at=5)
+        self.assertTrue(simulator.run_until_stable(100))
+        self.assertEqual((q.value, q_bar.value), (True, False))
+
+        simulator.set_input(reset_input, True)
+        simulator.set_input(reset_input, False, at=simulator.now + 5)
+        self.assertTrue(simulator.run_until_stable(100))
+        self.assertEqual((q.value, q_bar.value), (False, True))
+
+    def test_inertial_delay_swallows_short_pulses(self):
+        input1 = self.netlist.add_node(netlist.INPUT)
+        buffer = self.netlist.add_node(netlist.BUFFER)
+        lamp = self.netlist.add_node(netlist.LAMP)
+        self.netlist.connect(input1, buffer)
+        self.netlist.connect(buffer, lamp)
+        # Çarktan uzun gecikme taşma yığınından geçer
+        simulator = TimingSimulator(self.netlist, delays={netlist.BUFFER: 10}, wheel_size=4)
+        simulator.initialize()
+        changes = self.record(simulator)
+
+        simulator.set_input(input1, True, at=2)
+        simulator.set_input(input1, False, at=6)
+        simulator.set_input(input1, True, at=20)
+        simulator.set_input(input1, False, at=40)
+        simulator.run(60)
+        self.assertEqual([now for now, node_id in changes if node_id == buffer.id], [30, 50])
+        self.assertEqual([now for now, node_id in changes if node_id == lamp.id], [30, 50])
+        self.assertFalse(lamp.value)
+
+
+if __name__ == "__main__":
+    unittest.main()
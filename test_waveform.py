@@ -0,0 +1,72 @@
+import io
+import unittest
+
+import netlist
+from simulator import Simulator
+from timing import TimingSimulator
+from waveform import WaveformRecorder, identifier_code
+
+
+class TestWaveformRecorder(unittest.TestCase):
+    def setUp(self):
+        self.netlist = netlist.Netlist()
+        self.input1 = self.netlist.add_node(netlist.INPUT, name="a giriş")
+        self.not_gate = self.netlist.add_node(netlist.NOT)
+        self.lamp = self.netlist.add_node(netlist.LAMP)
+        self.netlist.connect(self.input1, self.not_gate)
+        self.netlist.connect(self.not_gate, self.lamp)
+
+    def test_streams_vcd_in_bounded_chunks(self):
+        stream = io.StringIO()
+        recorder = WaveformRecorder(self.netlist, stream, capacity=2)
+        simulator = TimingSimulator(self.netlist, delays={netlist.NOT: 3})
+        simulator.observers.append(recorder.observe)
+        simulator.initialize()
+        simulator.set_input(self.input1, True, at=10)
+        simulator.run(20)
+        recorder.close()
+
+        text = stream.getvalue()
+        header, body = text.split("$enddefinitions $end\n")
+        self.assertIn("$var wire 1 ! a_giriş $end", header)
+        self.assertIn('$var wire 1 " NOT_1 $end', header)
+        self.assertEqual(body.split("\n$end\n")[1].split(), ['#3', '1"', '1#', '#10', '1!', '#13', '0"', '0#'])
+        self.assertLessEqual(recorder.count, 2)
+
+    def test_ring_buffer_keeps_latest_selected_changes(self):
+        recorder = WaveformRecorder(self.netlist, nodes=[self.lamp], capacity=3)
+        recorder.listen()
+        simulator = Simulator(self.netlist, event_driven=True)
+        for _ in range(5):
+            simulator.toggle(self.input1)
+        recorder.close()
+        # Her bildirim bir adımdır: giriş değişimi ve ardından yayılım ayrı adımlardır
+        self.assertEqual(list(recorder.changes()), [(5, 2, False), (7, 2, True), (9, 2, False)])
+        self.assertEqual(recorder.dropped, 1)
+
+    def test_steps_continue_after_delayed_simulation(self):
+        recorder = WaveformRecorder(self.netlist, nodes=[self.input1])
+        timing = TimingSimulator(self.netlist)
+        timing.observers.append(recorder.observe)
+        timing.initialize()
+        # Aynı çalıştırmada gidip dönen giriş kendi zamanlarıyla kaydedilir
+        timing.set_input(self.input1, True, at=10)
+        timing.set_input(self.input1, False, at=12)
+        timing.run(20)
+        timing.observers.remove(recorder.observe)
+        timing.detach()
+        recorder.listen()
+        Simulator(self.netlist, event_driven=True).toggle(self.input1)
+        recorder.close()
+        changes = list(recorder.changes())
+        self.assertEqual(changes[:2], [(10, 0, True), (12, 0, False)])
+        self.assertEqual(changes[2][1:], (0, True))
+        self.assertGreater(changes[2][0], 12)
+
+    def test_identifier_codes_are_unique(self):
+        codes = [identifier_code(index) for index in range(10000)]
+        self.assertEqual(len(set(codes)), len(codes))
+
+
+if __name__ == "__main__":
+    unittest.main()
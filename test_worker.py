@@ -0,0 +1,94 @@
+import time
+import unittest
+
+import netlist
+from circuits import array_multiplier
+from simulator import Simulator
+from worker import SimulationWorker
+
+
+def wait_for(condition, worker, values, timeout=10):
+    # Kareler geldikçe değerlere uygulanır; koşul sağlanana kadar beklenir
+    end = time.time() + timeout
+    while time.time() < end:
+        changes = worker.take_frame()
+        if changes:
+            for node_id, value in changes.items():
+                values[node_id] = value
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestSimulationWorker(unittest.TestCase):
+    def setUp(self):
+        self.circuit = array_multiplier(4)
+        self.worker = SimulationWorker()
+        self.worker.start()
+
+    def tearDown(self):
+        self.worker.stop()
+
+    def expected(self):
+        reference = netlist.Netlist.from_data(self.circuit.to_data())
+        for node_id in reference.input_ids:
+            reference.values[node_id] = self.circuit.values[node_id]
+        Simulator(reference).evaluate()
+        return list(reference.values)
+
+    def test_frames_follow_input_changes(self):
+        values = self.circuit.values
+        self.worker.load(self.circuit)
+        self.assertTrue(wait_for(lambda: list(values) == self.expected(), self.worker, values))
+        for position in (0, 3, 5, 6):
+            node_id = self.circuit.input_ids[position]
+            values[node_id] = 1
+            self.worker.set_inputs({node_id: True})
+        # 9 * 6 = 54
+        self.assertTrue(wait_for(lambda: list(values) == self.expected(), self.worker, values))
+        self.assertEqual(sum(values[node_id] << bit for bit, node_id in enumerate(self.circuit.output_ids)), 54)
+
+    def test_frames_from_old_snapshots_are_ignored(self):
+        self.worker.load(self.circuit)
+        self.worker.frames.put((self.worker.generation - 1, {0: True}))
+        self.assertIsNone(self.worker.take_frame())
+
+    def test_unread_frames_are_merged(self):
+        # Arayüz kareyi almadıysa yeni değişiklikler onunla birleşir; kuyrukta tek kare kalır
+        self.worker._post(0, {1: True, 2: True})
+        self.worker._post(0, {2: False, 3: True})
+        self.assertEqual(self.worker.frames.qsize(), 1)
+        self.assertEqual(self.worker.take_frame(), {1: True, 2: False, 3: True})
+        self.assertEqual(self.worker.dropped_frames, 1)
+
+    def test_errors_are_reported(self):
+        circuit = netlist.Netlist()
+        first = circuit.add_node(netlist.NOT)
+        second = circuit.add_node(netlist.NOT)
+        circuit.connect(first, second)
+        circuit.connect(second, first)
+        self.worker.load(circuit)
+        end = time.time() + 10
+        while self.worker.error is None and time.time() < end:
+            time.sleep(0.005)
+        self.assertIsInstance(self.worker.error, netlist.CycleError)
+
+
+    def test_unexpected_errors_keep_the_worker_alive(self):
+        def broken(inputs):
+            raise RuntimeError("beklenmeyen")
+        self.worker._apply = broken
+        self.worker.load(self.circuit)
+        end = time.time() + 10
+        while self.worker.error is None and time.time() < end:
+            time.sleep(0.005)
+        self.assertIsInstance(self.worker.error, RuntimeError)
+        del self.worker._apply
+        values = self.circuit.values
+        self.worker.load(self.circuit)
+        self.assertTrue(wait_for(lambda: self.worker.error is None and list(values) == self.expected(),
+                                 self.worker, values))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,313 @@
+# Gecikmeli ayrık olay simülasyonu.
+# Her kapı türünün bir yayılım gecikmesi vardır; bekleyen çıkış değişiklikleri bir zaman çarkında
+# (timing wheel) tutulur, çarkın ötesindeki olaylar taşma yığınında bekler. Eylemsiz (inertial)
+# gecikmede, gecikmeden kısa süren darbeler bekleyen olayın iptaliyle yutulur. Sıralama
+# gerekmediği için geri beslemeli (döngülü) devreler, mandallar ve halka osilatörler de çalışır.
+import heapq
+from array import array
+from itertools import chain
+
+from netlist import GATE_KINDS, NetlistError, AND, OR, NAND, NOR, XOR, XNOR, NOT, BUFFER, INPUT, OUTPUT, LAMP, SUBCIRCUIT
+
+# Zaman birimi cinsinden varsayılan gecikmeler. Alt devre çıkışlarının gecikmesi, SUBCIRCUIT için
+# ayrıca bir değer verilmezse tanımın içindeki en uzun yolun gecikmesidir.
+DEFAULT_DELAYS = {
+    AND: 2,
+    OR: 2,
+    NAND: 1,
+    NOR: 1,
+    XOR: 3,
+    XNOR: 3,
+    NOT: 1,
+    BUFFER: 1,
+    INPUT: 0,
+    OUTPUT: 0,
+    LAMP: 0,
+}
+DEFAULT_WHEEL_SIZE = 1024
+# Aynı zaman adımında sıfır gecikmeyle birbirini tetikleyen tur sınırı
+MAX_DELTA_CYCLES = 1000
+NO_EVENT = -1
+
+
+def _and(values, inputs):
+    return bool(inputs) and all(map(values.__getitem__, inputs))
+
+
+def _or(values, inputs):
+    return any(map(values.__getitem__, inputs))
+
+
+def _nand(values, inputs):
+    return bool(inputs) and not all(map(values.__getitem__, inputs))
+
+
+def _nor(values, inputs):
+    return bool(inputs) and not any(map(values.__getitem__, inputs))
+
+
+def _xor(values, inputs):
+    return len(inputs) == 2 and values[inputs[0]] != values[inputs[1]]
+
+
+def _xnor(values, inputs):
+    if not inputs:
+        return False
+    first = values[inputs[0]]
+    return all(values[index] == first for index in inputs)
+
+
+def _not(values, inputs):
+    return bool(inputs) and not values[inputs[0]]
+
+
+def _buffer(values, inputs):
+    return bool(inputs) and bool(values[inputs[0]])
+
+
+def _lookup(definition, output_index):
+    rows = definition.rows
+
+    def evaluate(values, inputs):
+        index = 0
+        for position, input_id in enumerate(inputs):
+            if values[input_id]:
+                index |= 1 << position
+        return bool(rows[index][output_index])
+    return evaluate
+
+
+# Kurallar netlist.GATE_FUNCTIONS ile aynıdır; değerler doğrudan netlist.values üzerinden okunur
+EVALUATORS = {
+    AND: _and,
+    OR: _or,
+    NAND: _nand,
+    NOR: _nor,
+    XOR: _xor,
+    XNOR: _xnor,
+    NOT: _not,
+    BUFFER: _buffer,
+    OUTPUT: _or,
+    LAMP: _or,
+}
+
+
+class TimingSimulator:
+    def __init__(self, netlist, delays=None, wheel_size=DEFAULT_WHEEL_SIZE):
+        if wheel_size & (wheel_size - 1):
+            raise ValueError("Çark boyutu ikinin kuvveti olmalıdır.")
+        self.netlist = netlist
+        self.delays = dict(DEFAULT_DELAYS)
+        if delays:
+            self.delays.update(delays)
+        if any(delay < 0 for delay in self.delays.values()):
+            raise ValueError("Gecikmeler negatif olamaz.")
+        self.now = 0
+        self.events_processed = 0
+        self.wheel_size = wheel_size
+        self.wheel = [[] for _ in range(wheel_size)]
+        self.wheel_count = 0
+        # Çarkın ötesindeki olaylar: (zaman, sıra, düğüm, değer)
+        self.overflow = []
+        # Dışarıdan planlanan giriş değişiklikleri: (zaman, sıra, düğüm, değer)
+        self.stimuli = []
+        self.sequence = 0
+        # Eylemsiz kipte her düğümün en fazla bir bekleyen olayı vardır
+        self.pending_time = array("q")
+        self.pending_value = bytearray()
+        self.dirty_inputs = []
+        self.changed = {}
+        # Değişen ağlar her zaman adımı sonunda (zaman, kimlikler) ile bu fonksiyonlara bildirilir
+        self.observers = []
+        self._version = -1
+        self._notifying = False
+        netlist.add_listener(self.on_netlist_change)
+
+    def detach(self):
+        self.netlist.remove_listener(self.on_netlist_change)
+
+    def _refresh(self):
+        # Bağlantı listeleri topoloji değişene kadar demet (tuple) olarak önbellekte tutulur
+        netlist = self.netlist
+        if self._version == netlist.version:
+            return
+        count = len(netlist)
+        self.fanin = [tuple(netlist.fanin_ids(node_id)) for node_id in range(count)]
+        self.fanout = [tuple(netlist.fanout_ids(node_id)) for node_id in range(count)]
+        kinds = [GATE_KINDS[code] for code in netlist.kind_codes]
+        self.evaluators = [EVALUATORS.get(kind) for kind in kinds]
+        self.node_delays = array("q", (self.delays.get(kind, 0) for kind in kinds))
+        path_delays = {}
+        for node_id, (definition, output_index) in netlist.subcircuits.items():
+            self.evaluators[node_id] = _lookup(definition, output_index)
+            if SUBCIRCUIT not in self.delays:
+                if definition.name not in path_delays:
+                    path_delays[definition.name] = definition.path_delay(self.delays)
+                self.node_delays[node_id] = path_delays[definition.name]
+        if len(self.pending_time) < count:
+            extra = count - len(self.pending_time)
+            self.pending_time.extend(array("q", [NO_EVENT]) * extra)
+            self.pending_value.extend(bytes(extra))
+        self._version = netlist.version
+
+    def on_netlist_change(self, event, payload):
+        if self._notifying:
+            return
+        if event == "values":
+            # Arayüzden değiştirilen girişlerin çıkış konisi bir sonraki adımda değerlendirilir
+            self.dirty_inputs.extend(node.id for node in payload if node.kind == INPUT)
+        elif event == "connected":
+            self.dirty_inputs.append(payload[0].id)
+
+    def initialize(self):
+        # Tüm kapılar şimdiki zamanda değerlendirilir (ör. halka osilatörün başlaması için)
+        self._refresh()
+        for node_id, evaluator in enumerate(self.evaluators):
+            if evaluator is not None:
+                self._evaluate(node_id)
+
+    def set_input(self, node, value, at=None):
+        # Giriş değişikliği verilen zamanda (varsayılan: şimdi) uygulanır; değişiklikler iptal edilmez
+        if node.kind != INPUT:
+            raise NetlistError("Yalnızca giriş kapılarının değeri ayarlanabilir.")
+        at = self.now if at is None else at
+        if at < self.now:
+            raise ValueError("Geçmişe olay planlanamaz.")
+        self.sequence += 1
+        heapq.heappush(self.stimuli, (at, self.sequence, node.id, bool(value)))
+
+    def _schedule(self, node_id, value, time):
+        if time - self.now < self.wheel_size:
+            self.wheel[time & (self.wheel_size - 1)].append(node_id)
+            self.wheel_count += 1
+        else:
+            self.sequence += 1
+            heapq.heappush(self.overflow, (time, self.sequence, node_id, value))
+        self.pending_time[node_id] = time
+        self.pending_value[node_id] = value
+
+    def _evaluate(self, node_id):
+        values = self.netlist.values
+        value = self.evaluators[node_id](values, self.fanin[node_id])
+        if self.pending_time[node_id] != NO_EVENT:
+            # Bekleyen değer her zaman mevcut değerin tersidir. Aynı değer yoldaysa ilk zaman korunur;
+            # değilse giriş gecikmeden önce geri dönmüştür ve darbe iptal edilerek yutulur.
+            if value != self.pending_value[node_id]:
+                self.pending_time[node_id] = NO_EVENT
+        elif value != values[node_id]:
+            self._schedule(node_id, value, self.now + self.node_delays[node_id])
+
+    def _next_time(self, end):
+        # Çark boşsa olaysız zaman adımları atlanır
+        if self.wheel_count or self.dirty_inputs:
+            return self.now
+        candidates = [end]
+        if self.overflow:
+            candidates.append(self.overflow[0][0])
+        if self.stimuli:
+            candidates.append(self.stimuli[0][0])
+        return min(candidates)
+
+    def run(self, duration=1):
+        # [now, now + duration) aralığındaki olayları işler; değeri değişen düğümleri döndürür
+        self._refresh()
+        end = self.now + duration
+        netlist = self.netlist
+        values = netlist.values
+        pending_time = self.pending_time
+        pending_value = self.pending_value
+        fanout = self.fanout
+        fanin = self.fanin
+        evaluators = self.evaluators
+        node_delays = self.node_delays
+        wheel = self.wheel
+        wheel_size = self.wheel_size
+        mask = wheel_size - 1
+        changed = self.changed
+        while True:
+            self.now = self._next_time(end)
+            if self.now >= end:
+                break
+            now = self.now
+            while self.overflow and self.overflow[0][0] - now < self.wheel_size:
+                time, _, node_id, value = heapq.heappop(self.overflow)
+                if pending_time[node_id] == time:
+                    wheel[time & mask].append(node_id)
+                    self.wheel_count += 1
+            changed_ids = []
+            while self.stimuli and self.stimuli[0][0] == now:
+                _, _, node_id, value = heapq.heappop(self.stimuli)
+                if values[node_id] != value:
+                    values[node_id] = value
+                    changed_ids.append(node_id)
+            changed_ids.extend(self.dirty_inputs)
+            self.dirty_inputs = []
+            for delta in range(MAX_DELTA_CYCLES):
+                slot = wheel[now & mask]
+                wheel[now & mask] = []
+                self.wheel_count -= len(slot)
+                for node_id in slot:
+                    if pending_time[node_id] == now:
+                        pending_time[node_id] = NO_EVENT
+                        values[node_id] = pending_value[node_id]
+                        changed_ids.append(node_id)
+                if not changed_ids:
+                    break
+                self.events_processed += len(changed_ids)
+                changed.update(dict.fromkeys(changed_ids))
+                for observer in self.observers:
+                    observer(now, changed_ids)
+                affected = dict.fromkeys(chain.from_iterable(map(fanout.__getitem__, changed_ids)))
+                changed_ids = []
+                # _evaluate ile aynı kural; sıcak döngü olduğu için burada açılmıştır
+                for node_id in affected:
+                    value = evaluators[node_id](values, fanin[node_id])
+                    if pending_time[node_id] != NO_EVENT:
+                        if value != pending_value[node_id]:
+                            pending_time[node_id] = NO_EVENT
+                    elif value != values[node_id]:
+                        time = now + node_delays[node_id]
+                        if time - now < wheel_size:
+                            wheel[time & mask].append(node_id)
+                            self.wheel_count += 1
+                        else:
+                            self.sequence += 1
+                            heapq.heappush(self.overflow, (time, self.sequence, node_id, value))
+                        pending_time[node_id] = time
+                        pending_value[node_id] = value
+            else:
+                raise NetlistError("Sıfır gecikmeli döngü: devre %d anında kararlı hale gelmiyor." % now)
+            self.now = now + 1
+        self.now = end
+        return self.flush()
+
+    def flush(self):
+        # Son bildirimden beri değişen düğümler dinleyicilere tek seferde bildirilir
+        nodes = self.netlist.nodes
+        changed = [nodes[node_id] for node_id in self.changed]
+        self.changed = {}
+        if changed:
+            self._notifying = True
+            try:
+                self.netlist.notify("values", changed)
+            finally:
+                self._notifying = False
+        return changed
+
+    def pending(self):
+        return self.wheel_count + len(self.overflow) + len(self.stimuli) + len(self.dirty_inputs)
+
+    def run_until_stable(self, limit):
+        # Bekleyen olay kalmayana ya da limit kadar zaman geçene kadar çalışır; kararlıysa True
+        end = self.now + limit
+        while self.now < end:
+            self.run(min(self.wheel_size, end - self.now))
+            if not self._has_live_events():
+                return True
+        return not self._has_live_events()
+
+    def _has_live_events(self):
+        # Çarktaki girdiler iptal edilmiş olabilir; yalnızca geçerli bekleyenler sayılır
+        if self.overflow or self.stimuli or self.dirty_inputs:
+            return True
+        return any(time != NO_EVENT for time in self.pending_time)
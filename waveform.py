@@ -0,0 +1,147 @@
+# Dalga biçimi kaydı: seçilen ağların değer değişiklikleri sabit boyutlu bir halka tamponda tutulur
+# ve tampon dolduğunda standart VCD dosyasına (GTKWave ile açılabilir) akıtılır. Dosya verilmezse
+# tampon en eski değişikliklerin üzerine yazar; bellek kullanımı her durumda sınırlıdır.
+import time as clock_time
+from array import array
+
+DEFAULT_CAPACITY = 1 << 16
+DEFAULT_TIMESCALE = "1 ns"
+# VCD kimlik kodları yazdırılabilir ASCII karakterlerinden (! .. ~) oluşur
+FIRST_CODE = 33
+CODE_BASE = 94
+
+
+def identifier_code(index):
+    code = ""
+    while True:
+        code += chr(FIRST_CODE + index % CODE_BASE)
+        index //= CODE_BASE
+        if not index:
+            return code
+
+
+def net_name(netlist, node_id):
+    # VCD adlarında boşluk olamaz; adsız düğümler tür ve kimlikle adlandırılır
+    name = netlist.names.get(node_id) or "%s_%d" % (netlist.kind(node_id), node_id)
+    return "".join("_" if character.isspace() else character for character in name)
+
+
+class WaveformRecorder:
+    def __init__(self, netlist, stream=None, nodes=None, capacity=DEFAULT_CAPACITY, timescale=DEFAULT_TIMESCALE):
+        self.netlist = netlist
+        self.stream = stream
+        self.capacity = capacity
+        self.timescale = timescale
+        # Kaydedilecek düğümler; başlık yazıldıktan sonra eklenen düğümler kaydedilmez
+        node_ids = range(len(netlist)) if nodes is None else sorted(set(node.id for node in nodes))
+        self.codes = {node_id: identifier_code(index) for index, node_id in enumerate(node_ids)}
+        self.selected = bytearray(len(netlist))
+        for node_id in self.codes:
+            self.selected[node_id] = 1
+        # Halka tampon: zaman, düğüm ve değer sütunları; start en eski kaydın yeridir
+        self.times = array("q", [0]) * capacity
+        self.node_ids = array("i", [0]) * capacity
+        self.values = bytearray(capacity)
+        self.start = 0
+        self.count = 0
+        self.dropped = 0
+        self.last_time = 0
+        self.written_time = None
+        self.steps = 0
+        self._listener = None
+        if stream is not None:
+            self.write_header()
+
+    def write_header(self):
+        netlist = self.netlist
+        lines = [
+            "$date %s $end" % clock_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "$version Sayısal Tasarım Simülasyonu $end",
+            "$timescale %s $end" % self.timescale,
+            "$scope module devre $end",
+        ]
+        for node_id, code in self.codes.items():
+            lines.append("$var wire 1 %s %s $end" % (code, net_name(netlist, node_id)))
+        lines += ["$upscope $end", "$enddefinitions $end", "#0", "$dumpvars"]
+        for node_id, code in self.codes.items():
+            lines.append("%d%s" % (netlist.values[node_id], code))
+        lines.append("$end")
+        self.stream.write("\n".join(lines) + "\n")
+        self.written_time = 0
+
+    def record(self, time, node_ids):
+        # Zaman geri gidemez; önceki kayıttan küçük zamanlar son zamana eşitlenir
+        if time < self.last_time:
+            time = self.last_time
+        self.last_time = time
+        selected = self.selected
+        values = self.netlist.values
+        capacity = self.capacity
+        for node_id in node_ids:
+            if node_id >= len(selected) or not selected[node_id]:
+                continue
+            if self.count == capacity:
+                if self.stream is not None:
+                    self.flush()
+                else:
+                    # Dosya yoksa en eski kayıt düşürülür
+                    self.start = (self.start + 1) % capacity
+                    self.count -= 1
+                    self.dropped += 1
+            index = (self.start + self.count) % capacity
+            self.times[index] = time
+            self.node_ids[index] = node_id
+            self.values[index] = values[node_id]
+            self.count += 1
+
+    def changes(self):
+        # Tampondaki (zaman, düğüm, değer) kayıtları eskiden yeniye
+        for offset in range(self.count):
+            index = (self.start + offset) % self.capacity
+            yield self.times[index], self.node_ids[index], bool(self.values[index])
+
+    def flush(self):
+        if self.stream is None:
+            return
+        lines = []
+        for time, node_id, value in self.changes():
+            if time != self.written_time:
+                lines.append("#%d" % time)
+                self.written_time = time
+            lines.append("%d%s" % (value, self.codes[node_id]))
+        if lines:
+            self.stream.write("\n".join(lines) + "\n")
+        self.start = 0
+        self.count = 0
+
+    def observe(self, time, node_ids):
+        # TimingSimulator.observers için: gerçek simülasyon zamanıyla kayıt
+        self.record(time, node_ids)
+
+    def listen(self):
+        # Sıfır gecikmeli simülasyonda her "values" bildirimi bir adımdır; adım sayacı son kaydın
+        # zamanından sürer. Gecikmeli simülasyonda observe kullanılır: "values" bildirimleri çalıştırma
+        # sonunda toplanır, olayların zamanı ve aynı çalıştırmada gidip dönen değişiklikler kaybolur.
+        self.unlisten()
+        self.steps = self.last_time
+
+        def on_netlist_change(event, payload):
+            if event == "values":
+                self.steps += 1
+                self.record(self.steps, [node.id for node in payload])
+
+        self._listener = on_netlist_change
+        self.netlist.add_listener(on_netlist_change)
+
+    def unlisten(self):
+        if self._listener is not None:
+            self.netlist.remove_listener(self._listener)
+            self._listener = None
+
+    def close(self):
+        self.unlisten()
+        self.flush()
+        if self.stream is not None:
+            if self.last_time != self.written_time:
+                self.stream.write("#%d\n" % self.last_time)
+            self.stream.flush()
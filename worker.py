@@ -0,0 +1,129 @@
+# Arka plan simülasyonu: devrenin bir kopyası (anlık görüntüsü) ayrı bir iş parçacığında simüle edilir.
+# Arayüz giriş değişikliklerini ve topoloji değişince yeni görüntüleri istek kuyruğuyla gönderir;
+# işçi yalnızca değeri değişen ağları kare olarak geri yollar. Kare kuyruğu tek elemanlıdır: arayüz
+# önceki kareyi henüz almadıysa yeni değişiklikler onunla birleştirilir, yani çizim yavaşsa ara
+# kareler düşürülür ve kuyruk büyümez. Arayüz kareleri root.after ile kendi iş parçacığında alır.
+import queue
+import threading
+
+from netlist import Netlist
+from simulator import Simulator
+
+LOAD = "load"
+INPUTS = "inputs"
+STOP = "stop"
+
+
+class SimulationWorker:
+    def __init__(self, optimized=False):
+        self.optimized = optimized
+        self.requests = queue.Queue()
+        self.frames = queue.Queue(maxsize=1)
+        # Her yeni görüntünün numarası; eski görüntüden gelen kareler alınırken atılır
+        self.generation = 0
+        self.dropped_frames = 0
+        self.error = None
+        self.netlist = None
+        self.simulator = None
+        self._thread = threading.Thread(target=self._run, name="simulation-worker", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self.requests.put((STOP,))
+        self._thread.join()
+
+    # Arayüz iş parçacığından çağrılanlar
+
+    def load(self, netlist):
+        # Topoloji ve değerlerin kopyası alınır; işçi asıl devreye hiç dokunmaz
+        self.generation += 1
+        self.requests.put((LOAD, self.generation, netlist.to_data(), bytes(netlist.values)))
+
+    def set_inputs(self, values):
+        # values: giriş kimliği -> bool
+        self.requests.put((INPUTS, dict(values)))
+
+    def take_frame(self):
+        # Bekleyen kare varsa {düğüm kimliği: değer} döndürür, yoksa None
+        try:
+            generation, changes = self.frames.get_nowait()
+        except queue.Empty:
+            return None
+        return changes if generation == self.generation else None
+
+    # İşçi iş parçacığı
+
+    def _run(self):
+        generation = 0
+        while True:
+            requests = [self.requests.get()]
+            # Biriken istekler tek seferde işlenir; aradaki giriş değişiklikleri birleşir
+            while True:
+                try:
+                    requests.append(self.requests.get_nowait())
+                except queue.Empty:
+                    break
+            inputs = {}
+            load = None
+            for request in requests:
+                if request[0] == STOP:
+                    return
+                if request[0] == LOAD:
+                    load = request
+                    inputs = {}
+                else:
+                    inputs.update(request[1])
+            try:
+                if load is not None:
+                    generation = load[1]
+                    changes = self._load(load[2], load[3])
+                    changes.update(self._apply(inputs))
+                elif self.netlist is not None:
+                    changes = self._apply(inputs)
+                else:
+                    continue
+            except Exception as error:
+                # Hata (beklenmeyenler de) arayüze iletilir; iş parçacığı ölmez, yeni bir görüntü gelene
+                # kadar bekler. Arayüz error alanını her karede denetler.
+                self.error = error
+                self.netlist = None
+                continue
+            if changes:
+                self._post(generation, changes)
+
+    def _load(self, data, values):
+        self.error = None
+        self.netlist = Netlist.from_data(data)
+        self.netlist.values[:] = values
+        self.simulator = Simulator(self.netlist, optimized=self.optimized)
+        return {node.id: node.value for node in self.simulator.evaluate()}
+
+    def _apply(self, inputs):
+        values = self.netlist.values
+        sources = []
+        for node_id, value in inputs.items():
+            if values[node_id] != value:
+                values[node_id] = value
+                sources.append(self.netlist.nodes[node_id])
+        if not sources:
+            return {}
+        return {node.id: node.value for node in self.simulator.propagate(sources)}
+
+    def _post(self, generation, changes):
+        while True:
+            try:
+                self.frames.put_nowait((generation, changes))
+                return
+            except queue.Full:
+                pass
+            try:
+                older_generation, older = self.frames.get_nowait()
+            except queue.Empty:
+                continue
+            # Alınmamış kare düşürülür; değişiklikleri yenisine eklenir (yeni değerler önceliklidir)
+            self.dropped_frames += 1
+            if older_generation == generation:
+                older.update(changes)
+                changes = older